@@ -16,7 +16,7 @@ def _dispatch_run(args: argparse.Namespace) -> None:
 
 
 def _dispatch_schedule(args: argparse.Namespace) -> None:
-    options = pipeline.PipelineOptions(workspace_id=args.workspace_id, schedule=True)
+    options = pipeline.PipelineOptions(workspace_id=args.workspace_id, schedule=True, outbox=args.outbox)
     pipeline.run_pipeline(options)
 
 
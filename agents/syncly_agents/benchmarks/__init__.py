@@ -0,0 +1 @@
+"""Offline benchmark harnesses for Syncly agent components."""
@@ -0,0 +1,240 @@
+"""Throughput and accuracy benchmark for the status and sentiment classifiers.
+
+Run offline with::
+
+    python -m syncly_agents.benchmarks.classification --messages 2000 --latency-ms 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from ..classification.sentiment import SentimentAnalyzer
+from ..classification.status_classifier import LLMClassifier, StatusClassifier
+from ..settings import Settings
+from .corpus import LabeledUpdate, generate_corpus
+from .stub_llm import StubLLMServer
+
+T = TypeVar("T")
+
+
+@dataclass
+class StageReport:
+    """Performance and quality numbers for one classifier stage."""
+
+    name: str
+    messages: int
+    elapsed_seconds: float
+    accuracy: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    tier_share: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def messages_per_second(self) -> float:
+        return self.messages / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, object]:
+        payload = asdict(self)
+        payload["messages_per_second"] = round(self.messages_per_second, 1)
+        return payload
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; returns 0.0 for an empty sample."""
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered)))) - 1
+    return ordered[rank]
+
+
+def offline_settings() -> Settings:
+    """Settings that satisfy validation without touching any real service."""
+
+    return Settings(
+        OPENROUTER_API_KEY="stub",
+        OPENAI_BASE_URL="http://stub-llm.local/api/v1",
+        OPENAI_MODEL="stub-model",
+        SUPABASE_URL="http://stub-supabase.local",
+        SUPABASE_SERVICE_ROLE_KEY="stub",
+        CONTEXT7_ENDPOINT="http://stub-context7.local",
+        CONTEXT7_API_KEY="stub",
+    )
+
+
+def _timed_map(
+    func: Callable[[str], T],
+    texts: Sequence[str],
+    concurrency: int,
+) -> Tuple[List[T], List[float], float]:
+    def _call(text: str) -> Tuple[T, float]:
+        start = perf_counter()
+        result = func(text)
+        return result, (perf_counter() - start) * 1000
+
+    start = perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pairs = list(pool.map(_call, texts))
+    else:
+        pairs = [_call(text) for text in texts]
+    elapsed = perf_counter() - start
+    return [result for result, _ in pairs], [latency for _, latency in pairs], elapsed
+
+
+def _report(
+    name: str,
+    latencies: Sequence[float],
+    elapsed: float,
+    correct: int,
+    total: int,
+    tiers: Optional[Counter[str]] = None,
+) -> StageReport:
+    tiers = tiers or Counter()
+    return StageReport(
+        name=name,
+        messages=len(latencies),
+        elapsed_seconds=round(elapsed, 4),
+        accuracy=round(correct / total, 4) if total else 0.0,
+        p50_ms=round(percentile(latencies, 50), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        tier_share={tier: round(count / len(latencies), 4) for tier, count in tiers.items()},
+    )
+
+
+def benchmark_heuristics(corpus: Sequence[LabeledUpdate]) -> StageReport:
+    """Keyword tier only; accuracy is measured over the messages it resolves."""
+
+    texts = [item.text for item in corpus]
+    results, latencies, elapsed = _timed_map(StatusClassifier.classify_heuristic, texts, 1)
+    resolved = [(item, result) for item, result in zip(corpus, results) if result is not None]
+    correct = sum(1 for item, result in resolved if result.status == item.status)
+    tiers = Counter({"heuristic": len(resolved), "unresolved": len(corpus) - len(resolved)})
+    return _report("heuristics", latencies, elapsed, correct, len(resolved), tiers)
+
+
+def benchmark_status_classifier(
+    corpus: Sequence[LabeledUpdate],
+    server: StubLLMServer,
+    *,
+    concurrency: int = 1,
+) -> StageReport:
+    settings = offline_settings()
+    classifier = StatusClassifier(settings, llm=LLMClassifier(settings, client=server.openai_client()))
+    texts = [item.text for item in corpus]
+    results, latencies, elapsed = _timed_map(classifier.classify, texts, concurrency)
+    correct = sum(1 for item, result in zip(corpus, results) if result.status == item.status)
+    tiers = Counter(result.tier.value for result in results)
+    return _report("status_classifier", latencies, elapsed, correct, len(corpus), tiers)
+
+
+def benchmark_sentiment(
+    corpus: Sequence[LabeledUpdate],
+    server: StubLLMServer,
+    *,
+    concurrency: int = 1,
+) -> StageReport:
+    analyzer = SentimentAnalyzer(offline_settings(), client=server.openai_client())
+    texts = [item.text for item in corpus]
+    requests_before = server.requests
+    results, latencies, elapsed = _timed_map(analyzer.analyze, texts, concurrency)
+    correct = sum(1 for item, (label, _) in zip(corpus, results) if label == item.sentiment)
+    llm_calls = server.requests - requests_before
+    tiers = Counter({"heuristic": len(corpus) - llm_calls, "llm": llm_calls})
+    return _report("sentiment", latencies, elapsed, correct, len(corpus), tiers)
+
+
+def run_benchmarks(
+    *,
+    messages: int = 1000,
+    implicit_ratio: float = 0.3,
+    latency_ms: float = 25.0,
+    jitter_ms: float = 10.0,
+    error_rate: float = 0.05,
+    concurrency: int = 8,
+    seed: int = 7,
+) -> List[StageReport]:
+    """Run every classifier stage against one synthetic corpus and stub LLM."""
+
+    corpus = generate_corpus(messages, implicit_ratio=implicit_ratio, seed=seed)
+    server = StubLLMServer(
+        {item.text: item.status for item in corpus},
+        {item.text: item.sentiment for item in corpus},
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        error_rate=error_rate,
+        seed=seed,
+    )
+    return [
+        benchmark_heuristics(corpus),
+        benchmark_status_classifier(corpus, server, concurrency=concurrency),
+        benchmark_sentiment(corpus, server, concurrency=concurrency),
+    ]
+
+
+def _format_table(reports: Sequence[StageReport]) -> str:
+    header = f"{'stage':<18}{'msg/s':>10}{'acc':>8}{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}  tiers"
+    lines = [header, "-" * len(header)]
+    for report in reports:
+        tiers = ", ".join(f"{tier}={share:.0%}" for tier, share in sorted(report.tier_share.items()))
+        lines.append(
+            f"{report.name:<18}{report.messages_per_second:>10.1f}{report.accuracy:>8.2%}"
+            f"{report.p50_ms:>9.2f}{report.p95_ms:>9.2f}{report.p99_ms:>9.2f}  {tiers}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark Syncly classifiers offline.")
+    parser.add_argument("--messages", type=int, default=1000, help="Corpus size")
+    parser.add_argument("--implicit-ratio", type=float, default=0.3, help="Share of keyword-free updates")
+    parser.add_argument("--latency-ms", type=float, default=25.0, help="Stub LLM base latency")
+    parser.add_argument("--jitter-ms", type=float, default=10.0, help="Uniform extra stub latency")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Share of wrong stub answers")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent classifier calls")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    reports = run_benchmarks(
+        messages=args.messages,
+        implicit_ratio=args.implicit_ratio,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        concurrency=args.concurrency,
+        seed=args.seed,
+    )
+    if args.json:
+        print(json.dumps([report.as_dict() for report in reports], indent=2))
+    else:
+        print(_format_table(reports))
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI helper
+    main()
+
+
+__all__ = [
+    "StageReport",
+    "benchmark_heuristics",
+    "benchmark_sentiment",
+    "benchmark_status_classifier",
+    "offline_settings",
+    "percentile",
+    "run_benchmarks",
+]
@@ -0,0 +1,470 @@
+"""Load simulator for the generate → render → deliver digest pipeline.
+
+Synthesises workspaces with a day of activity events and notification
+preferences, then drives the real digest builder, renderer and delivery engine
+against local stand-ins: Slack through an ``httpx.MockTransport`` and SMTP
+through an aiosmtpd sink (the ``loadtest`` extra) or an
+in-memory session. Run offline with::
+
+    python -m syncly_agents.benchmarks.digest_load --workspaces 1000 --slack-latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import socket
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, UTC
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+
+from ..notification.delivery import DigestDeliveryEngine
+from ..notification.email_notifier import EmailNotifier
+from ..notification.rendering import DigestRenderer, RenderFormat
+from ..notification.slack_notifier import SlackNotifier
+from ..notification.smtp_pool import SMTPConfig, SMTPConnectionPool
+from ..persistence.models import (
+    ActivityEvent,
+    DeliveryStatus,
+    DigestReport,
+    NotificationChannel,
+    NotificationPreference,
+    SentimentLabel,
+    StatusLabel,
+)
+from ..summarization.daily_digest import build_daily_digest
+from .classification import offline_settings, percentile
+
+_LOGGER = logging.getLogger(__name__)
+
+SMTP_MODES = ("auto", "aiosmtpd", "memory")
+RENDER_FORMATS = (RenderFormat.SLACK_BLOCKS, RenderFormat.TEXT, RenderFormat.HTML)
+_FIRE_AT = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+_AUTHORS = ("Ada", "Lin", "Grace", "Tomas", "Priya", "Kenji", "Amara", "Noor")
+_VERBS = {
+    StatusLabel.DONE: ("shipped", "merged", "closed out", "finished"),
+    StatusLabel.DOING: ("working on", "reviewing", "refactoring", "testing"),
+    StatusLabel.BLOCKED: ("waiting on", "blocked by", "stuck on", "need access for"),
+}
+_OBJECTS = ("the billing API", "login flow", "search index", "release notes", "CI pipeline", "mobile build")
+
+
+@dataclass
+class SyntheticWorkspace:
+    workspace_id: str
+    time_zone: str
+    events: List[ActivityEvent]
+    preferences: List[NotificationPreference]
+
+
+@dataclass
+class LoadStageReport:
+    """Throughput, latency and memory for one pipeline stage."""
+
+    name: str
+    items: int
+    elapsed_seconds: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_memory_kib: float
+    errors: int = 0
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def as_dict(self) -> Dict[str, object]:
+        payload = asdict(self)
+        payload["items_per_second"] = round(self.items_per_second, 1)
+        return payload
+
+
+def generate_workspaces(
+    count: int,
+    *,
+    events_per_workspace: int = 40,
+    slack_targets: int = 2,
+    email_targets: int = 1,
+    seed: int = 7,
+) -> List[SyntheticWorkspace]:
+    """Workspaces with a day of classified events and their digest preferences."""
+
+    rng = random.Random(seed)
+    workspaces: List[SyntheticWorkspace] = []
+    for index in range(count):
+        workspace_id = f"ws-{index:05d}"
+        events = [_synthetic_event(rng, workspace_id, number) for number in range(events_per_workspace)]
+        targets = [(NotificationChannel.SLACK, f"#team-{index}-{n}") for n in range(slack_targets)]
+        targets += [(NotificationChannel.EMAIL, f"lead{n}@ws{index}.example.com") for n in range(email_targets)]
+        preferences = [
+            NotificationPreference(
+                id=f"{workspace_id}-pref-{n}",
+                workspace_id=workspace_id,
+                channel=channel,
+                target=target,
+                schedule_time="09:00",
+                timezone="UTC",
+                created_at=_FIRE_AT,
+                updated_at=_FIRE_AT,
+            )
+            for n, (channel, target) in enumerate(targets)
+        ]
+        workspaces.append(SyntheticWorkspace(workspace_id, "UTC", events, preferences))
+    return workspaces
+
+
+def _synthetic_event(rng: random.Random, workspace_id: str, number: int) -> ActivityEvent:
+    status = rng.choices(list(_VERBS), weights=(4, 5, 1))[0]
+    author = rng.choice(_AUTHORS)
+    task = f"ENG-{rng.randint(1, 25)}"
+    return ActivityEvent(
+        id=f"{workspace_id}-evt-{number}",
+        workspace_id=workspace_id,
+        integration_connection_id=f"{workspace_id}-slack",
+        external_id=str(number),
+        author=author,
+        content=f"{rng.choice(_VERBS[status])} {rng.choice(_OBJECTS)} for {task}",
+        task_reference=task,
+        timestamp=_FIRE_AT - timedelta(minutes=rng.randint(1, 23 * 60)),
+        status_label=status,
+        classification_confidence=round(rng.uniform(0.6, 1.0), 2),
+        sentiment=rng.choices(list(SentimentLabel), weights=(4, 5, 2))[0],
+        sentiment_confidence=round(rng.uniform(0.5, 1.0), 2),
+        ingested_at=_FIRE_AT,
+    )
+
+
+class _MemoryTracker:
+    """Peak traced allocation per stage, relative to the stage's starting point."""
+
+    def __init__(self, enabled: bool) -> None:
+        self._enabled = enabled
+        self._started = False
+        self._baseline = 0
+
+    def __enter__(self) -> "_MemoryTracker":
+        if self._enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        if self._started:
+            tracemalloc.stop()
+
+    def begin(self) -> None:
+        if self._enabled:
+            tracemalloc.reset_peak()
+            self._baseline = tracemalloc.get_traced_memory()[0]
+
+    def peak_kib(self) -> float:
+        if not self._enabled:
+            return 0.0
+        return round(max(0, tracemalloc.get_traced_memory()[1] - self._baseline) / 1024, 1)
+
+
+def _stage(
+    name: str,
+    latencies: Sequence[float],
+    elapsed: float,
+    memory: _MemoryTracker,
+    errors: int = 0,
+) -> LoadStageReport:
+    return LoadStageReport(
+        name=name,
+        items=len(latencies),
+        elapsed_seconds=round(elapsed, 4),
+        p50_ms=round(percentile(latencies, 50), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        peak_memory_kib=memory.peak_kib(),
+        errors=errors,
+    )
+
+
+class _TimedNotifier:
+    """Record the wall time of every ``send_digest`` call made by the engine."""
+
+    def __init__(self, notifier: Any, latencies: List[float]) -> None:
+        self._notifier = notifier
+        self._latencies = latencies
+
+    def send_digest(self, *args: Any, **kwargs: Any) -> Tuple[bool, str]:
+        start = perf_counter()
+        try:
+            return self._notifier.send_digest(*args, **kwargs)
+        finally:
+            self._latencies.append((perf_counter() - start) * 1000)
+
+
+def slack_stand_in(latency_ms: float = 0.0) -> httpx.Client:
+    """``httpx`` client whose transport answers ``chat.postMessage`` locally."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if latency_ms:
+            time.sleep(latency_ms / 1000)
+        return httpx.Response(200, json={"ok": True, "channel": "C0LOAD", "ts": "1.0"})
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class _MemorySMTP:
+    """In-process SMTP session used when no aiosmtpd sink is available."""
+
+    latency_ms = 0.0
+
+    def __init__(self, host: str, port: int, timeout: Optional[float] = None) -> None:
+        self.address = (host, port)
+
+    def starttls(self, context: Any = None) -> None:
+        pass
+
+    def login(self, username: str, password: str) -> None:
+        pass
+
+    def send_message(self, message: Any) -> None:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+    def quit(self) -> None:
+        pass
+
+    close = quit
+
+
+def _aiosmtpd_controller() -> Any:
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError as exc:  # pragma: no cover - depends on optional extra
+        raise RuntimeError("The aiosmtpd SMTP sink requires the optional `loadtest` dependencies") from exc
+    return Controller
+
+
+class _SinkHandler:
+    def __init__(self, latency_ms: float) -> None:
+        self._latency = latency_ms / 1000
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        return "250 Message accepted for delivery"
+
+
+@contextmanager
+def smtp_stand_in(
+    mode: str = "auto",
+    latency_ms: float = 0.0,
+) -> Iterator[Tuple[SMTPConfig, Callable[..., Any]]]:
+    """Yield the SMTP config and session factory for the chosen local sink."""
+
+    if mode not in SMTP_MODES:
+        raise ValueError(f"smtp mode must be one of {', '.join(SMTP_MODES)}")
+    if mode == "auto":
+        try:
+            _aiosmtpd_controller()
+            mode = "aiosmtpd"
+        except RuntimeError:
+            mode = "memory"
+    if mode == "memory":
+        factory = type("_TimedMemorySMTP", (_MemorySMTP,), {"latency_ms": latency_ms})
+        yield SMTPConfig(host="smtp.load.local", port=25, starttls=False), factory
+        return
+
+    import smtplib
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    controller = _aiosmtpd_controller()(_SinkHandler(latency_ms), hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        yield SMTPConfig(host="127.0.0.1", port=port, starttls=False), smtplib.SMTP
+    finally:
+        controller.stop()
+
+
+def run_load(
+    *,
+    workspaces: int = 1000,
+    events_per_workspace: int = 40,
+    slack_targets: int = 2,
+    email_targets: int = 1,
+    slack_latency_ms: float = 20.0,
+    smtp_latency_ms: float = 30.0,
+    max_workers: int = 32,
+    smtp: str = "auto",
+    trace_memory: bool = True,
+    seed: int = 7,
+) -> List[LoadStageReport]:
+    """Run every stage for the synthetic fleet as if all digests fired at once.
+
+    The deliver stage gets its own renderer, so it pays for the first render of
+    every digest as a cold delivery would instead of reusing the render stage's
+    cache.
+    """
+
+    fleet = generate_workspaces(
+        workspaces,
+        events_per_workspace=events_per_workspace,
+        slack_targets=slack_targets,
+        email_targets=email_targets,
+        seed=seed,
+    )
+    cache_entries = max(1024, workspaces * len(RENDER_FORMATS))
+    renderer = DigestRenderer(max_entries=cache_entries)
+    reports: List[LoadStageReport] = []
+    pipeline_start = perf_counter()
+    with _MemoryTracker(trace_memory) as memory:
+        memory.begin()
+        digests: List[DigestReport] = []
+        latencies: List[float] = []
+        start = perf_counter()
+        for workspace in fleet:
+            began = perf_counter()
+            digests.append(
+                build_daily_digest(
+                    workspace.workspace_id,
+                    workspace.events,
+                    report_date=_FIRE_AT,
+                    time_zone=workspace.time_zone,
+                    generated_at=_FIRE_AT,
+                )
+            )
+            latencies.append((perf_counter() - began) * 1000)
+        reports.append(_stage("generate", latencies, perf_counter() - start, memory))
+
+        memory.begin()
+        latencies = []
+        start = perf_counter()
+        for digest in digests:
+            began = perf_counter()
+            for fmt in RENDER_FORMATS:
+                renderer.render(digest, fmt)
+            latencies.append((perf_counter() - began) * 1000)
+        reports.append(_stage("render", latencies, perf_counter() - start, memory))
+
+        with smtp_stand_in(smtp, smtp_latency_ms) as (smtp_config, smtp_factory):
+            settings = offline_settings().model_copy(
+                update={
+                    "slack_bot_token": "xoxb-load",
+                    "email_smtp_url": f"smtp://load:load@{smtp_config.host}:{smtp_config.port}",
+                    "email_from": "digest@syncly.local",
+                }
+            )
+            pool = SMTPConnectionPool(
+                smtp_config, max_connections=max(1, max_workers // 4), smtp_factory=smtp_factory
+            )
+            try:
+                latencies = []
+                delivery_renderer = DigestRenderer(max_entries=cache_entries)
+                slack = SlackNotifier(
+                    settings, client=slack_stand_in(slack_latency_ms), renderer=delivery_renderer
+                )
+                email = EmailNotifier(settings, pool=pool, renderer=delivery_renderer)
+                memory.begin()
+                start = perf_counter()
+                with DigestDeliveryEngine(
+                    slack=_TimedNotifier(slack, latencies),
+                    email=_TimedNotifier(email, latencies),
+                    max_workers=max_workers,
+                    logger=_LOGGER,
+                ) as engine:
+                    delivered = engine.deliver_many(
+                        digests, {workspace.workspace_id: workspace.preferences for workspace in fleet}
+                    )
+                elapsed = perf_counter() - start
+            finally:
+                pool.close()
+        failed = sum(
+            1 for report in delivered for log in report.delivery_logs if log.status != DeliveryStatus.SENT
+        )
+        reports.append(_stage("deliver", latencies, elapsed, memory, errors=failed))
+
+    total = perf_counter() - pipeline_start
+    reports.append(
+        LoadStageReport(
+            name="pipeline",
+            items=len(digests),
+            elapsed_seconds=round(total, 4),
+            p50_ms=0.0,
+            p95_ms=0.0,
+            p99_ms=0.0,
+            peak_memory_kib=max(report.peak_memory_kib for report in reports),
+            errors=failed,
+        )
+    )
+    return reports
+
+
+def _format_table(reports: Sequence[LoadStageReport]) -> str:
+    header = (
+        f"{'stage':<10}{'items':>8}{'items/s':>11}{'p50ms':>9}{'p95ms':>9}{'p99ms':>9}"
+        f"{'peakKiB':>11}{'errors':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for report in reports:
+        lines.append(
+            f"{report.name:<10}{report.items:>8}{report.items_per_second:>11.1f}{report.p50_ms:>9.2f}"
+            f"{report.p95_ms:>9.2f}{report.p99_ms:>9.2f}{report.peak_memory_kib:>11.1f}{report.errors:>8}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Simulate a 9:00 AM digest burst offline.")
+    parser.add_argument("--workspaces", type=int, default=1000)
+    parser.add_argument("--events", type=int, default=40, help="Activity events per workspace")
+    parser.add_argument("--slack-targets", type=int, default=2, help="Slack channels per workspace")
+    parser.add_argument("--email-targets", type=int, default=1, help="Email recipients per workspace")
+    parser.add_argument("--slack-latency-ms", type=float, default=20.0, help="Simulated Slack API latency")
+    parser.add_argument("--smtp-latency-ms", type=float, default=30.0, help="Simulated SMTP DATA latency")
+    parser.add_argument("--max-workers", type=int, default=32, help="Delivery engine thread pool size")
+    parser.add_argument("--smtp", choices=SMTP_MODES, default="auto", help="SMTP stand-in to deliver to")
+    parser.add_argument("--no-trace-memory", action="store_true", help="Skip tracemalloc (faster, no peaks)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    reports = run_load(
+        workspaces=args.workspaces,
+        events_per_workspace=args.events,
+        slack_targets=args.slack_targets,
+        email_targets=args.email_targets,
+        slack_latency_ms=args.slack_latency_ms,
+        smtp_latency_ms=args.smtp_latency_ms,
+        max_workers=args.max_workers,
+        smtp=args.smtp,
+        trace_memory=not args.no_trace_memory,
+        seed=args.seed,
+    )
+    if args.json:
+        print(json.dumps([report.as_dict() for report in reports], indent=2))
+    else:
+        print(_format_table(reports))
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI helper
+    main()
+
+
+__all__ = [
+    "LoadStageReport",
+    "SyntheticWorkspace",
+    "generate_workspaces",
+    "run_load",
+    "slack_stand_in",
+    "smtp_stand_in",
+]
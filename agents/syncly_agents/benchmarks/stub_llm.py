@@ -0,0 +1,114 @@
+"""In-process stand-in for the OpenRouter Responses API with injectable latency."""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from ..persistence.models import SentimentLabel, StatusLabel
+
+_STUB_BASE_URL = "http://stub-llm.local/api/v1"
+
+
+class StubLLMServer:
+    """Answer Responses API calls from a label oracle after a simulated delay.
+
+    The server is an ``httpx.MockTransport``, so the real OpenAI SDK request and
+    response handling is exercised without any network access.
+    """
+
+    def __init__(
+        self,
+        status_oracle: Mapping[str, StatusLabel],
+        sentiment_oracle: Optional[Mapping[str, SentimentLabel]] = None,
+        *,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 11,
+    ) -> None:
+        self._status_oracle = dict(status_oracle)
+        self._sentiment_oracle = dict(sentiment_oracle or {})
+        self._latency_ms = latency_ms
+        self._jitter_ms = jitter_ms
+        self._error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    @property
+    def base_url(self) -> str:
+        return _STUB_BASE_URL
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle)
+
+    def openai_client(self, *, max_connections: int = 64) -> Any:
+        """Return an ``OpenAI`` client wired to this stub."""
+
+        from openai import OpenAI
+
+        http_client = httpx.Client(
+            transport=self.transport(),
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+        return OpenAI(api_key="stub", base_url=self.base_url, http_client=http_client, max_retries=0)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        user_text = next(
+            (item["content"] for item in body.get("input", []) if item.get("role") == "user"),
+            "",
+        )
+        with self._lock:
+            self.requests += 1
+            delay_ms = self._latency_ms + self._rng.uniform(0, self._jitter_ms)
+            wrong = self._rng.random() < self._error_rate
+
+        time.sleep(delay_ms / 1000)
+        text_format = body.get("text", {}).get("format", {})
+        if text_format.get("type") == "json_schema":
+            text = json.dumps(self._status_answer(user_text, wrong))
+        else:
+            text = self._sentiment_answer(user_text, wrong).value
+        return httpx.Response(200, json=_response_payload(body.get("model", "stub"), text))
+
+    def _status_answer(self, text: str, wrong: bool) -> Dict[str, Any]:
+        status = self._status_oracle.get(text, StatusLabel.DOING)
+        if wrong:
+            status = self._rng.choice([label for label in StatusLabel if label != status])
+        return {"status": status.value, "confidence": 0.55 if wrong else 0.9}
+
+    def _sentiment_answer(self, text: str, wrong: bool) -> SentimentLabel:
+        sentiment = self._sentiment_oracle.get(text, SentimentLabel.NEUTRAL)
+        if wrong:
+            sentiment = self._rng.choice([label for label in SentimentLabel if label != sentiment])
+        return sentiment
+
+
+def _response_payload(model: str, text: str) -> Dict[str, Any]:
+    return {
+        "id": "resp_stub",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": model,
+        "status": "completed",
+        "output": [
+            {
+                "type": "message",
+                "id": "msg_stub",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "usage": {"input_tokens": len(text.split()), "output_tokens": 8, "total_tokens": 8},
+    }
+
+
+__all__ = ["StubLLMServer"]
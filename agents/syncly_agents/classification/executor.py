@@ -0,0 +1,79 @@
+"""Bounded thread-pool stage that classifies activity events concurrently."""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Iterable, Iterator, Optional
+
+from ..persistence.models import ActivityEvent
+from .sentiment import SentimentAnalyzer
+from .status_classifier import StatusClassifier
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+
+class ClassificationExecutor:
+    """Classify a stream of draft events while keeping N LLM calls in flight.
+
+    Results are yielded in input order. The upstream iterator is only advanced when
+    a slot frees up, so a slow LLM naturally throttles the ingestor feeding it.
+    """
+
+    def __init__(
+        self,
+        classifier: StatusClassifier,
+        sentiment: Optional[SentimentAnalyzer] = None,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._classifier = classifier
+        self._sentiment = sentiment
+        self._max_in_flight = max_in_flight
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="syncly-classify"
+        )
+
+    def __enter__(self) -> "ClassificationExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads once pending classifications finish."""
+
+        self._pool.shutdown(wait=True)
+
+    def classify_stream(self, drafts: Iterable[ActivityEvent]) -> Iterator[ActivityEvent]:
+        """Yield each draft with its status (and sentiment) labels filled in."""
+
+        pending: Deque[Future[ActivityEvent]] = deque()
+        upstream = iter(drafts)
+        try:
+            for draft in upstream:
+                pending.append(self._pool.submit(self._classify, draft))
+                if len(pending) >= self._max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _classify(self, draft: ActivityEvent) -> ActivityEvent:
+        result = self._classifier.classify(draft.content)
+        update = {
+            "status_label": result.status,
+            "classification_confidence": result.confidence,
+        }
+        if self._sentiment is not None:
+            label, confidence = self._sentiment.analyze(draft.content)
+            update["sentiment"] = label
+            update["sentiment_confidence"] = confidence
+        return draft.model_copy(update=update)
+
+
+__all__ = ["ClassificationExecutor", "DEFAULT_MAX_IN_FLIGHT"]
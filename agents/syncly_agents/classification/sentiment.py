@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Tuple
-
-from openai import OpenAI
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from ..persistence.models import SentimentLabel
 from ..settings import Settings, get_settings
+from ..shared.client_registry import get_client_registry
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from openai import OpenAI
 
 _POSITIVE_HINTS = ("great", "awesome", "excited", "delighted", "fixed", "shipped")
 _NEGATIVE_HINTS = ("blocked", "issue", "bug", "frustrated", "stuck", "angry")
@@ -16,12 +18,20 @@ _NEGATIVE_HINTS = ("blocked", "issue", "bug", "frustrated", "stuck", "angry")
 class SentimentAnalyzer:
     """Return coarse sentiment scores for activity updates."""
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(self, settings: Settings | None = None, client: Optional["OpenAI"] = None) -> None:
         self._settings = settings or get_settings()
-        self._client = OpenAI(
-            base_url=self._settings.openai_base_url,
-            api_key=self._settings.openrouter_api_key,
-        )
+        self._client = client
+
+    @property
+    def client(self) -> "OpenAI":
+        """Shared OpenAI client, resolved only when the heuristics are inconclusive."""
+
+        if self._client is None:
+            self._client = get_client_registry().openai_client(
+                base_url=str(self._settings.openai_base_url),
+                api_key=self._settings.openrouter_api_key,
+            )
+        return self._client
 
     def analyze(self, update: str) -> Tuple[SentimentLabel, float]:
         text = update.lower()
@@ -31,7 +41,7 @@ class SentimentAnalyzer:
             return SentimentLabel.POSITIVE, 0.6
 
         try:  # pragma: no cover - external dependency
-            response = self._client.responses.create(
+            response = self.client.responses.create(
                 model=self._settings.openai_model,
                 input=[
                     {
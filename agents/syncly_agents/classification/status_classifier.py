@@ -2,95 +2,159 @@
 
 from __future__ import annotations
 
+import json
 import re
 from dataclasses import dataclass
-from typing import Optional, Tuple
-
-from openai import OpenAI
+from enum import Enum
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from ..persistence.models import SentimentLabel, StatusLabel
 from ..settings import Settings, get_settings
+from ..shared.client_registry import get_client_registry
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from openai import OpenAI
 
 _DONE_PATTERN = re.compile(r"\b(done|completed|resolved|finished|shipped)\b", re.I)
 _BLOCKED_PATTERN = re.compile(r"\b(blocked|stuck|waiting|cannot|issue)\b", re.I)
 _PROGRESS_PATTERN = re.compile(r"\b(working on|in progress|reviewing|building)\b", re.I)
 
+LLM_MAX_OUTPUT_TOKENS = 32
+_LLM_SYSTEM_PROMPT = (
+    "You label project task updates as done, doing, or blocked. "
+    "Reply with the label and your confidence between 0 and 1 only."
+)
+_LLM_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "name": "task_status",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string", "enum": [label.value for label in StatusLabel]},
+            "confidence": {"type": "number"},
+        },
+        "required": ["status", "confidence"],
+        "additionalProperties": False,
+    },
+}
+
+
+class ClassificationTier(str, Enum):
+    """Which stage of the classifier produced a result."""
+
+    EMPTY = "empty"
+    HEURISTIC = "heuristic"
+    THREAD = "thread"
+    LLM = "llm"
+    FALLBACK = "fallback"
+
 
 @dataclass
 class ClassificationResult:
     status: StatusLabel
     confidence: float
     rationale: Optional[str] = None
+    tier: ClassificationTier = ClassificationTier.HEURISTIC
 
 
 class LLMClassifier:
     """Light wrapper over OpenAI Agents SDK via OpenRouter."""
 
-    def __init__(self, settings: Settings) -> None:
-        headers = {}
-        if settings.openai_http_referer:
-            headers["HTTP-Referer"] = settings.openai_http_referer
-        if settings.openai_title:
-            headers["X-Title"] = settings.openai_title
+    def __init__(self, settings: Settings, client: Optional["OpenAI"] = None) -> None:
         self._settings = settings
-        self._client = OpenAI(
-            base_url=settings.openai_base_url,
-            api_key=settings.openrouter_api_key,
-            default_headers=headers or None,
-        )
+        self._client = client
+
+    @property
+    def client(self) -> "OpenAI":
+        """Shared OpenAI client, resolved on the first LLM call."""
+
+        if self._client is None:
+            headers = {}
+            if self._settings.openai_http_referer:
+                headers["HTTP-Referer"] = self._settings.openai_http_referer
+            if self._settings.openai_title:
+                headers["X-Title"] = self._settings.openai_title
+            self._client = get_client_registry().openai_client(
+                base_url=str(self._settings.openai_base_url),
+                api_key=self._settings.openrouter_api_key,
+                default_headers=headers,
+            )
+        return self._client
 
     def classify(self, message: str) -> Optional[ClassificationResult]:
-        prompt = (
-            "Classify the task update as done, doing, or blocked. "
-            "Return JSON like {\"status\": \"done\", \"rationale\": \"...\"}. "
-            "Update: "
-        )
         try:
-            response = self._client.responses.create(
+            response = self.client.responses.create(
                 model=self._settings.openai_model,
                 input=[
-                    {
-                        "role": "system",
-                        "content": "You are a project bot that labels task updates.",
-                    },
-                    {
-                        "role": "user",
-                        "content": f"{prompt}{message}",
-                    },
+                    {"role": "system", "content": _LLM_SYSTEM_PROMPT},
+                    {"role": "user", "content": message},
                 ],
+                text={"format": _LLM_RESPONSE_FORMAT},
+                max_output_tokens=LLM_MAX_OUTPUT_TOKENS,
+                temperature=0,
             )
         except Exception:  # pragma: no cover - external dependency
             return None
 
-        output = getattr(response, "output", None)
-        if not output:  # pragma: no cover - fallback path
-            return None
         try:
             text = response.output_text  # type: ignore[attr-defined]
         except AttributeError:  # pragma: no cover - API variations
-            text = str(output)
-        status = StatusLabel.DOING
-        rationale = text
-        confidence = 0.5
-        text_lower = text.lower()
-        if "blocked" in text_lower:
-            status = StatusLabel.BLOCKED
-        elif "done" in text_lower or "completed" in text_lower:
-            status = StatusLabel.DONE
-        return ClassificationResult(status=status, confidence=confidence, rationale=rationale)
+            return None
+        return _parse_llm_label(text)
+
+
+def _parse_llm_label(text: str | None) -> Optional[ClassificationResult]:
+    """Map a schema-constrained ``{"status", "confidence"}`` reply to a result."""
+
+    if not text:
+        return None
+    try:
+        payload = json.loads(text)
+        status = StatusLabel(payload["status"])
+        confidence = float(payload["confidence"])
+    except (ValueError, KeyError, TypeError):
+        return None
+    return ClassificationResult(
+        status=status,
+        confidence=min(max(confidence, 0.0), 1.0),
+        tier=ClassificationTier.LLM,
+    )
 
 
 class StatusClassifier:
     """Determine task status with heuristics and LLM fallback."""
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        llm: Optional[LLMClassifier] = None,
+    ) -> None:
         self._settings = settings or get_settings()
-        self._llm = LLMClassifier(self._settings)
+        self._llm = llm or LLMClassifier(self._settings)
 
     def classify(self, update: str) -> ClassificationResult:
         text = update.strip()
         if not text:
-            return ClassificationResult(status=StatusLabel.DOING, confidence=0.0)
+            return ClassificationResult(
+                status=StatusLabel.DOING, confidence=0.0, tier=ClassificationTier.EMPTY
+            )
+
+        heuristic = self.classify_heuristic(text)
+        if heuristic:
+            return heuristic
+
+        llm_result = self._llm.classify(text)
+        if llm_result:
+            return llm_result
+
+        return ClassificationResult(
+            status=StatusLabel.DOING, confidence=0.4, tier=ClassificationTier.FALLBACK
+        )
+
+    @staticmethod
+    def classify_heuristic(text: str) -> Optional[ClassificationResult]:
+        """Return a keyword-based label, or ``None`` when the update is ambiguous."""
 
         if _BLOCKED_PATTERN.search(text):
             return ClassificationResult(status=StatusLabel.BLOCKED, confidence=0.7)
@@ -98,12 +162,7 @@ class StatusClassifier:
             return ClassificationResult(status=StatusLabel.DONE, confidence=0.7)
         if _PROGRESS_PATTERN.search(text):
             return ClassificationResult(status=StatusLabel.DOING, confidence=0.6)
-
-        llm_result = self._llm.classify(text)
-        if llm_result:
-            return llm_result
-
-        return ClassificationResult(status=StatusLabel.DOING, confidence=0.4)
+        return None
 
     @staticmethod
     def infer_sentiment(update: str) -> Tuple[SentimentLabel, float]:
@@ -115,4 +174,4 @@ class StatusClassifier:
         return SentimentLabel.NEUTRAL, 0.5
 
 
-__all__ = ["StatusClassifier", "ClassificationResult"]
+__all__ = ["ClassificationResult", "ClassificationTier", "LLMClassifier", "StatusClassifier"]
@@ -0,0 +1,129 @@
+"""Thread-aware status classification over windows of related activity events."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import replace
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..persistence.models import ActivityEvent
+from .status_classifier import ClassificationResult, ClassificationTier, StatusClassifier
+
+DEFAULT_WINDOW = timedelta(hours=24)
+DEFAULT_CARRY_DECAY = 0.9
+DEFAULT_MAX_TRANSCRIPT_CHARS = 4000
+
+ThreadKey = Callable[[ActivityEvent], Optional[str]]
+
+
+def task_reference_key(event: ActivityEvent) -> Optional[str]:
+    """Group events by workspace and task reference."""
+
+    if not event.task_reference:
+        return None
+    return f"{event.workspace_id}:{event.task_reference}"
+
+
+class ThreadContextClassifier:
+    """Classify related events together instead of one string at a time.
+
+    Within a thread, a keyword-labelled message becomes the anchor and ambiguous
+    replies inside ``window`` inherit its label. Replies with no anchor in range are
+    classified with a single call over the thread transcript, so a thread costs at
+    most one LLM call per window rather than one per message.
+    """
+
+    def __init__(
+        self,
+        classifier: StatusClassifier,
+        *,
+        window: timedelta = DEFAULT_WINDOW,
+        thread_key: ThreadKey = task_reference_key,
+        carry_decay: float = DEFAULT_CARRY_DECAY,
+        max_transcript_chars: int = DEFAULT_MAX_TRANSCRIPT_CHARS,
+    ) -> None:
+        self._classifier = classifier
+        self._window = window
+        self._thread_key = thread_key
+        self._carry_decay = carry_decay
+        self._max_transcript_chars = max_transcript_chars
+
+    def classify_events(self, events: Sequence[ActivityEvent]) -> List[ActivityEvent]:
+        """Return ``events`` in input order with status labels filled in."""
+
+        results: Dict[int, ClassificationResult] = {}
+        threads: Dict[str, List[int]] = defaultdict(list)
+        for index, event in enumerate(events):
+            key = self._thread_key(event)
+            if key is None:
+                results[index] = self._classifier.classify(event.content)
+            else:
+                threads[key].append(index)
+
+        for indices in threads.values():
+            indices.sort(key=lambda index: events[index].timestamp)
+            results.update(self._classify_thread(events, indices))
+
+        return [
+            event.model_copy(
+                update={
+                    "status_label": results[index].status,
+                    "classification_confidence": results[index].confidence,
+                }
+            )
+            for index, event in enumerate(events)
+        ]
+
+    def _classify_thread(
+        self,
+        events: Sequence[ActivityEvent],
+        indices: Sequence[int],
+    ) -> Dict[int, ClassificationResult]:
+        results: Dict[int, ClassificationResult] = {}
+        anchor: Optional[Tuple[ActivityEvent, ClassificationResult]] = None
+        pending: List[int] = []
+
+        for index in indices:
+            event = events[index]
+            if pending and event.timestamp - events[pending[0]].timestamp > self._window:
+                results.update(self._classify_transcript(events, pending, indices))
+                pending = []
+
+            heuristic = self._classifier.classify_heuristic(event.content.strip())
+            if heuristic is not None:
+                results[index] = heuristic
+                anchor = (event, heuristic)
+            elif anchor is not None and event.timestamp - anchor[0].timestamp <= self._window:
+                results[index] = replace(
+                    anchor[1],
+                    confidence=round(anchor[1].confidence * self._carry_decay, 4),
+                    rationale=f"Carried from thread message {anchor[0].id}",
+                    tier=ClassificationTier.THREAD,
+                )
+            else:
+                pending.append(index)
+
+        if pending:
+            results.update(self._classify_transcript(events, pending, indices))
+        return results
+
+    def _classify_transcript(
+        self,
+        events: Sequence[ActivityEvent],
+        pending: Sequence[int],
+        thread: Sequence[int],
+    ) -> Dict[int, ClassificationResult]:
+        start = events[pending[0]].timestamp
+        end = start + self._window
+        lines = [
+            f"{events[index].author}: {events[index].content.strip()}"
+            for index in thread
+            if start <= events[index].timestamp <= end
+        ]
+        transcript = "\n".join(lines)[-self._max_transcript_chars :]
+        result = self._classifier.classify(transcript)
+        return {index: result for index in pending}
+
+
+__all__ = ["DEFAULT_WINDOW", "ThreadContextClassifier", "task_reference_key"]
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from pydantic import BaseModel
 from datetime import datetime
 from typing import List, Dict, Any
 import mangum
 
+from syncly_agents.persistence.instrumentation import (
+    OPENMETRICS_CONTENT_TYPE,
+    get_persistence_metrics,
+)
+
 app = FastAPI()
 
 
@@ -53,6 +58,15 @@ def health() -> HealthResponse:
     return HealthResponse(status="ok", started_at=STARTED_AT)
 
 
+@app.get("/metrics")
+def metrics() -> Response:
+    """Expose persistence metrics in the OpenMetrics text format."""
+    return Response(
+        content=get_persistence_metrics().render_openmetrics(),
+        media_type=OPENMETRICS_CONTENT_TYPE,
+    )
+
+
 @app.get("/insights", response_model=InsightsResponse)
 def get_insights() -> InsightsResponse:
     """Get AI-powered insights about project activities and workflows."""
@@ -0,0 +1,309 @@
+"""Coalescing, deduplicating and escalating queue for blocker alerts."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol, Sequence, Set, Tuple
+
+from ..persistence.cache import DEFAULT_TTL_SECONDS, CachedRepository
+from ..persistence.models import ActivityEvent, NotificationChannel, NotificationPreference, StatusLabel
+from ..shared.logging import get_logger, log_event
+from ..shared.metrics import Histogram
+from .rendering import escape_mrkdwn
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_COALESCE_WINDOW = timedelta(minutes=5)
+DEFAULT_TICK_SECONDS = 15.0
+DEFAULT_BLOCKER_TTL = timedelta(hours=24)
+ALERT_LATENCY_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+MAX_ITEMS_PER_ALERT = 20
+
+BlockerKey = Tuple[str, str]
+
+
+class BlockerAlertSender(Protocol):
+    def send_blocker_alert(self, text: str, channel: str | None = None) -> tuple[bool, str]: ...
+
+
+@dataclass
+class TrackedBlocker:
+    workspace_id: str
+    task_reference: Optional[str]
+    owner: str
+    reason: str
+    detected_at: datetime
+    occurrences: int = 1
+    alerted_at: Optional[datetime] = None
+    alerted_targets: Set[Optional[str]] = field(default_factory=set)
+    escalated_targets: Set[Optional[str]] = field(default_factory=set)
+
+    @property
+    def key(self) -> BlockerKey:
+        # Updates without a task reference are tracked per author instead.
+        return (self.workspace_id, self.task_reference or f"@{self.owner}")
+
+
+@dataclass
+class AlertMetrics:
+    alerts_sent: int = 0
+    escalations_sent: int = 0
+    duplicates_suppressed: int = 0
+    failed_sends: int = 0
+    detection_to_alert_seconds: Histogram = field(default_factory=lambda: Histogram(ALERT_LATENCY_BUCKETS))
+
+
+class BlockerAlertQueue:
+    """Turn a stream of blocked updates into a few well-timed Slack alerts.
+
+    Blockers are tracked per ``(workspace_id, task_reference)``, or per author
+    for updates without a task reference; repeats only bump a counter and a
+    non-blocked update for the same key resolves it. A workspace's new blockers
+    are sent as one message per Slack preference once the oldest has waited
+    ``coalesce_window``; targets whose send failed are retried on later ticks.
+    Blockers still open ``escalation_threshold`` minutes after detection are
+    escalated once per Slack preference.
+
+    Once a blocker has been alerted and escalated to every Slack target it is
+    parked: repeats are still deduplicated but ticks no longer visit it. Any
+    blocker still open ``blocker_ttl`` after detection is forgotten, so a task
+    that stays blocked is alerted afresh the next time it is reported.
+    Preferences are read through a ``CachedRepository`` so ticks do not query
+    the store every ``tick_seconds``.
+    """
+
+    def __init__(
+        self,
+        notifier: BlockerAlertSender,
+        repository: Any = None,
+        *,
+        coalesce_window: timedelta = DEFAULT_COALESCE_WINDOW,
+        tick_seconds: float = DEFAULT_TICK_SECONDS,
+        blocker_ttl: timedelta = DEFAULT_BLOCKER_TTL,
+        preferences_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        logger: Optional[logging.Logger] = None,
+        start: bool = True,
+    ) -> None:
+        self._notifier = notifier
+        self._owns_cache = repository is not None and not isinstance(repository, CachedRepository)
+        self._repository = (
+            CachedRepository(repository, ttl_seconds=preferences_ttl_seconds) if self._owns_cache else repository
+        )
+        self._window = coalesce_window
+        self._tick_seconds = tick_seconds
+        self._ttl = blocker_ttl
+        self._clock = clock
+        self._logger = logger or get_logger()
+        self._blockers: Dict[BlockerKey, TrackedBlocker] = {}
+        self._parked: Dict[BlockerKey, TrackedBlocker] = {}
+        self._lock = threading.Lock()
+        self._tick_lock = threading.Lock()
+        self._stop = threading.Event()
+        self.metrics = AlertMetrics()
+        self._worker: Optional[threading.Thread] = None
+        if start:
+            self._worker = threading.Thread(target=self._run, name="syncly-blocker-alerts", daemon=True)
+            self._worker.start()
+
+    def __enter__(self) -> "BlockerAlertQueue":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._blockers) + len(self._parked)
+
+    def observe(self, events: Iterable[ActivityEvent]) -> None:
+        """Track blocked updates and resolve tasks that moved on."""
+
+        now = self._clock()
+        with self._lock:
+            for event in events:
+                key = (event.workspace_id, event.task_reference or f"@{event.author}")
+                if event.status_label != StatusLabel.BLOCKED:
+                    self._blockers.pop(key, None)
+                    self._parked.pop(key, None)
+                    continue
+                tracked = self._blockers.get(key) or self._parked.get(key)
+                if tracked is None:
+                    self._blockers[key] = TrackedBlocker(
+                        workspace_id=event.workspace_id,
+                        task_reference=event.task_reference,
+                        owner=event.author,
+                        reason=event.content,
+                        detected_at=now,
+                    )
+                else:
+                    tracked.occurrences += 1
+                    tracked.reason = event.content
+                    self.metrics.duplicates_suppressed += 1
+
+    def tick(self, now: Optional[datetime] = None) -> int:
+        """Send due alerts and escalations; returns the number of messages sent."""
+
+        now = now or self._clock()
+        with self._tick_lock:
+            self._expire(now)
+            with self._lock:
+                by_workspace: Dict[str, List[TrackedBlocker]] = {}
+                for tracked in self._blockers.values():
+                    by_workspace.setdefault(tracked.workspace_id, []).append(tracked)
+
+            sent = 0
+            for workspace_id, blockers in by_workspace.items():
+                fresh = [b for b in blockers if b.alerted_at is None]
+                alerted = [b for b in blockers if b.alerted_at is not None]
+                alert_due = bool(fresh) and min(b.detected_at for b in fresh) + self._window <= now
+                if not alert_due and not alerted:
+                    continue
+                preferences = self._slack_preferences(workspace_id)
+                targets = {preference.target for preference in preferences} or {None}
+                # Targets that missed an earlier alert are retried every tick.
+                pending = (fresh if alert_due else []) + [b for b in alerted if not targets <= b.alerted_targets]
+                if pending:
+                    sent += self._send_alert(workspace_id, pending, targets, now)
+                sent += self._send_escalations(alerted, preferences, now)
+                self._park_settled(blockers, preferences)
+            return sent
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+        if self._owns_cache:
+            self._repository.close()
+
+    def _send_alert(
+        self,
+        workspace_id: str,
+        blockers: List[TrackedBlocker],
+        targets: Set[Optional[str]],
+        now: datetime,
+    ) -> int:
+        sent = 0
+        for target in sorted(targets, key=lambda value: value or ""):
+            due = [b for b in blockers if target not in b.alerted_targets]
+            if not due:
+                continue
+            text = _format_alert(f":rotating_light: *{_plural(len(due), 'new blocker')}*", due)
+            if not self._post(text, target):
+                continue
+            sent += 1
+            with self._lock:
+                for tracked in due:
+                    tracked.alerted_targets.add(target)
+                    if tracked.alerted_at is None:
+                        tracked.alerted_at = now
+                        self.metrics.detection_to_alert_seconds.observe((now - tracked.detected_at).total_seconds())
+        if not sent:
+            return 0
+        with self._lock:
+            self.metrics.alerts_sent += 1
+        log_event(
+            self._logger,
+            logging.INFO,
+            "Blocker alert sent",
+            correlation_id=workspace_id,
+            extra_fields={
+                "blockers": len(blockers),
+                "max_detection_to_alert_seconds": max((now - b.detected_at).total_seconds() for b in blockers),
+            },
+        )
+        return sent
+
+    def _send_escalations(
+        self,
+        blockers: List[TrackedBlocker],
+        preferences: List[NotificationPreference],
+        now: datetime,
+    ) -> int:
+        sent = 0
+        for preference in preferences:
+            threshold = timedelta(minutes=preference.escalation_threshold)
+            due = [
+                b
+                for b in blockers
+                if preference.target not in b.escalated_targets and b.detected_at + threshold <= now
+            ]
+            if not due:
+                continue
+            header = (
+                f":warning: *Escalation: {_plural(len(due), 'blocker')} open for "
+                f"{preference.escalation_threshold}+ min*"
+            )
+            if self._post(_format_alert(header, due), preference.target):
+                with self._lock:
+                    for tracked in due:
+                        tracked.escalated_targets.add(preference.target)
+                    self.metrics.escalations_sent += 1
+                sent += 1
+        return sent
+
+    def _park_settled(self, blockers: List[TrackedBlocker], preferences: List[NotificationPreference]) -> None:
+        targets = {preference.target for preference in preferences}
+        with self._lock:
+            for tracked in blockers:
+                if not (targets or {None}) <= tracked.alerted_targets or not targets <= tracked.escalated_targets:
+                    continue
+                key = tracked.key
+                # The task may have been resolved (or re-detected) since the snapshot.
+                if self._blockers.get(key) is tracked:
+                    self._parked[key] = self._blockers.pop(key)
+
+    def _expire(self, now: datetime) -> None:
+        forgotten = 0
+        with self._lock:
+            for tracked_by_key in (self._blockers, self._parked):
+                expired = [key for key, tracked in tracked_by_key.items() if tracked.detected_at + self._ttl <= now]
+                for key in expired:
+                    del tracked_by_key[key]
+                forgotten += len(expired)
+        if forgotten:
+            _LOGGER.debug("Forgot %s blockers open longer than %s", forgotten, self._ttl)
+
+    def _slack_preferences(self, workspace_id: str) -> List[NotificationPreference]:
+        if self._repository is None:
+            return []
+        rows = self._repository.list_notification_preferences(workspace_id)
+        preferences = (NotificationPreference.model_validate(row) for row in rows)
+        return [pref for pref in preferences if pref.channel == NotificationChannel.SLACK]
+
+    def _post(self, text: str, channel: Optional[str]) -> int:
+        ok, detail = self._notifier.send_blocker_alert(text, channel=channel)
+        if not ok:
+            self.metrics.failed_sends += 1
+            _LOGGER.warning("Blocker alert to %s failed: %s", channel, detail)
+        return int(ok)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._tick_seconds):
+            try:
+                self.tick()
+            except Exception as exc:  # pragma: no cover - keep the worker alive
+                _LOGGER.exception("Blocker alert tick failed: %s", exc)
+
+
+def _format_alert(header: str, blockers: Sequence[TrackedBlocker]) -> str:
+    ordered = sorted(blockers, key=lambda b: b.detected_at)
+    lines = [header]
+    for tracked in ordered[:MAX_ITEMS_PER_ALERT]:
+        repeat = f" (×{tracked.occurrences})" if tracked.occurrences > 1 else ""
+        task = f"{escape_mrkdwn(tracked.task_reference)} – " if tracked.task_reference else ""
+        lines.append(f"• {task}{escape_mrkdwn(tracked.owner)}: {escape_mrkdwn(tracked.reason)}{repeat}")
+    if len(ordered) > MAX_ITEMS_PER_ALERT:
+        lines.append(f"…and {len(ordered) - MAX_ITEMS_PER_ALERT} more")
+    return "\n".join(lines)
+
+
+def _plural(count: int, noun: str) -> str:
+    return f"{count} {noun}{'' if count == 1 else 's'}"
+
+
+__all__ = ["AlertMetrics", "BlockerAlertQueue", "TrackedBlocker"]
@@ -0,0 +1,213 @@
+"""Concurrent fan-out of digest reports to every configured delivery target."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..persistence.models import (
+    DeliveryStatus,
+    DigestDeliveryLog,
+    DigestReport,
+    NotificationChannel,
+    NotificationPreference,
+)
+from ..shared.logging import get_logger, log_event
+
+DEFAULT_MAX_WORKERS = 32
+
+Sender = Callable[[DigestReport, str], Tuple[bool, str]]
+
+
+@dataclass(frozen=True)
+class DeliveryTarget:
+    channel: NotificationChannel
+    target: str
+
+    @classmethod
+    def parse(cls, value: str) -> "DeliveryTarget":
+        """Parse ``"slack:#eng"``/``"email:a@b.co"``; bare addresses with ``@`` are email."""
+
+        prefix, _, rest = value.partition(":")
+        if rest and prefix in {channel.value for channel in NotificationChannel}:
+            return cls(NotificationChannel(prefix), rest)
+        channel = NotificationChannel.EMAIL if "@" in value.lstrip("@") else NotificationChannel.SLACK
+        return cls(channel, value)
+
+    def __str__(self) -> str:
+        return f"{self.channel.value}:{self.target}"
+
+
+def delivery_targets(
+    report: DigestReport,
+    preferences: Sequence[NotificationPreference] = (),
+) -> List[DeliveryTarget]:
+    """Targets from the workspace preferences, else from ``report.delivery_targets``."""
+
+    if preferences:
+        targets = [DeliveryTarget(pref.channel, pref.target) for pref in preferences]
+    else:
+        targets = [DeliveryTarget.parse(value) for value in report.delivery_targets]
+    return list(dict.fromkeys(targets))
+
+
+def build_senders(*, slack: Any = None, email: Any = None) -> Dict[NotificationChannel, Sender]:
+    """Adapt the Slack and email notifiers to one ``(report, target)`` signature."""
+
+    senders: Dict[NotificationChannel, Sender] = {}
+    if slack is not None:
+        senders[NotificationChannel.SLACK] = lambda report, target: slack.send_digest(report, channel=target)
+    if email is not None:
+        senders[NotificationChannel.EMAIL] = lambda report, target: email.send_digest(report, [target])
+    return senders
+
+
+def derive_delivery_status(logs: Sequence[DigestDeliveryLog]) -> DeliveryStatus:
+    if not logs:
+        return DeliveryStatus.PENDING
+    sent = sum(1 for log in logs if log.status == DeliveryStatus.SENT)
+    if sent == len(logs):
+        return DeliveryStatus.SENT
+    if sent == 0:
+        return DeliveryStatus.FAILED
+    return DeliveryStatus.PARTIALLY_SENT
+
+
+class DigestDeliveryEngine:
+    """Deliver digests to all Slack channels and email recipients in parallel.
+
+    Every target is an independent task on one bounded thread pool, so reports
+    for many workspaces share the same concurrency budget. Each target gets its
+    own ``DigestDeliveryLog`` and the report status is derived from those logs.
+    """
+
+    def __init__(
+        self,
+        *,
+        slack: Any = None,
+        email: Any = None,
+        repository: Any = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        logger: Optional[logging.Logger] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self._senders = build_senders(slack=slack, email=email)
+        self._repository = repository
+        self._logger = logger or get_logger()
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="syncly-delivery")
+
+    def __enter__(self) -> "DigestDeliveryEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def deliver(
+        self,
+        report: DigestReport,
+        preferences: Optional[Sequence[NotificationPreference]] = None,
+    ) -> DigestReport:
+        """Send ``report`` to every target and return a copy with logs and status."""
+
+        prefs = {report.workspace_id: preferences} if preferences is not None else None
+        return self.deliver_many([report], prefs)[0]
+
+    def deliver_many(
+        self,
+        reports: Iterable[DigestReport],
+        preferences: Optional[Mapping[str, Sequence[NotificationPreference]]] = None,
+    ) -> List[DigestReport]:
+        """Fan out many reports at once; results keep the input order.
+
+        Preferences missing from ``preferences`` are loaded in one batch before
+        the first send, not one workspace at a time.
+        """
+
+        reports = list(reports)
+        known: Mapping[str, Sequence[NotificationPreference]] = preferences or {}
+        loaded = self._load_preferences(
+            [report.workspace_id for report in reports if report.workspace_id not in known]
+        )
+        pending: List[Tuple[DigestReport, List[DeliveryTarget], List[Future[DigestDeliveryLog]]]] = []
+        for report in reports:
+            workspace_preferences = known.get(report.workspace_id, loaded.get(report.workspace_id, []))
+            targets = delivery_targets(report, workspace_preferences)
+            futures = [self._executor.submit(self._send, report, target) for target in targets]
+            pending.append((report, targets, futures))
+
+        delivered: List[DigestReport] = []
+        for report, targets, futures in pending:
+            logs = [future.result() for future in futures]
+            status = derive_delivery_status(logs)
+            log_event(
+                self._logger,
+                logging.INFO if status == DeliveryStatus.SENT else logging.WARNING,
+                "Digest delivery finished",
+                correlation_id=report.id,
+                extra_fields={
+                    "workspace_id": report.workspace_id,
+                    "status": status.value,
+                    "targets": len(logs),
+                    "failed": sum(1 for log in logs if log.status != DeliveryStatus.SENT),
+                },
+            )
+            delivered.append(
+                report.model_copy(
+                    update={
+                        "delivery_targets": [str(target) for target in targets],
+                        "delivery_logs": logs,
+                        "delivery_status": status,
+                    }
+                )
+            )
+        return delivered
+
+    def _load_preferences(self, workspace_ids: Sequence[str]) -> Dict[str, List[NotificationPreference]]:
+        wanted = list(dict.fromkeys(workspace_ids))
+        if self._repository is None or not wanted:
+            return {}
+        if len(wanted) == 1:
+            rows = self._repository.list_notification_preferences(wanted[0])
+        else:
+            # One round trip for the whole fan-out instead of one per workspace.
+            rows = self._repository.list_all_notification_preferences()
+        grouped: Dict[str, List[NotificationPreference]] = {}
+        for row in rows:
+            preference = NotificationPreference.model_validate(row)
+            grouped.setdefault(preference.workspace_id, []).append(preference)
+        return grouped
+
+    def _send(self, report: DigestReport, target: DeliveryTarget) -> DigestDeliveryLog:
+        sender = self._senders.get(target.channel)
+        if sender is None:
+            ok, detail = False, f"No {target.channel.value} notifier configured"
+        else:
+            try:
+                ok, detail = sender(report, target.target)
+            except Exception as exc:
+                ok, detail = False, str(exc)
+        return DigestDeliveryLog(
+            target=target.target,
+            channel=target.channel.value,
+            status=DeliveryStatus.SENT if ok else DeliveryStatus.FAILED,
+            detail=detail,
+            sent_at=self._clock() if ok else None,
+        )
+
+
+__all__ = [
+    "DeliveryTarget",
+    "DigestDeliveryEngine",
+    "build_senders",
+    "delivery_targets",
+    "derive_delivery_status",
+]
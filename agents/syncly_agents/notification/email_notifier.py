@@ -3,21 +3,39 @@
 from __future__ import annotations
 
 import logging
-import smtplib
 from email.message import EmailMessage
 from typing import Iterable
 
 from ..persistence.models import DigestReport
 from ..settings import Settings, get_settings
+from ..shared.client_registry import get_client_registry
+from .rendering import DigestRenderer, RenderFormat, get_digest_renderer
+from .smtp_pool import SMTPConfig, SMTPConnectionPool
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class EmailNotifier:
-    """Send digest reports via SMTP."""
+    """Send digest reports via SMTP over a shared, pooled set of sessions."""
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        pool: SMTPConnectionPool | None = None,
+        renderer: DigestRenderer | None = None,
+    ) -> None:
         self._settings = settings or get_settings()
+        self._smtp_pool = pool
+        self._renderer = renderer or get_digest_renderer()
+
+    @property
+    def _pool(self) -> SMTPConnectionPool:
+        if self._smtp_pool is None:
+            config = SMTPConfig.from_settings(self._settings.notifications)
+            self._smtp_pool = get_client_registry().get_or_create(
+                ("smtp", config), lambda: SMTPConnectionPool(config)
+            )
+        return self._smtp_pool
 
     def send_digest(self, report: DigestReport, recipients: Iterable[str]) -> tuple[bool, str]:
         recipients = list(recipients)
@@ -34,12 +52,10 @@ class EmailNotifier:
         message["From"] = cfg.from_email
         message["To"] = ", ".join(recipients)
         message.set_content(self._compose_body(report))
+        message.add_alternative(self._renderer.render(report, RenderFormat.HTML).text, subtype="html")
 
         try:
-            with smtplib.SMTP(cfg.smtp_host, cfg.smtp_port or 587) as client:
-                client.starttls()
-                client.login(cfg.smtp_username, cfg.smtp_password)
-                client.send_message(message)
+            self._pool.send(message)
         except Exception as exc:  # pragma: no cover - network issues
             _LOGGER.error("Email notification failed: %s", exc)
             return False, str(exc)
@@ -47,23 +63,7 @@ class EmailNotifier:
         return True, "sent"
 
     def _compose_body(self, report: DigestReport) -> str:
-        lines = [f"Syncly Daily Digest ({report.report_date.date()})", ""]
-        if report.progress_items:
-            lines.append("Completed:\n" + "\n".join(
-                f"- {item.owner}: {item.summary}" for item in report.progress_items
-            ))
-        if report.blockers:
-            lines.append("\nBlockers:\n" + "\n".join(
-                f"- {blocker.owner}: {blocker.reason}" for blocker in report.blockers
-            ))
-        if report.next_actions:
-            lines.append("\nNext Actions:\n" + "\n".join(
-                f"- {action.owner}: {action.description}" for action in report.next_actions
-            ))
-        lines.append(f"\nTeam mood: {report.team_mood.value}")
-        if report.mood_rationale:
-            lines.append(report.mood_rationale)
-        return "\n".join(lines)
+        return self._renderer.render(report, RenderFormat.TEXT).text
 
 
 __all__ = ["EmailNotifier"]
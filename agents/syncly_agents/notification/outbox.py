@@ -0,0 +1,526 @@
+"""Durable SQLite outbox giving digest notifications at-least-once delivery.
+
+``deliver`` only records one row per ``(report, channel, target)`` and returns,
+so callers never wait on Slack or SMTP. Background workers claim due rows under
+a lease, send them and either mark them sent or reschedule them with
+exponential backoff. A worker that dies mid-send leaves its rows leased; they
+are reclaimed once the lease expires, so a crash can cause a duplicate send
+but never a lost one.
+
+The idempotency key only deduplicates enqueueing: it is not sent to Slack or
+SMTP, which have no way to drop a repeat. A send that times out after the
+provider accepted it, or a worker that dies before marking its row sent, will
+deliver that notification again.
+
+Once every target of a report is sent or dead, its rows and stored payload are
+kept for ``retention_seconds`` after enqueueing, so repeats are still
+deduplicated, and then deleted.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import random
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from syncly_agents import settings
+
+from ..persistence.errors import PersistenceError
+from ..persistence.models import (
+    DeliveryStatus,
+    DigestDeliveryLog,
+    DigestReport,
+    NotificationChannel,
+    NotificationPreference,
+)
+from ..shared.logging import get_logger, log_event
+from .delivery import DeliveryTarget, build_senders, delivery_targets, derive_delivery_status
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_BASE_BACKOFF_SECONDS = 5.0
+DEFAULT_MAX_BACKOFF_SECONDS = 900.0
+DEFAULT_LEASE_SECONDS = 120.0
+DEFAULT_POLL_SECONDS = 1.0
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    idempotency_key TEXT PRIMARY KEY,
+    report_id TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    target TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    lease_expires_at REAL,
+    last_error TEXT,
+    sent_at TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notification_outbox_due
+    ON notification_outbox (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS notification_outbox_report
+    ON notification_outbox (report_id);
+CREATE TABLE IF NOT EXISTS notification_outbox_reports (
+    report_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+);
+"""
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+
+
+@dataclass
+class OutboxMetrics:
+    enqueued: int = 0
+    duplicates: int = 0
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+
+
+def idempotency_key(report_id: str, target: DeliveryTarget) -> str:
+    """Stable key for one delivery of a report; re-enqueueing it is a no-op."""
+
+    raw = f"{report_id}\0{target.channel.value}\0{target.target}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class NotificationOutbox:
+    """Persist pending digest deliveries and drain them with background workers.
+
+    Exposes the same ``deliver``/``close`` surface as ``DigestDeliveryEngine``
+    so ``DigestPipeline`` can use either. When a ``repository`` is given, the
+    stored digest report is updated with delivery logs and status once every
+    target of that report is either sent or dead.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = ":memory:",
+        *,
+        slack: Any = None,
+        email: Any = None,
+        repository: Any = None,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_backoff_seconds: float = DEFAULT_BASE_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        jitter: float = 0.5,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        logger: Optional[logging.Logger] = None,
+        start: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be positive")
+        self._path = str(path)
+        if self._path != ":memory:":
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._senders = build_senders(slack=slack, email=email)
+        self._repository = repository
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._base_backoff = base_backoff_seconds
+        self._max_backoff = max_backoff_seconds
+        self._jitter = jitter
+        self._lease_seconds = lease_seconds
+        self._poll_seconds = poll_seconds
+        self._retention_seconds = retention_seconds
+        self._clock = clock
+        self._logger = logger or get_logger()
+        self._rng = random.Random()
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self.metrics = OutboxMetrics()
+        self._workers: List[threading.Thread] = []
+        if start:
+            for index in range(max(1, workers)):
+                worker = threading.Thread(target=self._run, name=f"syncly-outbox-{index}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+            atexit.register(self.close)
+
+    @classmethod
+    def from_settings(
+        cls, config: Optional[settings.Settings] = None, **kwargs: Any
+    ) -> "NotificationOutbox":
+        """Keep the outbox next to the local SQLite database."""
+
+        cfg = config or settings.get_settings()
+        return cls(cfg.local_database_path, **kwargs)
+
+    def __enter__(self) -> "NotificationOutbox":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()
+
+    def close(self) -> None:
+        """Stop the workers and close the database; undelivered rows stay for the next run."""
+
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._wake.set()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+        atexit.unregister(self.close)
+        with self._lock:
+            self._conn.close()
+
+    # Enqueueing ----------------------------------------------------------------
+    def deliver(
+        self,
+        report: DigestReport,
+        preferences: Optional[Sequence[NotificationPreference]] = None,
+    ) -> DigestReport:
+        """Queue ``report`` for every target and return a pending copy immediately.
+
+        The pending copy is stored before any row is enqueued so that a worker
+        settling the report can never be overwritten by it.
+        """
+
+        if preferences is None:
+            preferences = self._load_preferences(report.workspace_id)
+        targets = delivery_targets(report, preferences)
+        pending = report.model_copy(
+            update={
+                "delivery_targets": [str(target) for target in targets],
+                "delivery_logs": [],
+                "delivery_status": DeliveryStatus.PENDING,
+            }
+        )
+        if self._repository is not None:
+            self._repository.store_digest_report(pending.model_dump(mode="json"))
+        self.enqueue(report, targets)
+        return pending
+
+    def enqueue(self, report: DigestReport, targets: Sequence[DeliveryTarget]) -> int:
+        """Record deliveries of ``report``; returns how many were new."""
+
+        now = self._clock().timestamp()
+        rows = [
+            (
+                idempotency_key(report.id, target),
+                report.id,
+                report.workspace_id,
+                target.channel.value,
+                target.target,
+                OutboxStatus.PENDING.value,
+                now,
+                now,
+            )
+            for target in targets
+        ]
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    """
+                    INSERT INTO notification_outbox_reports (report_id, payload) VALUES (?, ?)
+                    ON CONFLICT (report_id) DO UPDATE SET payload = excluded.payload
+                    """,
+                    (report.id, report.model_dump_json()),
+                )
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    """
+                    INSERT INTO notification_outbox (
+                        idempotency_key, report_id, workspace_id, channel, target,
+                        status, next_attempt_at, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (idempotency_key) DO NOTHING
+                    """,
+                    rows,
+                )
+                inserted = self._conn.total_changes - before
+        except sqlite3.Error as exc:
+            raise PersistenceError("Failed to enqueue notifications") from exc
+        self.metrics.enqueued += inserted
+        self.metrics.duplicates += len(rows) - inserted
+        if inserted:
+            self._wake.set()
+        return inserted
+
+    # Draining ------------------------------------------------------------------
+    def process_due(self, now: Optional[datetime] = None) -> int:
+        """Claim and send one batch of due deliveries; returns the rows processed."""
+
+        now_ts = (now or self._clock()).timestamp()
+        claimed = self._claim(now_ts)
+        reports: Dict[str, Optional[DigestReport]] = {}
+        for row in claimed:
+            report_id = row["report_id"]
+            if report_id not in reports:
+                reports[report_id] = self._load_report(report_id)
+            self._attempt(row, reports[report_id])
+        for report_id, report in reports.items():
+            if report is not None:
+                self._settle_report(report)
+        if claimed:
+            self.purge_settled(now)
+        return len(claimed)
+
+    def drain(self, now: Optional[datetime] = None) -> int:
+        """Process batches until nothing is due; returns the rows processed."""
+
+        total = 0
+        while True:
+            processed = self.process_due(now)
+            if not processed:
+                return total
+            total += processed
+
+    def purge_settled(self, now: Optional[datetime] = None) -> int:
+        """Delete settled reports enqueued over ``retention_seconds`` ago; returns rows deleted."""
+
+        cutoff = (now or self._clock()).timestamp() - self._retention_seconds
+        try:
+            with self._lock, self._conn:
+                deleted = self._conn.execute(
+                    """
+                    DELETE FROM notification_outbox WHERE report_id IN (
+                        SELECT report_id FROM notification_outbox
+                        GROUP BY report_id
+                        HAVING MAX(created_at) <= ? AND SUM(status IN (?, ?)) = 0
+                    )
+                    """,
+                    (cutoff, OutboxStatus.PENDING.value, OutboxStatus.SENDING.value),
+                ).rowcount
+                self._conn.execute(
+                    """
+                    DELETE FROM notification_outbox_reports
+                    WHERE report_id NOT IN (SELECT report_id FROM notification_outbox)
+                    """
+                )
+        except sqlite3.Error as exc:
+            raise PersistenceError("Failed to purge settled outbox rows") from exc
+        if deleted:
+            _LOGGER.debug("Purged %s settled outbox rows", deleted)
+        return deleted
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts per ``OutboxStatus``."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) AS count FROM notification_outbox GROUP BY status"
+            ).fetchall()
+        counts = {status.value: 0 for status in OutboxStatus}
+        counts.update({row["status"]: row["count"] for row in rows})
+        return counts
+
+    def _claim(self, now_ts: float) -> List[sqlite3.Row]:
+        try:
+            with self._lock, self._conn:
+                rows = self._conn.execute(
+                    """
+                    UPDATE notification_outbox
+                    SET status = ?, attempts = attempts + 1, lease_expires_at = ?
+                    WHERE idempotency_key IN (
+                        SELECT idempotency_key FROM notification_outbox
+                        WHERE (status = ? AND next_attempt_at <= ?)
+                           OR (status = ? AND lease_expires_at <= ?)
+                        ORDER BY next_attempt_at
+                        LIMIT ?
+                    )
+                    RETURNING idempotency_key, report_id, channel, target, attempts
+                    """,
+                    (
+                        OutboxStatus.SENDING.value,
+                        now_ts + self._lease_seconds,
+                        OutboxStatus.PENDING.value,
+                        now_ts,
+                        OutboxStatus.SENDING.value,
+                        now_ts,
+                        self._batch_size,
+                    ),
+                ).fetchall()
+        except sqlite3.Error as exc:
+            raise PersistenceError("Failed to claim outbox rows") from exc
+        return rows
+
+    def _attempt(self, row: sqlite3.Row, report: Optional[DigestReport]) -> None:
+        target = DeliveryTarget(NotificationChannel(row["channel"]), row["target"])
+        sender = self._senders.get(target.channel)
+        if report is None:
+            ok, detail = False, "Report payload missing from outbox"
+        elif sender is None:
+            ok, detail = False, f"No {target.channel.value} notifier configured"
+        else:
+            try:
+                ok, detail = sender(report, target.target)
+            except Exception as exc:
+                ok, detail = False, str(exc)
+
+        key, attempts = row["idempotency_key"], row["attempts"]
+        now = self._clock()
+        if ok:
+            self._update(
+                key,
+                status=OutboxStatus.SENT,
+                last_error=None,
+                sent_at=now.isoformat(),
+            )
+            self.metrics.sent += 1
+            return
+        if attempts >= self._max_attempts:
+            self._update(key, status=OutboxStatus.DEAD, last_error=detail)
+            self.metrics.dead += 1
+            log_event(
+                self._logger,
+                logging.ERROR,
+                "Notification dead-lettered",
+                correlation_id=row["report_id"],
+                extra_fields={"target": str(target), "attempts": attempts, "error": detail},
+            )
+            return
+        delay = self.backoff_seconds(attempts)
+        self._update(
+            key,
+            status=OutboxStatus.PENDING,
+            last_error=detail,
+            next_attempt_at=now.timestamp() + delay,
+        )
+        self.metrics.retried += 1
+        log_event(
+            self._logger,
+            logging.WARNING,
+            "Notification send failed; retry scheduled",
+            correlation_id=row["report_id"],
+            extra_fields={
+                "target": str(target),
+                "attempts": attempts,
+                "retry_in_seconds": round(delay, 3),
+                "error": detail,
+            },
+        )
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """Exponential delay after ``attempts`` failures, capped and jittered downwards."""
+
+        delay = min(self._max_backoff, self._base_backoff * (2 ** max(0, attempts - 1)))
+        return delay * (1.0 - self._jitter * self._rng.random())
+
+    def _update(
+        self,
+        key: str,
+        *,
+        status: OutboxStatus,
+        last_error: Optional[str],
+        sent_at: Optional[str] = None,
+        next_attempt_at: Optional[float] = None,
+    ) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    """
+                    UPDATE notification_outbox
+                    SET status = ?, last_error = ?, lease_expires_at = NULL,
+                        sent_at = COALESCE(?, sent_at),
+                        next_attempt_at = COALESCE(?, next_attempt_at)
+                    WHERE idempotency_key = ?
+                    """,
+                    (status.value, last_error, sent_at, next_attempt_at, key),
+                )
+        except sqlite3.Error as exc:
+            raise PersistenceError("Failed to update outbox row") from exc
+
+    def _load_preferences(self, workspace_id: str) -> List[NotificationPreference]:
+        if self._repository is None:
+            return []
+        rows = self._repository.list_notification_preferences(workspace_id)
+        return [NotificationPreference.model_validate(row) for row in rows]
+
+    def _load_report(self, report_id: str) -> Optional[DigestReport]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM notification_outbox_reports WHERE report_id = ?", (report_id,)
+            ).fetchone()
+        return DigestReport.model_validate(json.loads(row["payload"])) if row else None
+
+    def _settle_report(self, report: DigestReport) -> None:
+        """Store final delivery logs once no target of ``report`` is still in flight."""
+
+        if self._repository is None:
+            return
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT channel, target, status, last_error, sent_at FROM notification_outbox
+                WHERE report_id = ? ORDER BY created_at, channel, target
+                """,
+                (report.id,),
+            ).fetchall()
+        if any(row["status"] in (OutboxStatus.PENDING.value, OutboxStatus.SENDING.value) for row in rows):
+            return
+        logs = [
+            DigestDeliveryLog(
+                target=row["target"],
+                channel=row["channel"],
+                status=DeliveryStatus.SENT if row["status"] == OutboxStatus.SENT.value else DeliveryStatus.FAILED,
+                detail="sent" if row["status"] == OutboxStatus.SENT.value else row["last_error"],
+                sent_at=datetime.fromisoformat(row["sent_at"]) if row["sent_at"] else None,
+            )
+            for row in rows
+        ]
+        settled = report.model_copy(
+            update={
+                "delivery_targets": [f"{row['channel']}:{row['target']}" for row in rows],
+                "delivery_logs": logs,
+                "delivery_status": derive_delivery_status(logs),
+            }
+        )
+        try:
+            self._repository.store_digest_report(settled.model_dump(mode="json"))
+        except Exception as exc:
+            _LOGGER.error("Failed to store delivery status for digest %s: %s", report.id, exc)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                processed = self.process_due()
+            except Exception as exc:  # pragma: no cover - keep the worker alive
+                _LOGGER.exception("Outbox worker failed: %s", exc)
+                processed = 0
+            if not processed:
+                self._wake.wait(self._poll_seconds)
+                self._wake.clear()
+
+
+__all__ = [
+    "NotificationOutbox",
+    "OutboxMetrics",
+    "OutboxStatus",
+    "idempotency_key",
+]
@@ -0,0 +1,328 @@
+"""Render-once, cache-everywhere digest formatting for all notification channels.
+
+Each ``DigestReport`` is rendered at most once per format and content version;
+every Slack channel and email recipient receiving that report reuses the same
+encoded bytes. Templates are compiled at import time. Reports are treated as
+immutable once handed to the renderer; edit them with ``model_copy``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from enum import Enum
+from string import Template
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..persistence.models import DigestReport
+
+DEFAULT_CACHE_ENTRIES = 1024
+SLACK_SECTION_LIMIT = 3000
+SLACK_MAX_BLOCKS = 50
+SLACK_MESSAGE_LIMIT = 40_000
+
+# Fields that affect rendered output; delivery bookkeeping is excluded so that
+# recording delivery logs does not invalidate the cache mid fan-out.
+_CONTENT_FIELDS = {
+    "id",
+    "report_date",
+    "progress_items",
+    "blockers",
+    "next_actions",
+    "team_mood",
+    "mood_rationale",
+}
+
+_SLACK_TITLE = Template("*Syncly Daily Digest – $date*")
+_SLACK_ITEM = Template("• $owner: $text")
+_TEXT_TITLE = Template("Syncly Daily Digest ($date)")
+_TEXT_ITEM = Template("- $owner: $text")
+_HTML_PAGE = Template(
+    "<!DOCTYPE html><html><body style=\"font-family:sans-serif\">"
+    "<h2>Syncly Daily Digest – $date</h2>$sections"
+    "<p><strong>Team mood:</strong> $mood</p>$rationale</body></html>"
+)
+_HTML_SECTION = Template("<h3>$title</h3><ul>$items</ul>")
+_HTML_ITEM = Template("<li><strong>$owner</strong>: $text</li>")
+
+
+class RenderFormat(str, Enum):
+    SLACK_TEXT = "slack_text"
+    SLACK_BLOCKS = "slack_blocks"
+    SLACK_THREAD = "slack_thread"
+    TEXT = "text"
+    HTML = "html"
+
+
+@dataclass(frozen=True)
+class RenderedDigest:
+    format: RenderFormat
+    version: str
+    body: bytes
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8")
+
+
+def report_version(report: DigestReport) -> str:
+    """Short content hash of the fields that influence rendering."""
+
+    payload = report.model_dump_json(include=_CONTENT_FIELDS).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def escape_mrkdwn(text: str) -> str:
+    """Escape the three control characters Slack's mrkdwn parser reserves."""
+
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _sections(report: DigestReport) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    return [
+        ("Completed", [(item.owner, item.summary) for item in report.progress_items]),
+        ("Blockers", [(blocker.owner, blocker.reason) for blocker in report.blockers]),
+        ("Next Actions", [(action.owner, action.description) for action in report.next_actions]),
+    ]
+
+
+def render_slack_text(report: DigestReport) -> str:
+    lines = [_SLACK_TITLE.substitute(date=report.report_date.date()), ""]
+    for index, (title, items) in enumerate(_sections(report)):
+        if not items:
+            continue
+        lines.append(("\n" if index else "") + f"*{title}*:")
+        lines.extend(
+            _SLACK_ITEM.substitute(owner=escape_mrkdwn(owner), text=escape_mrkdwn(text)) for owner, text in items
+        )
+    lines.append(f"\nTeam mood: {report.team_mood.value}")
+    return "\n".join(lines)
+
+
+def render_slack_blocks(report: DigestReport) -> Dict[str, Any]:
+    """Block Kit payload (``text`` fallback plus ``blocks``) without the channel."""
+
+    blocks: List[Dict[str, Any]] = [
+        {
+            "type": "header",
+            "text": {"type": "plain_text", "text": f"Syncly Daily Digest – {report.report_date.date()}"},
+        }
+    ]
+    for title, items in _sections(report):
+        if items:
+            blocks.extend(_item_sections(f"*{title}*", items))
+    blocks.append(_mood_context(report))
+    if len(blocks) > SLACK_MAX_BLOCKS:
+        blocks = blocks[: SLACK_MAX_BLOCKS - 1] + [_mrkdwn_section("_Digest truncated; see Syncly for the rest._")]
+    return {"text": render_slack_text(report), "blocks": blocks}
+
+
+def render_slack_thread(report: DigestReport) -> List[Dict[str, Any]]:
+    """Compact top-level message followed by one or more thread replies per section.
+
+    Nothing is truncated: each reply holds at most ``SLACK_MAX_BLOCKS`` sections
+    and ``SLACK_MESSAGE_LIMIT`` characters, so a digest of any size fits.
+    """
+
+    date = report.report_date.date()
+    counts = [f"{title}: {len(items)}" for title, items in _sections(report) if items]
+    overview = " · ".join(counts) or "No updates"
+    top = {
+        "text": f"Syncly Daily Digest – {date}: {overview}",
+        "blocks": [
+            {"type": "header", "text": {"type": "plain_text", "text": f"Syncly Daily Digest – {date}"}},
+            _mrkdwn_section(f"{overview}{' – details in thread' if counts else ''}"),
+            _mood_context(report),
+        ],
+    }
+    replies: List[Dict[str, Any]] = []
+    for title, items in _sections(report):
+        if not items:
+            continue
+        blocks: List[Dict[str, Any]] = []
+        size = 0
+        for block in _item_sections(f"*{title}*", items):
+            length = len(block["text"]["text"])
+            if blocks and (len(blocks) == SLACK_MAX_BLOCKS or size + length > SLACK_MESSAGE_LIMIT):
+                replies.append({"text": f"{title} ({len(items)})", "blocks": blocks})
+                blocks, size = [], 0
+            blocks.append(block)
+            size += length
+        replies.append({"text": f"{title} ({len(items)})", "blocks": blocks})
+    return [top, *replies]
+
+
+def render_text(report: DigestReport) -> str:
+    lines = [_TEXT_TITLE.substitute(date=report.report_date.date()), ""]
+    for index, (title, items) in enumerate(_sections(report)):
+        if not items:
+            continue
+        lines.append(
+            ("\n" if index else "")
+            + f"{title}:\n"
+            + "\n".join(_TEXT_ITEM.substitute(owner=owner, text=text) for owner, text in items)
+        )
+    lines.append(f"\nTeam mood: {report.team_mood.value}")
+    if report.mood_rationale:
+        lines.append(report.mood_rationale)
+    return "\n".join(lines)
+
+
+def render_html(report: DigestReport) -> str:
+    sections = "".join(
+        _HTML_SECTION.substitute(
+            title=title,
+            items="".join(
+                _HTML_ITEM.substitute(owner=html.escape(owner), text=html.escape(text)) for owner, text in items
+            ),
+        )
+        for title, items in _sections(report)
+        if items
+    )
+    rationale = f"<p>{html.escape(report.mood_rationale)}</p>" if report.mood_rationale else ""
+    return _HTML_PAGE.substitute(
+        date=report.report_date.date(),
+        sections=sections,
+        mood=html.escape(report.team_mood.value),
+        rationale=rationale,
+    )
+
+
+def _item_sections(heading: str, items: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    blocks: List[Dict[str, Any]] = []
+    chunk = heading
+    for owner, text in items:
+        line = _SLACK_ITEM.substitute(owner=escape_mrkdwn(owner), text=escape_mrkdwn(text))
+        if len(chunk) + len(line) + 1 > SLACK_SECTION_LIMIT:
+            blocks.append(_mrkdwn_section(chunk))
+            chunk = ""
+        chunk = f"{chunk}\n{line}" if chunk else line[:SLACK_SECTION_LIMIT]
+    blocks.append(_mrkdwn_section(chunk))
+    return blocks
+
+
+def _mood_context(report: DigestReport) -> Dict[str, Any]:
+    mood = f"Team mood: *{report.team_mood.value}*"
+    if report.mood_rationale:
+        mood += f" – {escape_mrkdwn(report.mood_rationale)}"
+    return {"type": "context", "elements": [{"type": "mrkdwn", "text": mood[:SLACK_SECTION_LIMIT]}]}
+
+
+def _mrkdwn_section(text: str) -> Dict[str, Any]:
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
+
+def _compact_json(payload: Any) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+_RENDERERS: Dict[RenderFormat, Callable[[DigestReport], bytes]] = {
+    RenderFormat.SLACK_TEXT: lambda report: render_slack_text(report).encode("utf-8"),
+    RenderFormat.SLACK_BLOCKS: lambda report: _compact_json(render_slack_blocks(report)),
+    # One compact JSON object per line: the top-level message, then each reply.
+    RenderFormat.SLACK_THREAD: lambda report: b"\n".join(
+        _compact_json(message) for message in render_slack_thread(report)
+    ),
+    RenderFormat.TEXT: lambda report: render_text(report).encode("utf-8"),
+    RenderFormat.HTML: lambda report: render_html(report).encode("utf-8"),
+}
+
+
+class DigestRenderer:
+    """LRU cache of rendered digests keyed by ``(report id, version, format)``.
+
+    Concurrent requests for the same key share a single render; different keys
+    render in parallel. Content versions are memoised per report object so cache
+    hits do not re-serialise the report.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, RenderFormat], RenderedDigest]" = OrderedDict()
+        # Keyed by id(); the report is held so its id cannot be reused while memoised.
+        self._versions: "OrderedDict[int, Tuple[DigestReport, str]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str, RenderFormat], "Future[RenderedDigest]"] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, report: DigestReport, fmt: RenderFormat) -> RenderedDigest:
+        version = self._version(report)
+        key = (report.id, version, fmt)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            pending = self._in_flight.get(key)
+            if pending is None:
+                pending = self._in_flight[key] = Future()
+                self.misses += 1
+                owner = True
+            else:
+                self.hits += 1
+                owner = False
+        if not owner:
+            return pending.result()
+        try:
+            rendered = RenderedDigest(format=fmt, version=version, body=_RENDERERS[fmt](report))
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            self._entries[key] = rendered
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            del self._in_flight[key]
+        pending.set_result(rendered)
+        return rendered
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def _version(self, report: DigestReport) -> str:
+        with self._lock:
+            memo = self._versions.get(id(report))
+            if memo is not None and memo[0] is report:
+                self._versions.move_to_end(id(report))
+                return memo[1]
+        version = report_version(report)
+        with self._lock:
+            self._versions[id(report)] = (report, version)
+            while len(self._versions) > self._max_entries:
+                self._versions.popitem(last=False)
+        return version
+
+
+_DEFAULT_RENDERER = DigestRenderer()
+
+
+def get_digest_renderer() -> DigestRenderer:
+    """Return the process-wide renderer shared by all notifiers."""
+
+    return _DEFAULT_RENDERER
+
+
+__all__ = [
+    "DigestRenderer",
+    "RenderFormat",
+    "RenderedDigest",
+    "escape_mrkdwn",
+    "get_digest_renderer",
+    "render_html",
+    "render_slack_blocks",
+    "render_slack_thread",
+    "render_slack_text",
+    "render_text",
+    "report_version",
+]
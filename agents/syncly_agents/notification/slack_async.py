@@ -0,0 +1,273 @@
+"""Async Slack delivery: compact digest message with threaded section replies.
+
+The digest is posted as a short top-level message; every section follows as a
+thread reply. A thread's replies are posted one after another so they read in
+order, while different channels and workspaces post concurrently. All
+workspaces share one ``SlackRateLimiter``, so a ``429`` on one bot token pauses
+only that token and channel pacing holds even when many coroutines post at
+once. Payloads come pre-encoded from the shared ``DigestRenderer``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from ..persistence.models import DigestReport
+from ..settings import Settings, get_settings
+from ..shared.logging import get_logger, log_event
+from .rendering import DigestRenderer, RenderFormat, get_digest_renderer
+
+_LOGGER = logging.getLogger(__name__)
+
+SLACK_API_URL = "https://slack.com/api"
+DEFAULT_MESSAGES_PER_SECOND = 1.0
+DEFAULT_BURST = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_TIMEOUT_SECONDS = 15.0
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+class SlackRateLimiter:
+    """Pacing shared by every Slack client in the process.
+
+    Each ``(token, channel)`` pair is paced by a generic cell rate algorithm
+    that allows ``burst`` messages back to back and then ``messages_per_second``.
+    ``pause`` blocks a whole token until a ``Retry-After`` deadline. ``reserve``
+    is O(1) and thread-safe and returns how long the caller must wait.
+    """
+
+    def __init__(
+        self,
+        *,
+        messages_per_second: float = DEFAULT_MESSAGES_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if messages_per_second <= 0 or burst < 1:
+            raise ValueError("messages_per_second and burst must be positive")
+        self._interval = 1.0 / messages_per_second
+        self._tolerance = (burst - 1) * self._interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._theoretical_arrival: Dict[Tuple[str, str], float] = {}
+        self._paused_until: Dict[str, float] = {}
+
+    def reserve(self, token: str, channel: str) -> float:
+        now = self._clock()
+        key = (token, channel)
+        with self._lock:
+            start = max(now, self._paused_until.get(token, now))
+            arrival_time = max(self._theoretical_arrival.get(key, start), start)
+            allowed_at = max(start, arrival_time - self._tolerance)
+            self._theoretical_arrival[key] = arrival_time + self._interval
+        return max(0.0, allowed_at - now)
+
+    async def acquire(self, token: str, channel: str) -> None:
+        delay = self.reserve(token, channel)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def pause(self, token: str, seconds: float) -> None:
+        deadline = self._clock() + seconds
+        with self._lock:
+            self._paused_until[token] = max(self._paused_until.get(token, 0.0), deadline)
+
+
+_DEFAULT_LIMITER = SlackRateLimiter()
+
+
+def get_slack_rate_limiter() -> SlackRateLimiter:
+    """Return the process-wide limiter shared by all async Slack clients."""
+
+    return _DEFAULT_LIMITER
+
+
+@dataclass(frozen=True)
+class SlackPostResult:
+    ok: bool
+    detail: str
+    ts: Optional[str] = None
+
+
+class AsyncSlackClient:
+    """Post digests through one pooled ``httpx.AsyncClient``.
+
+    A bot ``token`` can be passed per call, so one client (and its keep-alive
+    pool) serves every workspace; the constructor token is the default.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[SlackRateLimiter] = None,
+        renderer: Optional[DigestRenderer] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._token = token
+        self._client = client or httpx.AsyncClient(
+            base_url=SLACK_API_URL,
+            limits=httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_CONNECTIONS,
+            ),
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+        )
+        self._limiter = limiter or get_slack_rate_limiter()
+        self._renderer = renderer or get_digest_renderer()
+        self._max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._logger = logger or get_logger()
+
+    @classmethod
+    def from_settings(cls, config: Optional[Settings] = None, **kwargs: Any) -> "AsyncSlackClient":
+        cfg = config or get_settings()
+        return cls(cfg.notifications.slack_bot_token, **kwargs)
+
+    async def __aenter__(self) -> "AsyncSlackClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def send_digest(
+        self,
+        report: DigestReport,
+        channel: str,
+        *,
+        token: Optional[str] = None,
+    ) -> tuple[bool, str]:
+        """Post the summary, then every section as an in-order thread reply.
+
+        Stops at the first failed reply so the thread never skips a section.
+        """
+
+        token = token or self._token
+        if not token:
+            return False, "Slack bot token missing"
+        top, *replies = self._renderer.render(report, RenderFormat.SLACK_THREAD).body.split(b"\n")
+        head = await self.post_message(token, channel, top)
+        if not head.ok:
+            return False, head.detail
+        if not head.ts:
+            # Without a thread_ts the replies would land in the channel as top-level posts.
+            return False, "Slack response missing ts; thread replies not posted"
+        posted = 0
+        failure: Optional[str] = None
+        for reply in replies:
+            result = await self.post_message(token, channel, reply, thread_ts=head.ts)
+            if not result.ok:
+                failure = result.detail
+                break
+            posted += 1
+        log_event(
+            self._logger,
+            logging.INFO if failure is None else logging.WARNING,
+            "Slack digest thread posted",
+            correlation_id=report.id,
+            extra_fields={"channel": channel, "replies": len(replies), "posted_replies": posted},
+        )
+        if failure is not None:
+            return False, f"thread reply {posted + 1} of {len(replies)} failed: {failure}"
+        return True, "sent"
+
+    async def send_digest_many(
+        self,
+        report: DigestReport,
+        channels: Iterable[str],
+        *,
+        token: Optional[str] = None,
+    ) -> Dict[str, tuple[bool, str]]:
+        """Fan ``report`` out to several channels concurrently."""
+
+        channels = list(dict.fromkeys(channels))
+        results = await asyncio.gather(
+            *(self.send_digest(report, channel, token=token) for channel in channels)
+        )
+        return dict(zip(channels, results))
+
+    async def post_message(
+        self,
+        token: str,
+        channel: str,
+        payload: bytes,
+        *,
+        thread_ts: Optional[str] = None,
+    ) -> SlackPostResult:
+        """``chat.postMessage`` with a pre-encoded JSON object body.
+
+        Rate-limited responses (HTTP 429 or ``ratelimited``) pause the token
+        for ``Retry-After`` seconds and are retried up to ``max_retries`` times.
+        """
+
+        body = _splice(payload, channel, thread_ts)
+        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json; charset=utf-8"}
+        for attempt in range(self._max_retries + 1):
+            await self._limiter.acquire(token, channel)
+            try:
+                async with self._semaphore:
+                    response = await self._client.post(
+                        f"{SLACK_API_URL}/chat.postMessage", headers=headers, content=body
+                    )
+            except httpx.HTTPError as exc:
+                _LOGGER.error("Slack post to %s failed: %s", channel, exc)
+                return SlackPostResult(False, str(exc))
+            data = _json(response)
+            if response.status_code == 429 or data.get("error") == "ratelimited":
+                retry_after = _retry_after(response)
+                self._limiter.pause(token, retry_after)
+                _LOGGER.info("Slack rate limited on %s; retrying in %.1fs", channel, retry_after)
+                continue
+            if response.is_error:
+                return SlackPostResult(False, f"HTTP {response.status_code}")
+            if not data.get("ok", False):
+                return SlackPostResult(False, data.get("error", "Unknown Slack error"))
+            return SlackPostResult(True, "sent", data.get("ts"))
+        return SlackPostResult(False, "ratelimited")
+
+
+def _splice(payload: bytes, channel: str, thread_ts: Optional[str]) -> bytes:
+    # Cached message bodies are JSON objects without routing fields; prepend them.
+    prefix: List[bytes] = [b'{"channel":', json.dumps(channel).encode("utf-8"), b","]
+    if thread_ts:
+        prefix += [b'"thread_ts":', json.dumps(thread_ts).encode("utf-8"), b","]
+    return b"".join(prefix) + payload[1:]
+
+
+def _json(response: httpx.Response) -> Dict[str, Any]:
+    try:
+        data = response.json()
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER_SECONDS)))
+    except ValueError:
+        return DEFAULT_RETRY_AFTER_SECONDS
+
+
+__all__ = [
+    "AsyncSlackClient",
+    "SlackPostResult",
+    "SlackRateLimiter",
+    "get_slack_rate_limiter",
+]
@@ -10,6 +10,8 @@ import httpx
 
 from ..persistence.models import DigestReport
 from ..settings import Settings, get_settings
+from ..shared.client_registry import get_client_registry
+from .rendering import DigestRenderer, RenderFormat, get_digest_renderer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,9 +19,21 @@ _LOGGER = logging.getLogger(__name__)
 class SlackNotifier:
     """Post digest summaries to Slack channels."""
 
-    def __init__(self, settings: Settings | None = None) -> None:
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        client: httpx.Client | None = None,
+        renderer: DigestRenderer | None = None,
+    ) -> None:
         self._settings = settings or get_settings()
-        self._client = httpx.Client(timeout=15)
+        self._http_client = client
+        self._renderer = renderer or get_digest_renderer()
+
+    @property
+    def _client(self) -> httpx.Client:
+        if self._http_client is None:
+            self._http_client = get_client_registry().http_client("slack", timeout=15)
+        return self._http_client
 
     def send_digest(self, report: DigestReport, channel: str | None = None) -> tuple[bool, str]:
         token = self._settings.notifications.slack_bot_token
@@ -30,15 +44,15 @@ class SlackNotifier:
         if not channel:
             return False, "Slack channel not configured"
 
-        message = self._compose_message(report)
         headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json; charset=utf-8",
         }
-        payload = {"channel": channel, "text": message}
         try:
             response = self._client.post(
-                "https://slack.com/api/chat.postMessage", headers=headers, content=json.dumps(payload)
+                "https://slack.com/api/chat.postMessage",
+                headers=headers,
+                content=self._digest_payload(report, channel),
             )
             response.raise_for_status()
             data = response.json()
@@ -78,22 +92,11 @@ class SlackNotifier:
 
         return True, "sent"
 
-    def _compose_message(self, report: DigestReport) -> str:
-        lines = [f"*Syncly Daily Digest – {report.report_date.date()}*", ""]
-        if report.progress_items:
-            lines.append("*Completed*:")
-            for item in report.progress_items:
-                lines.append(f"• {item.owner}: {item.summary}")
-        if report.blockers:
-            lines.append("\n*Blockers*:")
-            for blocker in report.blockers:
-                lines.append(f"• {blocker.owner}: {blocker.reason}")
-        if report.next_actions:
-            lines.append("\n*Next Actions*:")
-            for action in report.next_actions:
-                lines.append(f"• {action.owner}: {action.description}")
-        lines.append(f"\nTeam mood: {report.team_mood.value}")
-        return "\n".join(lines)
+    def _digest_payload(self, report: DigestReport, channel: str) -> bytes:
+        # The cached Block Kit body is a JSON object without the channel; splice the
+        # channel in so every target reuses the same pre-rendered bytes.
+        body = self._renderer.render(report, RenderFormat.SLACK_BLOCKS).body
+        return b'{"channel":' + json.dumps(channel).encode("utf-8") + b"," + body[1:]
 
 
 __all__ = ["SlackNotifier"]
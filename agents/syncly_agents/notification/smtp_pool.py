@@ -0,0 +1,189 @@
+"""Pooled, authenticated SMTP sessions for high-volume digest email."""
+
+from __future__ import annotations
+
+import logging
+import smtplib
+import ssl
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+from typing import Any, Callable, Deque, Optional
+
+from ..settings import NotificationSettings
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SMTP_PORT = 587
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_MAX_MESSAGES_PER_SESSION = 100
+DEFAULT_MAX_IDLE_SECONDS = 60.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class SMTPConfig:
+    host: str
+    port: int = DEFAULT_SMTP_PORT
+    username: Optional[str] = None
+    # Kept out of repr: the config is part of the shared client registry key.
+    password: Optional[str] = field(default=None, repr=False)
+    starttls: bool = True
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+
+    @classmethod
+    def from_settings(cls, notifications: NotificationSettings) -> "SMTPConfig":
+        if not notifications.smtp_host:
+            raise ValueError("SMTP host is not configured")
+        return cls(
+            host=notifications.smtp_host,
+            port=notifications.smtp_port or DEFAULT_SMTP_PORT,
+            username=notifications.smtp_username,
+            password=notifications.smtp_password,
+        )
+
+
+@dataclass
+class _Session:
+    client: Any
+    messages_sent: int = 0
+    last_used: float = 0.0
+
+
+class SMTPConnectionPool:
+    """Reuse logged-in SMTP sessions across messages.
+
+    At most ``max_connections`` sessions exist at once. A session is recycled
+    after ``max_messages_per_session`` messages or ``max_idle_seconds`` of
+    inactivity. A dropped connection (or a 421 reply) discards the session and
+    the message is retried once on a fresh one; per-message rejections such as
+    refused recipients are raised without touching the session.
+    """
+
+    def __init__(
+        self,
+        config: SMTPConfig,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_messages_per_session: int = DEFAULT_MAX_MESSAGES_PER_SESSION,
+        max_idle_seconds: float = DEFAULT_MAX_IDLE_SECONDS,
+        smtp_factory: Callable[..., Any] = smtplib.SMTP,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be positive")
+        self._config = config
+        self._max_messages = max_messages_per_session
+        self._max_idle = max_idle_seconds
+        self._factory = smtp_factory
+        self._clock = clock
+        self._idle: Deque[_Session] = deque()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="syncly-smtp")
+        self._closed = False
+        self.connections_opened = 0
+
+    def __enter__(self) -> "SMTPConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()
+
+    def send(self, message: EmailMessage) -> None:
+        """Send ``message`` on a pooled session, blocking until it is accepted."""
+
+        with self._slots:
+            session = self._acquire()
+            try:
+                session.client.send_message(message)
+            except Exception as exc:
+                if not _should_reconnect(exc):
+                    self._release(session)
+                    raise
+                _LOGGER.info("SMTP session dropped (%s); reconnecting", exc)
+                self._discard(session)
+                session = self._connect()
+                try:
+                    session.client.send_message(message)
+                except Exception:
+                    self._discard(session)
+                    raise
+            session.messages_sent += 1
+            self._release(session)
+
+    def submit(self, message: EmailMessage) -> Future[None]:
+        """Send ``message`` on the pool's background threads."""
+
+        if self._closed:
+            raise RuntimeError("SMTP pool is closed")
+        return self._executor.submit(self.send, message)
+
+    def close(self) -> None:
+        self._closed = True
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            sessions = list(self._idle)
+            self._idle.clear()
+        for session in sessions:
+            self._discard(session)
+
+    def _acquire(self) -> _Session:
+        now = self._clock()
+        while True:
+            with self._lock:
+                session = self._idle.pop() if self._idle else None
+            if session is None:
+                return self._connect()
+            if now - session.last_used <= self._max_idle:
+                return session
+            self._discard(session)
+
+    def _release(self, session: _Session) -> None:
+        if self._closed or session.messages_sent >= self._max_messages:
+            self._discard(session)
+            return
+        session.last_used = self._clock()
+        with self._lock:
+            self._idle.append(session)
+
+    def _connect(self) -> _Session:
+        cfg = self._config
+        client = self._factory(cfg.host, cfg.port, timeout=cfg.timeout)
+        try:
+            if cfg.starttls:
+                client.starttls(context=ssl.create_default_context())
+            if cfg.username and cfg.password:
+                client.login(cfg.username, cfg.password)
+        except Exception:
+            client.close()
+            raise
+        with self._lock:
+            self.connections_opened += 1
+        return _Session(client=client, last_used=self._clock())
+
+    @staticmethod
+    def _discard(session: _Session) -> None:
+        try:
+            session.client.quit()
+        except Exception:
+            try:
+                session.client.close()
+            except Exception:  # pragma: no cover - defensive cleanup
+                pass
+
+
+def _should_reconnect(exc: Exception) -> bool:
+    """True for dropped or unusable sessions, False for per-message rejections."""
+
+    if isinstance(exc, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code == 421
+    return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
+
+
+__all__ = ["SMTPConfig", "SMTPConnectionPool"]
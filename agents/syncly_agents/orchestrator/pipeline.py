@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import argparse
 import logging
 from contextlib import suppress
-from datetime import datetime, UTC
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
 from time import perf_counter
-from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 from uuid import UUID, uuid4
+from zoneinfo import ZoneInfo
 
 from pydantic import ValidationError
 
+from syncly_agents import settings
 from syncly_agents.planning.recommendation_builder import build_action_plan
 from syncly_agents.shared.envelope import (
     build_failure_envelope,
@@ -32,10 +36,19 @@ from syncly_agents.shared.models import (
 from syncly_agents.shared.openrouter_client import AgentInvocationError, OpenRouterAgentClient
 from syncly_agents.summarization.digest_writer import build_summary
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    # The digest pipeline modules are imported where they are used, so the agent
+    # workflow path does not pay for them at cold start.
+    from syncly_agents.notification.delivery import DigestDeliveryEngine
+    from syncly_agents.notification.outbox import NotificationOutbox
+    from syncly_agents.orchestrator.scheduler import DigestScheduler, ScheduleEntry
+    from syncly_agents.persistence.models import DigestReport, NotificationPreference
+
 
 DEFAULT_SUMMARIZER_MODEL = "openrouter/anthropic/claude-3.5-sonnet"
 DEFAULT_PLANNER_MODEL = "openrouter/openai/gpt-4.1-mini"
 DEFAULT_MAX_RETRIES = 1
+DEFAULT_LOOKBACK_HOURS = 24
 
 
 ClientFactory = Callable[[str], OpenRouterAgentClient]
@@ -256,7 +269,226 @@ class AgentWorkflowOrchestrator:
         return self._client_factory(model)
 
     def _default_client_factory(self, model: str) -> OpenRouterAgentClient:
-        return OpenRouterAgentClient(model=model, timeout_seconds=self._stage_timeout_seconds)
+        return OpenRouterAgentClient(
+            model=model,
+            timeout_seconds=self._stage_timeout_seconds,
+            shared_pool=True,
+        )
+
+
+@dataclass
+class PipelineOptions:
+    """Options for the digest pipeline commands exposed by ``main.py``."""
+
+    workspace_id: Optional[str] = None
+    reason: Optional[str] = None
+    schedule: bool = False
+    lookback_hours: int = DEFAULT_LOOKBACK_HOURS
+    outbox: bool = False
+
+
+class DigestPipeline:
+    """Generate, deliver and store the daily digest for a workspace."""
+
+    def __init__(
+        self,
+        repository: Any,
+        delivery: Union[DigestDeliveryEngine, NotificationOutbox],
+        *,
+        lookback: timedelta = timedelta(hours=DEFAULT_LOOKBACK_HOURS),
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._repository = repository
+        self._delivery = delivery
+        self._lookback = lookback
+        self._clock = clock
+        self._logger = logger or get_logger()
+
+    def run_workspace(
+        self,
+        workspace_id: str,
+        *,
+        time_zone: str = "UTC",
+        fire_at: Optional[datetime] = None,
+        preferences: Optional[List[NotificationPreference]] = None,
+    ) -> DigestReport:
+        """Build the digest for the window ending at ``fire_at`` and deliver it."""
+
+        from syncly_agents.persistence.models import DeliveryStatus
+
+        fire_at = fire_at or self._clock()
+        report = self.build_digest(workspace_id, time_zone=time_zone, fire_at=fire_at)
+        delivered = self._delivery.deliver(report, preferences)
+        # A queued delivery (``NotificationOutbox``) stores the pending report itself
+        # and settles it later; storing it again here could overwrite that result.
+        if delivered.delivery_status != DeliveryStatus.PENDING or not delivered.delivery_targets:
+            self._repository.store_digest_report(delivered.model_dump(mode="json"))
+        log_event(
+            self._logger,
+            logging.INFO,
+            "Daily digest generated",
+            correlation_id=delivered.id,
+            extra_fields={
+                "workspace_id": workspace_id,
+                "progress_items": len(delivered.progress_items),
+                "blockers": len(delivered.blockers),
+                "delivery_status": delivered.delivery_status.value,
+            },
+        )
+        return delivered
+
+    def build_digest(
+        self,
+        workspace_id: str,
+        *,
+        time_zone: str = "UTC",
+        fire_at: Optional[datetime] = None,
+    ) -> DigestReport:
+        """Digest for the lookback window ending at ``fire_at`` without delivering it."""
+
+        from syncly_agents.persistence.models import ActivityEvent
+        from syncly_agents.summarization.daily_digest import build_daily_digest
+
+        fire_at = fire_at or self._clock()
+        since = fire_at - self._lookback
+        report_date = fire_at.astimezone(ZoneInfo(time_zone))
+        rows = self._repository.iter_activity_events(
+            workspace_id,
+            since_iso=since.isoformat(),
+            until_iso=fire_at.isoformat(),
+        )
+        events = (ActivityEvent.model_validate(row) for row in rows)
+        return build_daily_digest(
+            workspace_id,
+            events,
+            report_date=report_date,
+            time_zone=time_zone,
+            generated_at=self._clock(),
+        )
+
+    def run_scheduled(self, entry: ScheduleEntry, fire_at: datetime) -> DigestReport:
+        """Scheduler job: deliver only to the preferences registered for this slot."""
+
+        from syncly_agents.persistence.models import NotificationPreference
+
+        rows = self._repository.list_notification_preferences(entry.workspace_id)
+        preferences = [
+            preference
+            for preference in (NotificationPreference.model_validate(row) for row in rows)
+            if (preference.schedule_time, preference.timezone) == (entry.schedule_time, entry.timezone)
+        ]
+        return self.run_workspace(
+            entry.workspace_id, time_zone=entry.timezone, fire_at=fire_at, preferences=preferences
+        )
+
+
+def run_pipeline(
+    options: PipelineOptions,
+    *,
+    repository: Any = None,
+    delivery: Optional[Union[DigestDeliveryEngine, NotificationOutbox]] = None,
+    scheduler_factory: Optional[Callable[..., DigestScheduler]] = None,
+) -> Optional[DigestReport]:
+    """Run one workspace digest now, or block running the digest scheduler."""
+
+    from syncly_agents.notification.delivery import DigestDeliveryEngine
+    from syncly_agents.notification.outbox import NotificationOutbox
+    from syncly_agents.orchestrator.scheduler import DigestScheduler
+    from syncly_agents.persistence.models import NotificationPreference
+
+    if repository is None:
+        from syncly_agents.persistence.repository import create_repository
+
+        # The scheduler re-reads preferences at every fire; serve them from a cache.
+        repository = create_repository(cached=True)
+    if delivery is None:
+        from syncly_agents.notification.email_notifier import EmailNotifier
+        from syncly_agents.notification.slack_notifier import SlackNotifier
+
+        notifiers = {"slack": SlackNotifier(), "email": EmailNotifier(), "repository": repository}
+        if options.outbox:
+            delivery = NotificationOutbox.from_settings(**notifiers)
+        else:
+            delivery = DigestDeliveryEngine(**notifiers)
+    pipeline = DigestPipeline(repository, delivery, lookback=timedelta(hours=options.lookback_hours))
+    logger = get_logger()
+
+    if options.schedule:
+        scheduler = (scheduler_factory or DigestScheduler)(pipeline.run_scheduled)
+        rows = repository.list_all_notification_preferences()
+        preferences = [NotificationPreference.model_validate(row) for row in rows]
+        if options.workspace_id:
+            preferences = [pref for pref in preferences if pref.workspace_id == options.workspace_id]
+        count = scheduler.add_preferences(preferences)
+        log_event(
+            logger,
+            logging.INFO,
+            "Digest scheduler started",
+            correlation_id="scheduler",
+            extra_fields={"entries": count, "next_fire_at": scheduler.next_fire_at()},
+        )
+        try:
+            scheduler.run_forever()
+        except KeyboardInterrupt:  # pragma: no cover - interactive shutdown
+            scheduler.stop()
+        finally:
+            delivery.close()
+            _log_persistence_metrics(logger)
+        return None
+
+    if not options.workspace_id:
+        raise ValueError("workspace_id is required to run a digest")
+    log_event(
+        logger,
+        logging.INFO,
+        "Manual digest run requested",
+        correlation_id=options.workspace_id,
+        extra_fields={"reason": options.reason},
+    )
+    try:
+        return pipeline.run_workspace(
+            options.workspace_id, time_zone=settings.get_settings().workspace_timezone
+        )
+    finally:
+        delivery.close()
+        _log_persistence_metrics(logger)
+
+
+def _log_persistence_metrics(logger: logging.Logger) -> None:
+    from syncly_agents.persistence.instrumentation import get_persistence_metrics
+
+    # Empty unless PERSISTENCE_METRICS instrumented the repository.
+    snapshot = get_persistence_metrics().snapshot()
+    if snapshot:
+        log_event(
+            logger,
+            logging.INFO,
+            "Persistence metrics",
+            correlation_id="persistence",
+            extra_fields={"calls": snapshot},
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Run Syncly digest pipelines.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Generate and deliver one workspace digest now")
+    run.add_argument("--workspace-id", required=True)
+    run.add_argument("--reason", default="manual", help="Free-form reason recorded in the logs")
+
+    schedule = commands.add_parser("schedule", help="Run the timezone-aware digest scheduler")
+    schedule.add_argument("--workspace-id", default=None, help="Only schedule this workspace")
+    schedule.add_argument(
+        "--outbox",
+        action="store_true",
+        help="Queue deliveries in the durable local outbox and retry failures in the background",
+    )
+
+    ingest = commands.add_parser("ingest-log", help="Ingest a manual activity log file")
+    ingest.add_argument("file")
+    return parser
 
 
 def _elapsed_ms(start: float) -> int:
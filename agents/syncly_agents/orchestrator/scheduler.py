@@ -0,0 +1,184 @@
+"""Timezone-aware scheduling of daily digests across workspaces."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, UTC
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from zoneinfo import ZoneInfo
+
+from syncly_agents.persistence.models import NotificationPreference
+from syncly_agents.shared.logging import get_logger, log_event
+
+DEFAULT_MAX_WORKERS = 16
+MAX_IDLE_WAIT_SECONDS = 60.0
+
+DigestJob = Callable[["ScheduleEntry", datetime], Any]
+
+
+@dataclass(frozen=True)
+class ScheduleEntry:
+    workspace_id: str
+    schedule_time: str
+    timezone: str
+
+    @classmethod
+    def from_preference(cls, preference: NotificationPreference) -> "ScheduleEntry":
+        return cls(preference.workspace_id, preference.schedule_time, preference.timezone)
+
+
+@dataclass
+class BucketResult:
+    fire_at: datetime
+    succeeded: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+
+def parse_schedule_time(value: str) -> time:
+    hour, _, minute = value.partition(":")
+    return time(int(hour), int(minute or 0))
+
+
+def next_fire_time(schedule_time: str, timezone: str, after: datetime) -> datetime:
+    """First UTC instant strictly after ``after`` whose local wall time is ``schedule_time``.
+
+    On a spring-forward day a wall time inside the gap fires at the same
+    instant the pre-transition offset implies (e.g. 02:30 becomes 03:30); on a
+    fall-back day an ambiguous wall time fires once, at its first occurrence.
+    """
+
+    zone = ZoneInfo(timezone)
+    wall = parse_schedule_time(schedule_time)
+    local_day: date = after.astimezone(zone).date()
+    for offset in range(3):
+        candidate = datetime.combine(local_day + timedelta(days=offset), wall, tzinfo=zone)
+        fire_at = candidate.astimezone(UTC)
+        if fire_at > after:
+            return fire_at
+    raise ValueError(f"Could not resolve next fire time for {schedule_time} {timezone}")  # pragma: no cover
+
+
+class DigestScheduler:
+    """Min-heap of UTC fire times, each holding the bucket of entries due then.
+
+    Entries whose local schedule maps to the same UTC instant share one bucket;
+    when it is due every workspace in it runs in parallel on a bounded pool, and
+    each entry is rescheduled from its own time zone so DST changes are
+    honoured per team.
+    """
+
+    def __init__(
+        self,
+        job: DigestJob,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self._job = job
+        self._max_workers = max_workers
+        self._clock = clock
+        self._logger = logger or get_logger()
+        self._heap: List[datetime] = []
+        self._buckets: Dict[datetime, Set[ScheduleEntry]] = {}
+        self._scheduled: Set[ScheduleEntry] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def add(self, entry: ScheduleEntry, *, after: Optional[datetime] = None) -> datetime:
+        """Schedule ``entry``; duplicates (same workspace, time and zone) are ignored."""
+
+        fire_at = next_fire_time(entry.schedule_time, entry.timezone, after or self._clock())
+        with self._lock:
+            if entry in self._scheduled:
+                return fire_at
+            self._push(entry, fire_at)
+        return fire_at
+
+    def add_preferences(self, preferences: Iterable[NotificationPreference]) -> int:
+        entries = {ScheduleEntry.from_preference(preference) for preference in preferences}
+        for entry in entries:
+            self.add(entry)
+        return len(entries)
+
+    def next_fire_at(self) -> Optional[datetime]:
+        with self._lock:
+            return self._heap[0] if self._heap else None
+
+    def run_due(self, now: Optional[datetime] = None) -> List[BucketResult]:
+        """Run every bucket due at ``now`` and reschedule its entries."""
+
+        now = now or self._clock()
+        due: List[tuple[datetime, Set[ScheduleEntry]]] = []
+        with self._lock:
+            while self._heap and self._heap[0] <= now:
+                fire_at = heapq.heappop(self._heap)
+                entries = self._buckets.pop(fire_at)
+                self._scheduled.difference_update(entries)
+                due.append((fire_at, entries))
+
+        results = [self._run_bucket(fire_at, entries) for fire_at, entries in due]
+        with self._lock:
+            for _, entries in due:
+                for entry in entries:
+                    if entry not in self._scheduled:
+                        self._push(entry, next_fire_time(entry.schedule_time, entry.timezone, now))
+        return results
+
+    def run_forever(self) -> None:
+        """Block, firing buckets as they come due, until ``stop`` is called."""
+
+        while not self._stop.is_set():
+            self.run_due()
+            upcoming = self.next_fire_at()
+            wait = MAX_IDLE_WAIT_SECONDS
+            if upcoming is not None:
+                wait = min(wait, max(0.0, (upcoming - self._clock()).total_seconds()))
+            self._stop.wait(wait)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _push(self, entry: ScheduleEntry, fire_at: datetime) -> None:
+        bucket = self._buckets.get(fire_at)
+        if bucket is None:
+            bucket = self._buckets[fire_at] = set()
+            heapq.heappush(self._heap, fire_at)
+        bucket.add(entry)
+        self._scheduled.add(entry)
+
+    def _run_bucket(self, fire_at: datetime, entries: Set[ScheduleEntry]) -> BucketResult:
+        result = BucketResult(fire_at=fire_at)
+        ordered = sorted(entries, key=lambda entry: entry.workspace_id)
+        workers = max(1, min(self._max_workers, len(ordered)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="syncly-digest") as pool:
+            futures = [(entry, pool.submit(self._job, entry, fire_at)) for entry in ordered]
+            for entry, future in futures:
+                try:
+                    future.result()
+                except Exception as exc:
+                    result.failed[entry.workspace_id] = str(exc)
+                else:
+                    result.succeeded.append(entry.workspace_id)
+        log_event(
+            self._logger,
+            logging.WARNING if result.failed else logging.INFO,
+            "Digest bucket finished",
+            correlation_id=fire_at.isoformat(),
+            extra_fields={
+                "workspaces": len(ordered),
+                "failed": sorted(result.failed),
+                "lag_seconds": round((self._clock() - fire_at).total_seconds(), 3),
+            },
+        )
+        return result
+
+
+__all__ = ["BucketResult", "DigestScheduler", "ScheduleEntry", "next_fire_time"]
@@ -0,0 +1,326 @@
+"""Columnar Parquet archive of activity events for long-range analytics.
+
+Events are written as zstd-compressed Parquet files partitioned Hive-style by
+``workspace_id`` and ``month`` and then deleted from the hot store; queries push
+workspace, month and column predicates down into the scan so only matching row
+groups are read.
+Requires the optional ``pyarrow`` dependency (``pip install agents[analytics]``).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Set, Tuple
+
+from .models import ActivityEvent
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every ``ActivityEvent`` field; ``workspace_id`` is stored as the partition key.
+ARCHIVE_COLUMNS = (
+    "id",
+    "integration_connection_id",
+    "external_id",
+    "author",
+    "author_id",
+    "content",
+    "task_reference",
+    "timestamp",
+    "status_label",
+    "classification_confidence",
+    "sentiment",
+    "sentiment_confidence",
+    "keywords",
+    "source_url",
+    "ingested_at",
+)
+DEFAULT_BATCH_ROWS = 50_000
+_SENTIMENT_SCORE = {"positive": 1.0, "neutral": 0.0, "negative": -1.0}
+
+
+class EventSource(Protocol):
+    def iter_activity_events(self, workspace_id: str, **kwargs: Any) -> Iterable[dict[str, Any]]: ...
+
+    def delete_activity_events(self, keys: Sequence[Tuple[str, str]]) -> int: ...
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.dataset  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "pyarrow is required for the activity archive; install agents[analytics]"
+        ) from exc
+    return pyarrow
+
+
+def _schema(pa: Any) -> Any:
+    return pa.schema(
+        [
+            ("id", pa.string()),
+            ("integration_connection_id", pa.string()),
+            ("external_id", pa.string()),
+            ("author", pa.string()),
+            ("author_id", pa.string()),
+            ("content", pa.string()),
+            ("task_reference", pa.string()),
+            ("timestamp", pa.timestamp("us", tz="UTC")),
+            ("status_label", pa.string()),
+            ("classification_confidence", pa.float64()),
+            ("sentiment", pa.string()),
+            ("sentiment_confidence", pa.float64()),
+            ("keywords", pa.list_(pa.string())),
+            ("source_url", pa.string()),
+            ("ingested_at", pa.timestamp("us", tz="UTC")),
+        ]
+    )
+
+
+def _partitioning(pa: Any) -> Any:
+    return pa.dataset.partitioning(
+        pa.schema([("workspace_id", pa.string()), ("month", pa.string())]), flavor="hive"
+    )
+
+
+def _parse_timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+@dataclass
+class ArchiveReport:
+    rows: int = 0
+    files: List[Path] = field(default_factory=list)
+    pruned: int = 0
+
+
+class _MonthPartition:
+    """Rows of one ``workspace_id``/``month`` window staged as hidden files."""
+
+    def __init__(self, directory: Path, month: str) -> None:
+        self.directory = directory
+        self.month = month
+        self.batch: List[dict[str, Any]] = []
+        self.staged: List[Path] = []
+        self.ids: Set[str] = set()
+        self.keys: List[Tuple[str, str]] = []
+
+
+class ActivityArchiver:
+    """Compact a workspace's older events into monthly Parquet partitions.
+
+    Each month is one partition window whose files are named ``part-NNNN``.
+    Archiving a month rewrites the whole window: rows already archived for it
+    are merged with the new ones (deduplicated by event id), so re-runs with any
+    ``since`` never count a row twice. Once a window is in place, its rows are
+    deleted from the source (unless ``prune`` is false), which makes this
+    compaction rather than a copy. Pruning is refused unless the archive
+    schema holds every ``ActivityEvent`` field, so no data is lost with it.
+    """
+
+    def __init__(
+        self,
+        source: EventSource,
+        root: str | Path,
+        *,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        compression: str = "zstd",
+        prune: bool = True,
+    ) -> None:
+        missing = set(ActivityEvent.model_fields) - {"workspace_id"} - set(ARCHIVE_COLUMNS)
+        if prune and missing:
+            raise ValueError(f"Cannot prune: archive schema lacks {', '.join(sorted(missing))}")
+        self._source = source
+        self._root = Path(root)
+        self._batch_rows = batch_rows
+        self._compression = compression
+        self._prune = prune
+
+    def archive(
+        self,
+        workspace_id: str,
+        before: datetime,
+        *,
+        since: Optional[datetime] = None,
+    ) -> ArchiveReport:
+        """Stream events older than ``before`` into the archive."""
+
+        pa = _pyarrow()
+        schema = _schema(pa)
+        report = ArchiveReport()
+        partition: Optional[_MonthPartition] = None
+
+        rows = self._source.iter_activity_events(
+            workspace_id,
+            since_iso=since.isoformat() if since else None,
+            until_iso=before.isoformat(),
+            columns=ARCHIVE_COLUMNS,
+        )
+        for row in rows:
+            timestamp = _parse_timestamp(row["timestamp"])
+            month = timestamp.strftime("%Y-%m")
+            if partition is None or partition.month != month:
+                if partition is not None:
+                    self._commit(pa, schema, partition, report)
+                directory = self._root / f"workspace_id={workspace_id}" / f"month={month}"
+                partition = _MonthPartition(directory, month)
+            partition.batch.append(
+                {
+                    **{column: row.get(column) for column in ARCHIVE_COLUMNS},
+                    "timestamp": timestamp,
+                    "keywords": list(row.get("keywords") or []),
+                    "ingested_at": _parse_timestamp(row["ingested_at"]),
+                }
+            )
+            partition.ids.add(row["id"])
+            partition.keys.append((row["integration_connection_id"], row["external_id"]))
+            if len(partition.batch) >= self._batch_rows:
+                self._stage(pa, schema, partition, partition.batch)
+                partition.batch = []
+            report.rows += 1
+        if partition is not None:
+            self._commit(pa, schema, partition, report)
+
+        _LOGGER.info(
+            "Archived %s events for workspace %s into %s files (%s pruned)",
+            report.rows,
+            workspace_id,
+            len(report.files),
+            report.pruned,
+        )
+        return report
+
+    def _stage(
+        self, pa: Any, schema: Any, partition: _MonthPartition, rows: Sequence[dict[str, Any]]
+    ) -> None:
+        # Dot-prefixed files are ignored by dataset scans until they are renamed.
+        partition.directory.mkdir(parents=True, exist_ok=True)
+        path = partition.directory / f".staging-{len(partition.staged):04d}.parquet"
+        table = pa.Table.from_pylist(list(rows), schema=schema)
+        pa.parquet.write_table(table, path, compression=self._compression)
+        partition.staged.append(path)
+
+    def _commit(self, pa: Any, schema: Any, partition: _MonthPartition, report: ArchiveReport) -> None:
+        if partition.batch:
+            self._stage(pa, schema, partition, partition.batch)
+            partition.batch = []
+        existing = sorted(partition.directory.glob("part-*.parquet"))
+        if existing:
+            # Carry over rows archived by earlier runs that this run did not re-read.
+            previous = pa.dataset.dataset([str(path) for path in existing], format="parquet", schema=schema)
+            kept = previous.to_table(filter=~pa.dataset.field("id").isin(list(partition.ids))).to_pylist()
+            carried = list({row["id"]: row for row in kept}.values())
+            for start in range(0, len(carried), self._batch_rows):
+                self._stage(pa, schema, partition, carried[start : start + self._batch_rows])
+
+        files = [partition.directory / f"part-{index:04d}.parquet" for index in range(len(partition.staged))]
+        for staged, final in zip(partition.staged, files):
+            os.replace(staged, final)
+        for stale in existing[len(files) :]:
+            stale.unlink()
+        report.files.extend(files)
+        if self._prune:
+            report.pruned += self._source.delete_activity_events(partition.keys)
+
+
+class ActivityArchive:
+    """Aggregate queries over the Parquet archive with predicate pushdown."""
+
+    def __init__(self, root: str | Path) -> None:
+        self._root = Path(root)
+
+    def aggregate(
+        self,
+        workspace_id: str,
+        *,
+        group_by: Sequence[str],
+        start_month: Optional[str] = None,
+        end_month: Optional[str] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Count events per ``group_by`` key for a workspace and month range.
+
+        ``where`` holds equality predicates on archive columns, e.g.
+        ``{"status_label": "blocked"}``; all predicates are pushed into the scan.
+        """
+
+        pa = _pyarrow()
+        if not self._root.exists():
+            return []
+        schema = _schema(pa).append(pa.field("workspace_id", pa.string())).append(
+            pa.field("month", pa.string())
+        )
+        dataset = pa.dataset.dataset(
+            self._root, format="parquet", schema=schema, partitioning=_partitioning(pa)
+        )
+        expression = pa.dataset.field("workspace_id") == workspace_id
+        if start_month:
+            expression &= pa.dataset.field("month") >= start_month
+        if end_month:
+            expression &= pa.dataset.field("month") <= end_month
+        for column, value in (where or {}).items():
+            expression &= pa.dataset.field(column) == value
+
+        columns = list(dict.fromkeys([*group_by, "id"]))
+        table = dataset.to_table(columns=columns, filter=expression)
+        grouped = table.group_by(list(group_by)).aggregate([("id", "count")])
+        return sorted(
+            ({**row, "count": row.pop("id_count")} for row in grouped.to_pylist()),
+            key=lambda row: tuple(str(row[key]) for key in group_by),
+        )
+
+    def blocker_frequency_by_month(
+        self,
+        workspace_id: str,
+        *,
+        start_month: Optional[str] = None,
+        end_month: Optional[str] = None,
+    ) -> Dict[str, int]:
+        rows = self.aggregate(
+            workspace_id,
+            group_by=["month"],
+            start_month=start_month,
+            end_month=end_month,
+            where={"status_label": "blocked"},
+        )
+        return {row["month"]: row["count"] for row in rows}
+
+    def mood_by_quarter(
+        self,
+        workspace_id: str,
+        *,
+        start_month: Optional[str] = None,
+        end_month: Optional[str] = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """Sentiment counts and mean score (-1..1) per calendar quarter."""
+
+        rows = self.aggregate(
+            workspace_id,
+            group_by=["month", "sentiment"],
+            start_month=start_month,
+            end_month=end_month,
+        )
+        quarters: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for row in rows:
+            year, month = row["month"].split("-")
+            quarter = f"{year}-Q{(int(month) - 1) // 3 + 1}"
+            quarters[quarter][row["sentiment"]] += row["count"]
+        result: Dict[str, Dict[str, float]] = {}
+        for quarter, counts in sorted(quarters.items()):
+            total = sum(counts.values())
+            score = sum(_SENTIMENT_SCORE.get(label, 0.0) * count for label, count in counts.items())
+            result[quarter] = {**counts, "mean_score": round(score / total, 4) if total else 0.0}
+        return result
+
+
+__all__ = ["ARCHIVE_COLUMNS", "ActivityArchive", "ActivityArchiver", "ArchiveReport"]
@@ -0,0 +1,334 @@
+"""Async Supabase persistence over a pooled PostgREST HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional, Sequence
+
+import httpx
+
+from syncly_agents import settings
+
+from .bulk_writer import DEFAULT_MAX_BYTES, DEFAULT_MAX_ROWS, chunk_rows
+from .digest_history import DEFAULT_HISTORY_LIMIT, DIGEST_HEADLINE_COLUMNS, DIGEST_TRENDS_FUNCTION
+from .errors import PersistenceError
+from .pagination import DEFAULT_PAGE_SIZE, KeysetCursor, group_keys, in_filter, select_columns
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_TIMEOUT_SECONDS = 20.0
+_MERGE_REPRESENTATION = "resolution=merge-duplicates,return=representation"
+_MERGE_MINIMAL = "resolution=merge-duplicates,return=minimal"
+_RETURN_REPRESENTATION = "return=representation"
+
+Params = list[tuple[str, str]]
+
+
+@dataclass
+class AsyncSupabaseRepository:
+    """Non-blocking counterpart of ``SupabaseRepository``.
+
+    Talks to PostgREST directly through one ``httpx.AsyncClient`` so every
+    coroutine shares a bounded keep-alive connection pool.
+    """
+
+    client: httpx.AsyncClient
+
+    @classmethod
+    def from_settings(
+        cls,
+        config: Optional[settings.Settings] = None,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> "AsyncSupabaseRepository":
+        cfg = config or settings.get_settings()
+        key = cfg.supabase_service_role_key
+        client = httpx.AsyncClient(
+            base_url=f"{str(cfg.supabase_url).rstrip('/')}/rest/v1",
+            headers={"apikey": key, "Authorization": f"Bearer {key}"},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+        )
+        return cls(client)
+
+    async def __aenter__(self) -> "AsyncSupabaseRepository":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    # Integration Connections -------------------------------------------------
+    async def upsert_integration_connection(self, record: dict[str, Any]) -> dict[str, Any]:
+        rows = await self._upsert(
+            "integration_connections",
+            [record],
+            on_conflict="workspace_id,provider",
+            error="Failed to upsert integration connection",
+        )
+        return (rows or [{}])[0]
+
+    async def list_integration_connections(self, workspace_id: str) -> list[dict[str, Any]]:
+        return await self._select(
+            "integration_connections",
+            [("select", "*"), ("workspace_id", f"eq.{workspace_id}")],
+            error="Failed to list integration connections",
+        )
+
+    # Activity Events ---------------------------------------------------------
+    async def upsert_activity_events(self, events: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not events:
+            return []
+        return await self._upsert(
+            "activity_events",
+            list(events),
+            on_conflict="integration_connection_id,external_id",
+            error="Failed to upsert activity events",
+        )
+
+    async def upsert_activity_events_bulk(
+        self,
+        events: Sequence[dict[str, Any]],
+        *,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_concurrency: int = 4,
+    ) -> int:
+        """Upsert events in bounded chunks concurrently; returns rows written."""
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def send(chunk: list[dict[str, Any]]) -> int:
+            async with semaphore:
+                await self._upsert(
+                    "activity_events",
+                    chunk,
+                    on_conflict="integration_connection_id,external_id",
+                    error="Failed to bulk upsert activity events",
+                    prefer=_MERGE_MINIMAL,
+                )
+            return len(chunk)
+
+        chunks = chunk_rows(events, max_rows=max_rows, max_bytes=max_bytes)
+        try:
+            # TaskGroup cancels the chunks still in flight once one of them fails.
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(send(chunk)) for chunk in chunks]
+        except ExceptionGroup as failed:
+            raise failed.exceptions[0] from None
+        return sum(task.result() for task in tasks)
+
+    async def delete_activity_events(self, keys: Sequence[tuple[str, str]]) -> int:
+        """Delete events by ``(integration_connection_id, external_id)``; returns rows removed."""
+
+        deleted = 0
+        for connection_id, external_ids in group_keys(keys):
+            rows = await self._send(
+                "DELETE",
+                "activity_events",
+                params=[
+                    ("integration_connection_id", f"eq.{connection_id}"),
+                    ("external_id", in_filter(external_ids)),
+                ],
+                headers={"Prefer": _RETURN_REPRESENTATION},
+                error="Failed to delete activity events",
+            )
+            deleted += len(rows)
+        return deleted
+
+    async def fetch_activity_events(
+        self,
+        workspace_id: str,
+        since_iso: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        return [row async for row in self.iter_activity_events(workspace_id, since_iso=since_iso)]
+
+    async def iter_activity_events(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        until_iso: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Async keyset-paginated stream; see ``SupabaseRepository.iter_activity_events``."""
+
+        base: Params = [
+            ("select", select_columns(columns)),
+            ("workspace_id", f"eq.{workspace_id}"),
+            ("order", "timestamp.asc,id.asc"),
+            ("limit", str(page_size)),
+        ]
+        if since_iso:
+            base.append(("timestamp", f"gte.{since_iso}"))
+        if until_iso:
+            base.append(("timestamp", f"lt.{until_iso}"))
+
+        async def fetch_page(cursor: Optional[KeysetCursor]) -> list[dict[str, Any]]:
+            params = list(base)
+            if cursor is not None:
+                params.append(("or", f"({cursor.postgrest_filter()})"))
+            return await self._select("activity_events", params, error="Failed to fetch activity events")
+
+        page = await fetch_page(None)
+        while page:
+            cursor = KeysetCursor.from_row(page[-1]) if len(page) == page_size else None
+            upcoming = asyncio.ensure_future(fetch_page(cursor)) if prefetch and cursor else None
+            try:
+                for row in page:
+                    yield row
+            except BaseException:
+                # Consumer stopped early (aclose/cancel): drop the prefetched page.
+                if upcoming is not None:
+                    upcoming.cancel()
+                raise
+            if upcoming is not None:
+                page = await upcoming
+            elif cursor is not None:
+                page = await fetch_page(cursor)
+            else:
+                page = []
+
+    # Task Status Summaries ---------------------------------------------------
+    async def upsert_task_status_summaries(
+        self, summaries: Sequence[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        if not summaries:
+            return []
+        return await self._upsert(
+            "task_status_summaries",
+            list(summaries),
+            on_conflict="workspace_id,task_reference",
+            error="Failed to upsert task status summaries",
+        )
+
+    async def list_task_status_summaries(self, workspace_id: str) -> list[dict[str, Any]]:
+        return await self._select(
+            "task_status_summaries",
+            [("select", "*"), ("workspace_id", f"eq.{workspace_id}")],
+            error="Failed to list task status summaries",
+        )
+
+    # Digest Reports ----------------------------------------------------------
+    async def store_digest_report(self, report: dict[str, Any]) -> dict[str, Any]:
+        rows = await self._upsert(
+            "digest_reports",
+            [report],
+            on_conflict="workspace_id,report_date",
+            error="Failed to store digest report",
+        )
+        return (rows or [{}])[0]
+
+    async def list_digest_reports(self, workspace_id: str, limit: int = 10) -> list[dict[str, Any]]:
+        return await self._select(
+            "digest_reports",
+            [
+                ("select", "*"),
+                ("workspace_id", f"eq.{workspace_id}"),
+                ("order", "report_date.desc"),
+                ("limit", str(limit)),
+            ],
+            error="Failed to list digest reports",
+        )
+
+    async def list_digest_history(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        params: Params = [
+            ("select", ",".join(DIGEST_HEADLINE_COLUMNS)),
+            ("workspace_id", f"eq.{workspace_id}"),
+        ]
+        if since_iso:
+            params.append(("report_date", f"gte.{since_iso}"))
+        params += [("order", "report_date.desc"), ("limit", str(limit))]
+        return await self._select("digest_reports", params, error="Failed to list digest history")
+
+    async def digest_trends(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        return await self._send(
+            "POST",
+            f"rpc/{DIGEST_TRENDS_FUNCTION}",
+            params=[],
+            json={"p_workspace_id": workspace_id, "p_since": since_iso, "p_limit": limit},
+            error="Failed to aggregate digest trends",
+        )
+
+    # Notification Preferences -------------------------------------------------
+    async def list_notification_preferences(self, workspace_id: str) -> list[dict[str, Any]]:
+        return await self._select(
+            "notification_preferences",
+            [("select", "*"), ("workspace_id", f"eq.{workspace_id}")],
+            error="Failed to list notification preferences",
+        )
+
+    async def list_all_notification_preferences(self) -> list[dict[str, Any]]:
+        return await self._select(
+            "notification_preferences",
+            [("select", "*")],
+            error="Failed to list notification preferences",
+        )
+
+    # Transport ---------------------------------------------------------------
+    async def _select(self, table: str, params: Params, *, error: str) -> list[dict[str, Any]]:
+        return await self._send("GET", table, params=params, error=error)
+
+    async def _upsert(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        *,
+        on_conflict: str,
+        error: str,
+        prefer: str = _MERGE_REPRESENTATION,
+    ) -> list[dict[str, Any]]:
+        return await self._send(
+            "POST",
+            table,
+            params=[("on_conflict", on_conflict)],
+            json=rows,
+            headers={"Prefer": prefer},
+            error=error,
+        )
+
+    async def _send(
+        self,
+        method: str,
+        table: str,
+        *,
+        params: Params,
+        error: str,
+        json: Any = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> list[dict[str, Any]]:
+        try:
+            response = await self.client.request(
+                method, f"/{table}", params=params, json=json, headers=headers
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise PersistenceError(error) from exc
+        if not response.content:
+            return []
+        try:
+            return response.json() or []
+        except ValueError as exc:
+            raise PersistenceError(f"{error}: invalid JSON response") from exc
+
+
+__all__ = ["AsyncSupabaseRepository", "DEFAULT_MAX_CONNECTIONS"]
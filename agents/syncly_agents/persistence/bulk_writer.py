@@ -0,0 +1,172 @@
+"""Chunked, parallel bulk upserts of activity events with failure isolation."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Protocol, Sequence, Tuple
+from uuid import uuid4
+
+from ..shared.logging import get_logger, log_event
+from .errors import PersistenceError
+
+DEFAULT_MAX_ROWS = 500
+DEFAULT_MAX_BYTES = 512 * 1024
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_SECONDS = 0.5
+
+Row = dict[str, Any]
+
+
+class ActivityEventWriter(Protocol):
+    def upsert_activity_events(self, events: Sequence[Row]) -> list[Row]: ...
+
+
+@dataclass
+class BulkWriteReport:
+    """Outcome of a bulk write; ``failed_rows`` holds rows isolated by bisection."""
+
+    rows_written: int = 0
+    chunks_sent: int = 0
+    retries: int = 0
+    failed_rows: List[Row] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def chunk_rows(rows: Iterable[Row], *, max_rows: int, max_bytes: int) -> Iterator[List[Row]]:
+    """Split rows into chunks bounded by row count and encoded JSON size.
+
+    A single row larger than ``max_bytes`` is emitted on its own rather than dropped.
+    """
+
+    chunk: List[Row] = []
+    chunk_bytes = 2  # enclosing brackets
+    for row in rows:
+        row_bytes = len(json.dumps(row, default=str).encode("utf-8")) + 1
+        if chunk and (len(chunk) >= max_rows or chunk_bytes + row_bytes > max_bytes):
+            yield chunk
+            chunk, chunk_bytes = [], 2
+        chunk.append(row)
+        chunk_bytes += row_bytes
+    if chunk:
+        yield chunk
+
+
+class BulkActivityWriter:
+    """Upsert large event backfills in bounded chunks with bounded parallelism.
+
+    Each chunk is retried with exponential backoff. A chunk that keeps failing is
+    bisected (one attempt per half) until the offending rows are isolated, so one
+    bad row costs ``O(log n)`` extra requests instead of the whole chunk.
+    """
+
+    def __init__(
+        self,
+        repository: ActivityEventWriter,
+        *,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        logger: Optional[logging.Logger] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_rows < 1 or max_workers < 1 or max_attempts < 1:
+            raise ValueError("max_rows, max_workers and max_attempts must be positive")
+        self._repository = repository
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_workers = max_workers
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._logger = logger or get_logger()
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def write(self, events: Iterable[Row], *, correlation_id: Optional[str] = None) -> BulkWriteReport:
+        """Upsert ``events`` and return throughput and failure details."""
+
+        correlation_id = correlation_id or str(uuid4())
+        report = BulkWriteReport()
+        start = time.perf_counter()
+        chunks = chunk_rows(events, max_rows=self._max_rows, max_bytes=self._max_bytes)
+        in_flight: Deque[Future[Tuple[int, List[Row]]]] = deque()
+
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="syncly-bulk") as pool:
+            for chunk in chunks:
+                in_flight.append(pool.submit(self._send_chunk, chunk, report))
+                if len(in_flight) >= self._max_workers * 2:
+                    self._collect(in_flight.popleft(), report)
+            while in_flight:
+                self._collect(in_flight.popleft(), report)
+
+        report.elapsed_seconds = time.perf_counter() - start
+        log_event(
+            self._logger,
+            logging.WARNING if report.failed_rows else logging.INFO,
+            "Bulk activity upsert finished",
+            correlation_id=correlation_id,
+            extra_fields={
+                "rows_written": report.rows_written,
+                "rows_failed": len(report.failed_rows),
+                "chunks": report.chunks_sent,
+                "retries": report.retries,
+                "rows_per_second": round(report.rows_per_second, 1),
+            },
+        )
+        return report
+
+    def _collect(self, future: Future[Tuple[int, List[Row]]], report: BulkWriteReport) -> None:
+        written, failed = future.result()
+        report.rows_written += written
+        report.failed_rows.extend(failed)
+
+    def _send_chunk(self, chunk: List[Row], report: BulkWriteReport) -> Tuple[int, List[Row]]:
+        for attempt in range(self._max_attempts):
+            if self._try_upsert(chunk, report):
+                return len(chunk), []
+            if attempt < self._max_attempts - 1:
+                with self._lock:
+                    report.retries += 1
+                record_retry = getattr(self._repository, "record_retry", None)
+                if callable(record_retry):
+                    record_retry("upsert_activity_events")
+                self._sleep(self._backoff_seconds * (2**attempt))
+        return self._bisect(chunk, report)
+
+    def _bisect(self, chunk: List[Row], report: BulkWriteReport) -> Tuple[int, List[Row]]:
+        if len(chunk) == 1:
+            return 0, list(chunk)
+        middle = len(chunk) // 2
+        written, failed = 0, []
+        for half in (chunk[:middle], chunk[middle:]):
+            if self._try_upsert(half, report):
+                written += len(half)
+            else:
+                half_written, half_failed = self._bisect(half, report)
+                written += half_written
+                failed.extend(half_failed)
+        return written, failed
+
+    def _try_upsert(self, rows: List[Row], report: BulkWriteReport) -> bool:
+        with self._lock:
+            report.chunks_sent += 1
+        try:
+            self._repository.upsert_activity_events(rows)
+        except PersistenceError:
+            return False
+        return True
+
+
+__all__ = ["BulkActivityWriter", "BulkWriteReport", "chunk_rows"]
@@ -0,0 +1,191 @@
+"""Read-through caching for rarely changing repository lookups."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Set, TypeVar
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+# Cache key for ``list_all_notification_preferences``; never a workspace id.
+_ALL_WORKSPACES = object()
+
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    expires_at: float
+
+
+class TTLCache(Generic[V]):
+    """Per-key TTL cache with single-flight loads and optional stale-while-revalidate.
+
+    Within ``ttl_seconds`` a cached value is returned as is. For a further
+    ``stale_seconds`` the stale value is still returned immediately while one
+    background refresh runs; after that, callers block on a fresh load.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        *,
+        stale_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._clock = clock
+        self._entries: Dict[Hashable, _Entry[V]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._generations: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get(self, key: Hashable, loader: Callable[[], V]) -> V:
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now < entry.expires_at:
+                return entry.value
+            if now < entry.expires_at + self._stale:
+                self._schedule_refresh(key, loader)
+                return entry.value
+
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() < entry.expires_at:
+                return entry.value
+            return self._load(key, loader)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._entries:
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.clear()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        generation = self._generations.get(key, 0)
+        value = loader()
+        with self._lock:
+            # Skip caching if the key was invalidated while the load was in flight.
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = _Entry(value=value, expires_at=self._clock() + self._ttl)
+        return value
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], V]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="syncly-cache")
+            executor = self._executor
+        executor.submit(self._refresh, key, loader)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], V]) -> None:
+        try:
+            with self._key_lock(key):
+                self._load(key, loader)
+        except Exception as exc:
+            _LOGGER.warning("Background cache refresh failed for %s: %s", key, exc)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+class CachedRepository:
+    """Repository proxy that caches connection and notification-preference reads.
+
+    ``upsert_integration_connection`` and ``upsert_notification_preference``
+    invalidate the workspace's cached rows (and the all-workspace preference
+    list); every other method is delegated to the wrapped repository. Cached
+    rows are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        stale_while_revalidate_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._repository = repository
+        self._connections: TTLCache[list[dict[str, Any]]] = TTLCache(
+            ttl_seconds, stale_seconds=stale_while_revalidate_seconds, clock=clock
+        )
+        self._preferences: TTLCache[list[dict[str, Any]]] = TTLCache(
+            ttl_seconds, stale_seconds=stale_while_revalidate_seconds, clock=clock
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    def list_integration_connections(self, workspace_id: str) -> list[dict[str, Any]]:
+        return list(
+            self._connections.get(
+                workspace_id,
+                lambda: self._repository.list_integration_connections(workspace_id),
+            )
+        )
+
+    def upsert_integration_connection(self, record: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return self._repository.upsert_integration_connection(record)
+        finally:
+            self._connections.invalidate(record.get("workspace_id"))
+
+    def list_notification_preferences(self, workspace_id: str) -> list[dict[str, Any]]:
+        return list(
+            self._preferences.get(
+                workspace_id,
+                lambda: self._repository.list_notification_preferences(workspace_id),
+            )
+        )
+
+    def list_all_notification_preferences(self) -> list[dict[str, Any]]:
+        return list(
+            self._preferences.get(
+                _ALL_WORKSPACES,
+                lambda: self._repository.list_all_notification_preferences(),
+            )
+        )
+
+    def upsert_notification_preference(self, record: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return self._repository.upsert_notification_preference(record)
+        finally:
+            self.invalidate_notification_preferences(record.get("workspace_id"))
+
+    def invalidate_notification_preferences(self, workspace_id: str) -> None:
+        self._preferences.invalidate(workspace_id)
+        self._preferences.invalidate(_ALL_WORKSPACES)
+
+    def close(self) -> None:
+        self._connections.close()
+        self._preferences.close()
+
+
+__all__ = ["CachedRepository", "TTLCache"]
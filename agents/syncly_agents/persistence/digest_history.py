@@ -0,0 +1,39 @@
+"""Projections and aggregates for lightweight digest report history."""
+
+from __future__ import annotations
+
+from importlib import resources
+
+DEFAULT_HISTORY_LIMIT = 90
+DIGEST_HEADLINE_COLUMNS = (
+    "id",
+    "workspace_id",
+    "report_date",
+    "generated_at",
+    "team_mood",
+    "delivery_status",
+)
+DIGEST_TREND_COLUMNS = (
+    "report_date",
+    "team_mood",
+    "delivery_status",
+    "progress_count",
+    "blocker_count",
+    "next_action_count",
+)
+DIGEST_TRENDS_FUNCTION = "digest_trends"
+
+
+def digest_trends_sql() -> str:
+    """Return the migration that defines the ``digest_trends`` Postgres function."""
+
+    return resources.files(__package__).joinpath("sql/digest_trends.sql").read_text()
+
+
+__all__ = [
+    "DEFAULT_HISTORY_LIMIT",
+    "DIGEST_HEADLINE_COLUMNS",
+    "DIGEST_TRENDS_FUNCTION",
+    "DIGEST_TREND_COLUMNS",
+    "digest_trends_sql",
+]
@@ -0,0 +1,10 @@
+"""Errors shared by every persistence backend."""
+
+from __future__ import annotations
+
+
+class PersistenceError(RuntimeError):
+    """Raised when a persistence backend operation fails."""
+
+
+__all__ = ["PersistenceError"]
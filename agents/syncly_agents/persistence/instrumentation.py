@@ -0,0 +1,326 @@
+"""Latency, volume and retry instrumentation for repository calls.
+
+``InstrumentedRepository`` wraps any backend, sync or async, and records, per
+method, a latency histogram, rows (and optionally JSON bytes) moved in each
+direction, errors and retries.
+Every call is also emitted through ``log_event``; ``PersistenceMetrics`` renders
+the aggregates in the OpenMetrics text format for Prometheus scraping.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from ..shared.logging import get_logger, log_event
+from ..shared.metrics import DEFAULT_LATENCY_BUCKETS, Histogram, format_number
+
+DEFAULT_SLOW_CALL_MS = 1000.0
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+_PREFIX = "syncly_persistence"
+
+Labels = Tuple[str, str]
+
+
+class PersistenceMetrics:
+    """Thread-safe registry of per-``(backend, method)`` repository metrics."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._latency: Dict[Labels, Histogram] = {}
+        self._rows: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._bytes: Dict[Tuple[str, str, str], int] = defaultdict(int)
+        self._errors: Dict[Labels, int] = defaultdict(int)
+        self._retries: Dict[Labels, int] = defaultdict(int)
+
+    def observe(
+        self,
+        backend: str,
+        method: str,
+        seconds: float,
+        *,
+        rows_in: int = 0,
+        rows_out: int = 0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        error: bool = False,
+    ) -> None:
+        key = (backend, method)
+        with self._lock:
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self._buckets)
+            histogram.observe(seconds)
+            self._rows[(*key, "in")] += rows_in
+            self._rows[(*key, "out")] += rows_out
+            self._bytes[(*key, "in")] += bytes_in
+            self._bytes[(*key, "out")] += bytes_out
+            if error:
+                self._errors[key] += 1
+
+    def record_retry(self, backend: str, method: str) -> None:
+        with self._lock:
+            self._retries[(backend, method)] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-method totals keyed by ``"backend.method"``, for tests and debugging."""
+
+        with self._lock:
+            result: Dict[str, Dict[str, Any]] = {}
+            for (backend, method), histogram in self._latency.items():
+                key = (backend, method)
+                result[f"{backend}.{method}"] = {
+                    "calls": histogram.count,
+                    "seconds": histogram.total,
+                    "rows_in": self._rows[(*key, "in")],
+                    "rows_out": self._rows[(*key, "out")],
+                    "bytes_in": self._bytes[(*key, "in")],
+                    "bytes_out": self._bytes[(*key, "out")],
+                    "errors": self._errors.get(key, 0),
+                    "retries": self._retries.get(key, 0),
+                }
+            for (backend, method), retries in self._retries.items():
+                result.setdefault(f"{backend}.{method}", {"calls": 0})["retries"] = retries
+            return result
+
+    def render_openmetrics(self) -> str:
+        """Serialise all metrics in the OpenMetrics text exposition format."""
+
+        lines: List[str] = []
+        with self._lock:
+            name = f"{_PREFIX}_call_duration_seconds"
+            lines += [f"# TYPE {name} histogram", f"# UNIT {name} seconds"]
+            for (backend, method), histogram in sorted(self._latency.items()):
+                labels = _labels(backend=backend, method=method)
+                for bound, running in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {running}')
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+                lines.append(f"{name}_sum{{{labels}}} {format_number(histogram.total)}")
+            for metric, values in (("rows", self._rows), ("bytes", self._bytes)):
+                lines.append(f"# TYPE {_PREFIX}_{metric} counter")
+                for (backend, method, direction), value in sorted(values.items()):
+                    labels = _labels(backend=backend, method=method, direction=direction)
+                    lines.append(f"{_PREFIX}_{metric}_total{{{labels}}} {value}")
+            for metric, counts in (("errors", self._errors), ("retries", self._retries)):
+                lines.append(f"# TYPE {_PREFIX}_{metric} counter")
+                for (backend, method), value in sorted(counts.items()):
+                    lines.append(f"{_PREFIX}_{metric}_total{{{_labels(backend=backend, method=method)}}} {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+_DEFAULT_METRICS = PersistenceMetrics()
+
+
+def get_persistence_metrics() -> PersistenceMetrics:
+    """Return the process-wide metrics registry used by default."""
+
+    return _DEFAULT_METRICS
+
+
+class InstrumentedRepository:
+    """Repository proxy that measures every public method call.
+
+    Lists and dicts passed in or returned are counted as rows. Sizing them as
+    JSON bytes re-serialises every payload, so it only happens with
+    ``measure_bytes``. Coroutines are timed until their ``await`` completes, and
+    iterator results (``iter_activity_events``, sync or async) are measured
+    lazily until the caller finishes or abandons them. Calls slower than
+    ``slow_call_ms`` or raising are logged at WARNING, everything else at DEBUG.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        *,
+        metrics: Optional[PersistenceMetrics] = None,
+        backend: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        slow_call_ms: float = DEFAULT_SLOW_CALL_MS,
+        measure_bytes: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._repository = repository
+        self._measure_bytes = measure_bytes
+        self._metrics = metrics or get_persistence_metrics()
+        self._backend = backend or type(repository).__name__
+        self._logger = logger or get_logger()
+        self._slow_call_ms = slow_call_ms
+        self._clock = clock
+
+    @property
+    def metrics(self) -> PersistenceMetrics:
+        return self._metrics
+
+    def record_retry(self, method: str) -> None:
+        """Hook for retrying callers (e.g. ``BulkActivityWriter``)."""
+
+        self._metrics.record_retry(self._backend, method)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        def instrumented(*args: Any, **kwargs: Any) -> Any:
+            rows_in, bytes_in = self._measure_args(args)
+            start = self._clock()
+            try:
+                result = attribute(*args, **kwargs)
+            except Exception:
+                self._record(name, start, rows_in, bytes_in, 0, 0, error=True)
+                raise
+            if inspect.isawaitable(result):
+                return self._measure_awaitable(name, result, start, rows_in, bytes_in)
+            if isinstance(result, Iterator):
+                return self._measure_iterator(name, result, start, rows_in, bytes_in)
+            if isinstance(result, AsyncIterator):
+                return self._measure_async_iterator(name, result, start, rows_in, bytes_in)
+            rows_out, bytes_out = self._measure(result)
+            self._record(name, start, rows_in, bytes_in, rows_out, bytes_out)
+            return result
+
+        instrumented.__name__ = name
+        return instrumented
+
+    async def _measure_awaitable(
+        self, name: str, pending: Awaitable[Any], start: float, rows_in: int, bytes_in: int
+    ) -> Any:
+        try:
+            result = await pending
+        except Exception:
+            self._record(name, start, rows_in, bytes_in, 0, 0, error=True)
+            raise
+        rows_out, bytes_out = self._measure(result)
+        self._record(name, start, rows_in, bytes_in, rows_out, bytes_out)
+        return result
+
+    def _measure_iterator(
+        self, name: str, rows: Iterator[Any], start: float, rows_in: int, bytes_in: int
+    ) -> Iterator[Any]:
+        rows_out = bytes_out = 0
+        error = False
+        try:
+            for row in rows:
+                rows_out += 1
+                if self._measure_bytes:
+                    bytes_out += _json_size(row)
+                yield row
+        except Exception:
+            error = True
+            raise
+        finally:
+            # Also runs when the caller stops early and the generator is closed.
+            self._record(name, start, rows_in, bytes_in, rows_out, bytes_out, error=error)
+
+    async def _measure_async_iterator(
+        self, name: str, rows: AsyncIterator[Any], start: float, rows_in: int, bytes_in: int
+    ) -> AsyncIterator[Any]:
+        rows_out = bytes_out = 0
+        error = False
+        try:
+            async for row in rows:
+                rows_out += 1
+                if self._measure_bytes:
+                    bytes_out += _json_size(row)
+                yield row
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._record(name, start, rows_in, bytes_in, rows_out, bytes_out, error=error)
+
+    def _measure_args(self, args: Sequence[Any]) -> Tuple[int, int]:
+        for arg in args:
+            if isinstance(arg, (list, tuple, dict)):
+                return self._measure(arg)
+        return 0, 0
+
+    def _measure(self, value: Any) -> Tuple[int, int]:
+        if isinstance(value, dict):
+            rows = 1
+        elif isinstance(value, (list, tuple)):
+            rows = len(value)
+        else:
+            return 0, 0
+        return rows, _json_size(value) if self._measure_bytes else 0
+
+    def _record(
+        self,
+        method: str,
+        start: float,
+        rows_in: int,
+        bytes_in: int,
+        rows_out: int,
+        bytes_out: int,
+        *,
+        error: bool = False,
+    ) -> None:
+        seconds = self._clock() - start
+        self._metrics.observe(
+            self._backend,
+            method,
+            seconds,
+            rows_in=rows_in,
+            rows_out=rows_out,
+            bytes_in=bytes_in,
+            bytes_out=bytes_out,
+            error=error,
+        )
+        latency_ms = round(seconds * 1000, 3)
+        slow = latency_ms >= self._slow_call_ms
+        log_event(
+            self._logger,
+            logging.WARNING if error or slow else logging.DEBUG,
+            "Persistence call failed" if error else "Persistence call completed",
+            correlation_id="persistence",
+            extra_fields={
+                "backend": self._backend,
+                "method": method,
+                "latency_ms": latency_ms,
+                "rows_in": rows_in,
+                "rows_out": rows_out,
+                "bytes_in": bytes_in,
+                "bytes_out": bytes_out,
+                "slow": slow,
+            },
+        )
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, default=str, separators=(",", ":")).encode("utf-8"))
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "Histogram",
+    "InstrumentedRepository",
+    "OPENMETRICS_CONTENT_TYPE",
+    "PersistenceMetrics",
+    "get_persistence_metrics",
+]
@@ -0,0 +1,77 @@
+"""Keyset pagination and PostgREST filter helpers shared by the repository backends."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Sequence
+
+DEFAULT_PAGE_SIZE = 1000
+KEYSET_COLUMNS = ("timestamp", "id")
+DELETE_CHUNK_SIZE = 200
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """Position after the last row of a page ordered by ``(timestamp, id)``."""
+
+    timestamp: str
+    id: str
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> "KeysetCursor":
+        return cls(timestamp=str(row["timestamp"]), id=str(row["id"]))
+
+    def postgrest_filter(self) -> str:
+        """Return the PostgREST ``or`` expression selecting rows after this cursor."""
+
+        timestamp = _quote(self.timestamp)
+        row_id = _quote(self.id)
+        return f"timestamp.gt.{timestamp},and(timestamp.eq.{timestamp},id.gt.{row_id})"
+
+
+def select_columns(columns: Optional[Sequence[str]]) -> str:
+    """Build a projection that always carries the keyset columns."""
+
+    if not columns:
+        return "*"
+    selected = list(dict.fromkeys(columns))
+    for column in KEYSET_COLUMNS:
+        if column not in selected:
+            selected.append(column)
+    return ",".join(selected)
+
+
+def group_keys(
+    keys: Sequence[tuple[str, str]], chunk_size: int = DELETE_CHUNK_SIZE
+) -> Iterator[tuple[str, list[str]]]:
+    """Group ``(integration_connection_id, external_id)`` keys into bounded chunks."""
+
+    # PostgREST filters travel in the URL, so keep each ``in.(...)`` list short.
+    grouped: dict[str, list[str]] = {}
+    for connection_id, external_id in keys:
+        grouped.setdefault(connection_id, []).append(external_id)
+    for connection_id, external_ids in grouped.items():
+        for start in range(0, len(external_ids), chunk_size):
+            yield connection_id, external_ids[start : start + chunk_size]
+
+
+def in_filter(values: Sequence[str]) -> str:
+    """Return a PostgREST ``in`` expression matching any of ``values``."""
+
+    return f"in.({','.join(_quote(value) for value in values)})"
+
+
+def _quote(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "DELETE_CHUNK_SIZE",
+    "KEYSET_COLUMNS",
+    "KeysetCursor",
+    "group_keys",
+    "in_filter",
+    "select_columns",
+]
@@ -0,0 +1,126 @@
+"""Backend-agnostic repository protocol and factory."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Protocol, Sequence
+
+from syncly_agents import settings
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .async_repository import AsyncSupabaseRepository
+
+
+class Repository(Protocol):
+    """Synchronous persistence operations shared by every backend."""
+
+    def upsert_integration_connection(self, record: dict[str, Any]) -> dict[str, Any]: ...
+
+    def list_integration_connections(self, workspace_id: str) -> list[dict[str, Any]]: ...
+
+    def upsert_activity_events(self, events: Sequence[dict[str, Any]]) -> list[dict[str, Any]]: ...
+
+    def delete_activity_events(self, keys: Sequence[tuple[str, str]]) -> int: ...
+
+    def fetch_activity_events(
+        self, workspace_id: str, since_iso: Optional[str] = None
+    ) -> list[dict[str, Any]]: ...
+
+    def iter_activity_events(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        until_iso: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        page_size: int = ...,
+        prefetch: bool = ...,
+    ) -> Iterator[dict[str, Any]]: ...
+
+    def upsert_task_status_summaries(
+        self, summaries: Sequence[dict[str, Any]]
+    ) -> list[dict[str, Any]]: ...
+
+    def list_task_status_summaries(self, workspace_id: str) -> list[dict[str, Any]]: ...
+
+    def store_digest_report(self, report: dict[str, Any]) -> dict[str, Any]: ...
+
+    def list_digest_reports(self, workspace_id: str, limit: int = 10) -> list[dict[str, Any]]: ...
+
+    def list_digest_history(
+        self, workspace_id: str, *, since_iso: Optional[str] = None, limit: int = ...
+    ) -> list[dict[str, Any]]: ...
+
+    def digest_trends(
+        self, workspace_id: str, *, since_iso: Optional[str] = None, limit: int = ...
+    ) -> list[dict[str, Any]]: ...
+
+    def list_notification_preferences(self, workspace_id: str) -> list[dict[str, Any]]: ...
+
+    def list_all_notification_preferences(self) -> list[dict[str, Any]]: ...
+
+
+def create_repository(
+    config: Optional[settings.Settings] = None,
+    *,
+    instrumented: Optional[bool] = None,
+    cached: bool = False,
+) -> Repository:
+    """Build the repository selected by ``PERSISTENCE_BACKEND`` (supabase or sqlite).
+
+    With ``instrumented`` every call is measured by ``InstrumentedRepository``;
+    it defaults to the ``PERSISTENCE_METRICS`` setting.
+    With ``cached`` connection and notification-preference reads go through a
+    ``CachedRepository``, outermost so cache hits never reach the backend.
+    """
+
+    cfg = config or settings.get_settings()
+    backend = cfg.persistence_backend.lower()
+    repository: Repository
+    if backend == "sqlite":
+        from .sqlite_repository import SQLiteRepository
+
+        repository = SQLiteRepository.from_settings(cfg)
+    elif backend == "supabase":
+        from .supabase_repository import SupabaseRepository
+
+        repository = SupabaseRepository.from_settings(cfg)
+    else:
+        raise ValueError(f"Unknown persistence backend: {cfg.persistence_backend}")
+    if cfg.persistence_metrics if instrumented is None else instrumented:
+        from .instrumentation import InstrumentedRepository
+
+        repository = InstrumentedRepository(repository, backend=backend)  # type: ignore[assignment]
+    if cached:
+        from .cache import CachedRepository
+
+        repository = CachedRepository(repository)  # type: ignore[assignment]
+    return repository
+
+
+def create_async_repository(
+    config: Optional[settings.Settings] = None,
+    *,
+    instrumented: Optional[bool] = None,
+) -> "AsyncSupabaseRepository":
+    """Build the async counterpart of the backend selected by ``PERSISTENCE_BACKEND``.
+
+    Only ``supabase`` has a non-blocking implementation; the embedded SQLite
+    backend is synchronous and raises ``ValueError`` here. ``instrumented``
+    behaves as in ``create_repository``.
+    """
+
+    cfg = config or settings.get_settings()
+    backend = cfg.persistence_backend.lower()
+    if backend != "supabase":
+        raise ValueError(f"No async repository for persistence backend: {cfg.persistence_backend}")
+    from .async_repository import AsyncSupabaseRepository
+
+    repository = AsyncSupabaseRepository.from_settings(cfg)
+    if cfg.persistence_metrics if instrumented is None else instrumented:
+        from .instrumentation import InstrumentedRepository
+
+        return InstrumentedRepository(repository, backend="supabase_async")  # type: ignore[return-value]
+    return repository
+
+
+__all__ = ["Repository", "create_async_repository", "create_repository"]
@@ -0,0 +1,34 @@
+-- Server-side aggregation backing SupabaseRepository.digest_trends.
+-- Returns one small row per stored digest instead of the full report payload.
+create or replace function public.digest_trends(
+    p_workspace_id text,
+    p_since timestamptz default null,
+    p_limit integer default 90
+)
+returns table (
+    report_date timestamptz,
+    team_mood text,
+    delivery_status text,
+    progress_count integer,
+    blocker_count integer,
+    next_action_count integer
+)
+language sql
+stable
+as $$
+    select
+        d.report_date,
+        d.team_mood::text,
+        d.delivery_status::text,
+        coalesce(jsonb_array_length(d.progress_items), 0),
+        coalesce(jsonb_array_length(d.blockers), 0),
+        coalesce(jsonb_array_length(d.next_actions), 0)
+    from public.digest_reports as d
+    where d.workspace_id = p_workspace_id
+      and (p_since is null or d.report_date >= p_since)
+    order by d.report_date desc
+    limit p_limit;
+$$;
+
+create index if not exists digest_reports_workspace_report_date
+    on public.digest_reports (workspace_id, report_date desc);
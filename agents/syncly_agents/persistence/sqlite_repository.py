@@ -0,0 +1,387 @@
+"""Embedded SQLite persistence backend for offline and high-volume local runs."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import date, datetime, UTC
+from pathlib import Path
+from typing import Any, Iterator, Optional, Sequence
+
+from syncly_agents import settings
+
+from .digest_history import DEFAULT_HISTORY_LIMIT
+from .errors import PersistenceError
+from .pagination import DEFAULT_PAGE_SIZE, KEYSET_COLUMNS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS integration_connections (
+    id TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (workspace_id, provider)
+);
+CREATE TABLE IF NOT EXISTS activity_events (
+    id TEXT NOT NULL,
+    workspace_id TEXT NOT NULL,
+    integration_connection_id TEXT NOT NULL,
+    external_id TEXT NOT NULL,
+    author TEXT,
+    task_reference TEXT,
+    timestamp TEXT NOT NULL,
+    status_label TEXT,
+    sentiment TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (integration_connection_id, external_id)
+);
+CREATE INDEX IF NOT EXISTS activity_events_workspace_timestamp
+    ON activity_events (workspace_id, timestamp, id);
+CREATE TABLE IF NOT EXISTS task_status_summaries (
+    workspace_id TEXT NOT NULL,
+    task_reference TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (workspace_id, task_reference)
+);
+CREATE TABLE IF NOT EXISTS digest_reports (
+    workspace_id TEXT NOT NULL,
+    report_date TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (workspace_id, report_date)
+);
+CREATE TABLE IF NOT EXISTS notification_preferences (
+    id TEXT PRIMARY KEY,
+    workspace_id TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS notification_preferences_workspace
+    ON notification_preferences (workspace_id);
+"""
+
+
+class SQLiteRepository:
+    """Local implementation of the ``Repository`` protocol on SQLite in WAL mode.
+
+    Rows are stored as JSON payloads next to the indexed key columns, so the
+    method contracts match ``SupabaseRepository`` while keyset scans over
+    ``(workspace_id, timestamp, id)`` and upserts on
+    ``(integration_connection_id, external_id)`` stay index-only.
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self._path = str(path)
+        if self._path != ":memory:":
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_settings(cls, config: Optional[settings.Settings] = None) -> "SQLiteRepository":
+        cfg = config or settings.get_settings()
+        return cls(cfg.local_database_path)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> list[dict[str, Any]]:
+        """Run an ad-hoc read query for local analytics."""
+
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params).fetchall()]
+
+    # Integration Connections -------------------------------------------------
+    def upsert_integration_connection(self, record: dict[str, Any]) -> dict[str, Any]:
+        self._write(
+            "Failed to upsert integration connection",
+            """
+            INSERT INTO integration_connections (id, workspace_id, provider, payload)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (workspace_id, provider) DO UPDATE SET
+                id = excluded.id, payload = excluded.payload
+            """,
+            [(record["id"], record["workspace_id"], record["provider"], _dumps(record))],
+        )
+        return record
+
+    def list_integration_connections(self, workspace_id: str) -> list[dict[str, Any]]:
+        return self._payloads(
+            "SELECT payload FROM integration_connections WHERE workspace_id = ?", (workspace_id,)
+        )
+
+    # Activity Events ---------------------------------------------------------
+    def upsert_activity_events(self, events: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not events:
+            return []
+        rows = [
+            (
+                event["id"],
+                event["workspace_id"],
+                event["integration_connection_id"],
+                event["external_id"],
+                event.get("author"),
+                event.get("task_reference"),
+                _utc_iso(event["timestamp"]),
+                event.get("status_label"),
+                event.get("sentiment"),
+                _dumps(event),
+            )
+            for event in events
+        ]
+        self._write(
+            "Failed to upsert activity events",
+            """
+            INSERT INTO activity_events (
+                id, workspace_id, integration_connection_id, external_id, author,
+                task_reference, timestamp, status_label, sentiment, payload
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (integration_connection_id, external_id) DO UPDATE SET
+                id = excluded.id,
+                workspace_id = excluded.workspace_id,
+                author = excluded.author,
+                task_reference = excluded.task_reference,
+                timestamp = excluded.timestamp,
+                status_label = excluded.status_label,
+                sentiment = excluded.sentiment,
+                payload = excluded.payload
+            """,
+            rows,
+        )
+        return list(events)
+
+    def delete_activity_events(self, keys: Sequence[tuple[str, str]]) -> int:
+        """Delete events by ``(integration_connection_id, external_id)``; returns rows removed."""
+
+        if not keys:
+            return 0
+        try:
+            with self._lock, self._conn:
+                cursor = self._conn.executemany(
+                    "DELETE FROM activity_events WHERE integration_connection_id = ? AND external_id = ?",
+                    list(keys),
+                )
+        except sqlite3.Error as exc:
+            raise PersistenceError("Failed to delete activity events") from exc
+        return cursor.rowcount
+
+    def fetch_activity_events(
+        self,
+        workspace_id: str,
+        since_iso: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        return list(self.iter_activity_events(workspace_id, since_iso=since_iso))
+
+    def iter_activity_events(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        until_iso: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Keyset-paginated scan ordered by ``(timestamp, id)``; ``prefetch`` is a no-op."""
+
+        wanted = None
+        if columns:
+            wanted = set(columns) | set(KEYSET_COLUMNS)
+        clauses = ["workspace_id = ?"]
+        params: list[Any] = [workspace_id]
+        if since_iso:
+            clauses.append("timestamp >= ?")
+            params.append(_utc_iso(since_iso))
+        if until_iso:
+            clauses.append("timestamp < ?")
+            params.append(_utc_iso(until_iso))
+        base_sql = "SELECT timestamp, id, payload FROM activity_events WHERE " + " AND ".join(clauses)
+
+        cursor: Optional[tuple[str, str]] = None
+        while True:
+            sql, page_params = base_sql, list(params)
+            if cursor is not None:
+                sql += " AND (timestamp > ? OR (timestamp = ? AND id > ?))"
+                page_params += [cursor[0], cursor[0], cursor[1]]
+            sql += " ORDER BY timestamp, id LIMIT ?"
+            page_params.append(page_size)
+            with self._lock:
+                page = self._conn.execute(sql, page_params).fetchall()
+            for row in page:
+                payload = json.loads(row["payload"])
+                if wanted is not None:
+                    payload = {key: value for key, value in payload.items() if key in wanted}
+                yield payload
+            if len(page) < page_size:
+                return
+            cursor = (page[-1]["timestamp"], page[-1]["id"])
+
+    # Task Status Summaries ---------------------------------------------------
+    def upsert_task_status_summaries(
+        self, summaries: Sequence[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        if not summaries:
+            return []
+        self._write(
+            "Failed to upsert task status summaries",
+            """
+            INSERT INTO task_status_summaries (workspace_id, task_reference, payload)
+            VALUES (?, ?, ?)
+            ON CONFLICT (workspace_id, task_reference) DO UPDATE SET payload = excluded.payload
+            """,
+            [(row["workspace_id"], row["task_reference"], _dumps(row)) for row in summaries],
+        )
+        return list(summaries)
+
+    def list_task_status_summaries(self, workspace_id: str) -> list[dict[str, Any]]:
+        return self._payloads(
+            "SELECT payload FROM task_status_summaries WHERE workspace_id = ?", (workspace_id,)
+        )
+
+    # Digest Reports ----------------------------------------------------------
+    def store_digest_report(self, report: dict[str, Any]) -> dict[str, Any]:
+        self._write(
+            "Failed to store digest report",
+            """
+            INSERT INTO digest_reports (workspace_id, report_date, payload) VALUES (?, ?, ?)
+            ON CONFLICT (workspace_id, report_date) DO UPDATE SET payload = excluded.payload
+            """,
+            [(report["workspace_id"], _report_day(report["report_date"]), _dumps(report))],
+        )
+        return report
+
+    def list_digest_reports(self, workspace_id: str, limit: int = 10) -> list[dict[str, Any]]:
+        return self._payloads(
+            "SELECT payload FROM digest_reports WHERE workspace_id = ? "
+            "ORDER BY report_date DESC LIMIT ?",
+            (workspace_id, limit),
+        )
+
+    def list_digest_history(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        return self._digest_rows(
+            """
+            json_extract(payload, '$.id') AS id,
+            workspace_id,
+            report_date,
+            json_extract(payload, '$.generated_at') AS generated_at,
+            json_extract(payload, '$.team_mood') AS team_mood,
+            json_extract(payload, '$.delivery_status') AS delivery_status
+            """,
+            workspace_id,
+            since_iso,
+            limit,
+        )
+
+    def digest_trends(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        return self._digest_rows(
+            """
+            report_date,
+            json_extract(payload, '$.team_mood') AS team_mood,
+            json_extract(payload, '$.delivery_status') AS delivery_status,
+            coalesce(json_array_length(payload, '$.progress_items'), 0) AS progress_count,
+            coalesce(json_array_length(payload, '$.blockers'), 0) AS blocker_count,
+            coalesce(json_array_length(payload, '$.next_actions'), 0) AS next_action_count
+            """,
+            workspace_id,
+            since_iso,
+            limit,
+        )
+
+    # Notification Preferences -------------------------------------------------
+    def upsert_notification_preference(self, record: dict[str, Any]) -> dict[str, Any]:
+        self._write(
+            "Failed to upsert notification preference",
+            """
+            INSERT INTO notification_preferences (id, workspace_id, payload) VALUES (?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                workspace_id = excluded.workspace_id, payload = excluded.payload
+            """,
+            [(record["id"], record["workspace_id"], _dumps(record))],
+        )
+        return record
+
+    def list_notification_preferences(self, workspace_id: str) -> list[dict[str, Any]]:
+        return self._payloads(
+            "SELECT payload FROM notification_preferences WHERE workspace_id = ?", (workspace_id,)
+        )
+
+    def list_all_notification_preferences(self) -> list[dict[str, Any]]:
+        return self._payloads("SELECT payload FROM notification_preferences", ())
+
+    # Helpers -----------------------------------------------------------------
+    def _write(self, error: str, sql: str, rows: Sequence[Sequence[Any]]) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(sql, rows)
+        except sqlite3.Error as exc:
+            raise PersistenceError(error) from exc
+
+    def _digest_rows(
+        self, projection: str, workspace_id: str, since_iso: Optional[str], limit: int
+    ) -> list[dict[str, Any]]:
+        sql = f"SELECT {projection} FROM digest_reports WHERE workspace_id = ?"
+        params: list[Any] = [workspace_id]
+        if since_iso:
+            sql += " AND report_date >= ?"
+            params.append(_report_day(since_iso))
+        return self.query(sql + " ORDER BY report_date DESC LIMIT ?", [*params, limit])
+
+    def _payloads(self, sql: str, params: Sequence[Any]) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
+
+
+def _dumps(record: dict[str, Any]) -> str:
+    return json.dumps(record, default=_json_default)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def _utc_iso(value: Any) -> str:
+    """Normalise timestamps to UTC ISO strings so they sort lexicographically."""
+
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC).isoformat()
+
+
+def _report_day(value: Any) -> str:
+    """Key digests by calendar day, like the ``date`` column in Supabase."""
+
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).date().isoformat()
+
+
+__all__ = ["SQLiteRepository"]
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Sequence
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
 from supabase import Client, create_client
 
 from syncly_agents import settings
 
-
-class PersistenceError(RuntimeError):
-    """Raised when Supabase operations fail."""
+from .digest_history import (
+    DEFAULT_HISTORY_LIMIT,
+    DIGEST_HEADLINE_COLUMNS,
+    DIGEST_TRENDS_FUNCTION,
+)
+from .errors import PersistenceError
+from .pagination import DEFAULT_PAGE_SIZE, KeysetCursor, group_keys, select_columns
 
 
 @dataclass
@@ -66,23 +71,107 @@ class SupabaseRepository:
             raise PersistenceError("Failed to upsert activity events") from exc
         return response.data or []
 
+    def delete_activity_events(self, keys: Sequence[tuple[str, str]]) -> int:
+        """Delete events by ``(integration_connection_id, external_id)``; returns rows removed."""
+
+        deleted = 0
+        for connection_id, external_ids in group_keys(keys):
+            try:
+                response = (
+                    self.client.table("activity_events")
+                    .delete()
+                    .eq("integration_connection_id", connection_id)
+                    .in_("external_id", external_ids)
+                    .execute()
+                )
+            except Exception as exc:  # pragma: no cover
+                raise PersistenceError("Failed to delete activity events") from exc
+            deleted += len(response.data or [])
+        return deleted
+
     def fetch_activity_events(
         self,
         workspace_id: str,
         since_iso: Optional[str] = None,
     ) -> list[dict[str, Any]]:
+        return list(self.iter_activity_events(workspace_id, since_iso=since_iso))
+
+    def iter_activity_events(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        until_iso: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream events ordered by ``(timestamp, id)`` one keyset page at a time.
+
+        ``columns`` narrows the projection (``timestamp`` and ``id`` are always
+        included for the cursor). With ``prefetch`` the next page is requested while
+        the caller consumes the current one, so memory stays bounded by two pages.
+        """
+
+        projection = select_columns(columns)
+
+        def fetch_page(cursor: Optional[KeysetCursor]) -> list[dict[str, Any]]:
+            try:
+                query = (
+                    self.client.table("activity_events")
+                    .select(projection)
+                    .eq("workspace_id", workspace_id)
+                )
+                if since_iso:
+                    query = query.gte("timestamp", since_iso)
+                if until_iso:
+                    query = query.lt("timestamp", until_iso)
+                if cursor is not None:
+                    query = query.or_(cursor.postgrest_filter())
+                response = query.order("timestamp").order("id").limit(page_size).execute()
+            except Exception as exc:  # pragma: no cover
+                raise PersistenceError("Failed to fetch activity events") from exc
+            return response.data or []
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="syncly-prefetch") as pool:
+            page = fetch_page(None)
+            while page:
+                cursor = KeysetCursor.from_row(page[-1]) if len(page) == page_size else None
+                upcoming = pool.submit(fetch_page, cursor) if prefetch and cursor else None
+                yield from page
+                if upcoming is not None:
+                    page = upcoming.result()
+                elif cursor is not None:
+                    page = fetch_page(cursor)
+                else:
+                    page = []
+
+    # Task Status Summaries ---------------------------------------------------
+    def upsert_task_status_summaries(
+        self, summaries: Sequence[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        if not summaries:
+            return []
         try:
-            query = (
-                self.client.table("activity_events")
+            response = (
+                self.client.table("task_status_summaries")
+                .upsert(list(summaries), on_conflict="workspace_id,task_reference")
+                .execute()
+            )
+        except Exception as exc:  # pragma: no cover
+            raise PersistenceError("Failed to upsert task status summaries") from exc
+        return response.data or []
+
+    def list_task_status_summaries(self, workspace_id: str) -> list[dict[str, Any]]:
+        try:
+            response = (
+                self.client.table("task_status_summaries")
                 .select("*")
                 .eq("workspace_id", workspace_id)
-                .order("timestamp", desc=False)
+                .execute()
             )
-            if since_iso:
-                query = query.gte("timestamp", since_iso)
-            response = query.execute()
         except Exception as exc:  # pragma: no cover
-            raise PersistenceError("Failed to fetch activity events") from exc
+            raise PersistenceError("Failed to list task status summaries") from exc
         return response.data or []
 
     # Digest Reports ----------------------------------------------------------
@@ -111,6 +200,47 @@ class SupabaseRepository:
             raise PersistenceError("Failed to list digest reports") from exc
         return response.data or []
 
+    def list_digest_history(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """Headline fields only (no progress, blocker or delivery payloads)."""
+
+        try:
+            query = (
+                self.client.table("digest_reports")
+                .select(",".join(DIGEST_HEADLINE_COLUMNS))
+                .eq("workspace_id", workspace_id)
+            )
+            if since_iso:
+                query = query.gte("report_date", since_iso)
+            response = query.order("report_date", desc=True).limit(limit).execute()
+        except Exception as exc:  # pragma: no cover
+            raise PersistenceError("Failed to list digest history") from exc
+        return response.data or []
+
+    def digest_trends(
+        self,
+        workspace_id: str,
+        *,
+        since_iso: Optional[str] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> list[dict[str, Any]]:
+        """Per-report mood and item counts aggregated by the ``digest_trends`` function.
+
+        The function is defined in ``persistence/sql/digest_trends.sql``.
+        """
+
+        params = {"p_workspace_id": workspace_id, "p_since": since_iso, "p_limit": limit}
+        try:
+            response = self.client.rpc(DIGEST_TRENDS_FUNCTION, params).execute()
+        except Exception as exc:  # pragma: no cover
+            raise PersistenceError("Failed to aggregate digest trends") from exc
+        return response.data or []
+
     # Notification Preferences -------------------------------------------------
     def list_notification_preferences(self, workspace_id: str) -> list[dict[str, Any]]:
         try:
@@ -123,3 +253,12 @@ class SupabaseRepository:
         except Exception as exc:  # pragma: no cover
             raise PersistenceError("Failed to list notification preferences") from exc
         return response.data or []
+
+    def list_all_notification_preferences(self) -> list[dict[str, Any]]:
+        """Every workspace's preferences, used to seed the digest scheduler."""
+
+        try:
+            response = self.client.table("notification_preferences").select("*").execute()
+        except Exception as exc:  # pragma: no cover
+            raise PersistenceError("Failed to list notification preferences") from exc
+        return response.data or []
@@ -0,0 +1,121 @@
+"""Incremental materialization of ``TaskStatusSummary`` rows from activity events."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Set, Tuple
+from uuid import NAMESPACE_URL, uuid5
+
+from .models import ActivityEvent, StatusLabel, TaskStatusSummary
+
+Row = dict[str, Any]
+
+
+class TaskSummaryStore(Protocol):
+    def list_task_status_summaries(self, workspace_id: str) -> list[Row]: ...
+
+    def upsert_task_status_summaries(self, summaries: Sequence[Row]) -> list[Row]: ...
+
+
+def summary_id(workspace_id: str, task_reference: str) -> str:
+    """Deterministic summary id so replays upsert the same row."""
+
+    return str(uuid5(NAMESPACE_URL, f"syncly:task:{workspace_id}:{task_reference}"))
+
+
+class TaskStatusAggregator:
+    """Keep the latest status per ``task_reference`` up to date as events arrive.
+
+    The in-memory index is keyed by workspace, and only rows whose content changed
+    are marked dirty, so ``flush`` upserts O(changed tasks). Events older than the
+    current latest event for a task are ignored, which makes replays idempotent.
+    """
+
+    def __init__(self, store: Optional[TaskSummaryStore] = None) -> None:
+        self._store = store
+        self._index: Dict[str, Dict[str, TaskStatusSummary]] = {}
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._loaded: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def load(self, workspace_id: str) -> None:
+        """Warm the index for a workspace from the store (once)."""
+
+        if self._store is None or workspace_id in self._loaded:
+            return
+        rows = self._store.list_task_status_summaries(workspace_id)
+        with self._lock:
+            tasks = self._index.setdefault(workspace_id, {})
+            for row in rows:
+                summary = TaskStatusSummary.model_validate(row)
+                current = tasks.get(summary.task_reference)
+                if current is None or current.updated_at <= summary.updated_at:
+                    tasks[summary.task_reference] = summary
+            self._loaded.add(workspace_id)
+
+    def apply(self, events: Iterable[ActivityEvent]) -> List[TaskStatusSummary]:
+        """Fold events into the index and return the summaries that changed."""
+
+        changed: Dict[Tuple[str, str], TaskStatusSummary] = {}
+        for event in events:
+            if not event.task_reference:
+                continue
+            self.load(event.workspace_id)
+            summary = self._apply_one(event)
+            if summary is not None:
+                changed[(event.workspace_id, event.task_reference)] = summary
+        return list(changed.values())
+
+    def summaries(self, workspace_id: str) -> List[TaskStatusSummary]:
+        """Return the current per-task summaries for a workspace."""
+
+        self.load(workspace_id)
+        with self._lock:
+            return list(self._index.get(workspace_id, {}).values())
+
+    def flush(self) -> int:
+        """Upsert dirty summaries to the store; returns the number of rows sent."""
+
+        with self._lock:
+            dirty = [self._index[workspace][task] for workspace, task in self._dirty]
+            self._dirty.clear()
+        if not dirty or self._store is None:
+            return 0
+        try:
+            self._store.upsert_task_status_summaries(
+                [summary.model_dump(mode="json") for summary in dirty]
+            )
+        except Exception:
+            with self._lock:
+                self._dirty.update((summary.workspace_id, summary.task_reference) for summary in dirty)
+            raise
+        return len(dirty)
+
+    def _apply_one(self, event: ActivityEvent) -> Optional[TaskStatusSummary]:
+        task_reference = event.task_reference or ""
+        with self._lock:
+            tasks = self._index.setdefault(event.workspace_id, {})
+            current = tasks.get(task_reference)
+            if current is not None and event.timestamp < current.updated_at:
+                return None
+
+            blocker_reason = event.content if event.status_label == StatusLabel.BLOCKED else None
+            summary = TaskStatusSummary(
+                id=current.id if current else summary_id(event.workspace_id, task_reference),
+                workspace_id=event.workspace_id,
+                task_reference=task_reference,
+                latest_status=event.status_label,
+                owner=event.author,
+                owner_id=event.author_id,
+                latest_event_id=event.id,
+                blocker_reason=blocker_reason,
+                updated_at=event.timestamp,
+            )
+            if current is not None and current == summary:
+                return None
+            tasks[task_reference] = summary
+            self._dirty.add((event.workspace_id, task_reference))
+            return summary
+
+
+__all__ = ["TaskStatusAggregator", "summary_id"]
@@ -0,0 +1,265 @@
+"""Write-behind buffer that micro-batches persistence writes."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Protocol, Sequence, Tuple, Union
+
+from ..shared.logging import get_logger, log_event
+from .models import ActivityEvent, TaskStatusSummary
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH = 500
+DEFAULT_MAX_PENDING = 10_000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_MAX_BACKOFF_SECONDS = 60.0
+DEFAULT_OVERFLOW_TIMEOUT_SECONDS = 0.5
+
+Row = dict[str, Any]
+EventKey = Tuple[str, str]
+SummaryKey = Tuple[str, str]
+
+
+class BufferedRepository(Protocol):
+    def upsert_activity_events(self, events: Sequence[Row]) -> list[Row]: ...
+
+    def upsert_task_status_summaries(self, summaries: Sequence[Row]) -> list[Row]: ...
+
+
+@dataclass
+class BufferMetrics:
+    """Counters describing flush behaviour since the buffer started."""
+
+    flushes: int = 0
+    failed_flushes: int = 0
+    consecutive_failures: int = 0
+    rows_flushed: int = 0
+    rows_coalesced: int = 0
+    rows_dropped: int = 0
+    last_flush_size: int = 0
+    last_flush_latency_ms: float = 0.0
+    max_flush_latency_ms: float = 0.0
+
+
+class WriteBehindBuffer:
+    """Collect event and task-summary writes and persist them in batches.
+
+    Writes are coalesced on ``(integration_connection_id, external_id)`` for events
+    and ``(workspace_id, task_reference)`` for summaries, so only the latest version
+    of a row is sent. A background thread flushes when ``max_batch`` rows are
+    pending or ``flush_interval_seconds`` elapses; ``close`` (also registered with
+    ``atexit``) drains whatever is left.
+
+    After a failed flush the worker backs off exponentially from
+    ``flush_interval_seconds`` up to ``max_backoff_seconds``. At most
+    ``max_pending`` rows are held: a producer adding a new row beyond that waits
+    up to ``overflow_timeout_seconds`` for room, then the row is dropped and
+    counted in ``metrics.rows_dropped``.
+    """
+
+    def __init__(
+        self,
+        repository: BufferedRepository,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        overflow_timeout_seconds: float = DEFAULT_OVERFLOW_TIMEOUT_SECONDS,
+        logger: Optional[logging.Logger] = None,
+        start: bool = True,
+    ) -> None:
+        if max_pending < max_batch:
+            raise ValueError("max_pending must be at least max_batch")
+        self._repository = repository
+        self._max_batch = max_batch
+        self._max_pending = max_pending
+        self._flush_interval = flush_interval_seconds
+        self._max_backoff = max(max_backoff_seconds, flush_interval_seconds)
+        self._overflow_timeout = overflow_timeout_seconds
+        self._in_flight = 0
+        self._retry_at = 0.0
+        self._logger = logger or get_logger()
+        self._events: Dict[EventKey, Row] = {}
+        self._summaries: Dict[SummaryKey, Row] = {}
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self.metrics = BufferMetrics()
+        self._worker: Optional[threading.Thread] = None
+        if start:
+            self._worker = threading.Thread(
+                target=self._run, name="syncly-write-behind", daemon=True
+            )
+            self._worker.start()
+            atexit.register(self.close)
+
+    def __enter__(self) -> "WriteBehindBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[override]
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return self._buffered()
+
+    def add_activity_event(self, event: Union[ActivityEvent, Row]) -> None:
+        row = _as_row(event)
+        self._put(self._events, (row["integration_connection_id"], row["external_id"]), row)
+
+    def add_task_summary(self, summary: Union[TaskStatusSummary, Row]) -> None:
+        row = _as_row(summary)
+        self._put(self._summaries, (row["workspace_id"], row["task_reference"]), row)
+
+    def flush(self) -> int:
+        """Persist everything pending now; returns the number of rows written."""
+
+        with self._flush_lock:
+            with self._condition:
+                events, self._events = self._events, {}
+                summaries, self._summaries = self._summaries, {}
+                size = self._in_flight = len(events) + len(summaries)
+            if not size:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                if events:
+                    self._repository.upsert_activity_events(list(events.values()))
+                    events = {}
+                if summaries:
+                    self._repository.upsert_task_status_summaries(list(summaries.values()))
+            except Exception as exc:
+                # Any failure, not only a PersistenceError, must hand the rows back.
+                self._requeue(events, summaries)
+                self.metrics.failed_flushes += 1
+                self.metrics.consecutive_failures += 1
+                backoff = self.backoff_seconds(self.metrics.consecutive_failures)
+                self._retry_at = time.monotonic() + backoff
+                log_event(
+                    self._logger,
+                    logging.ERROR,
+                    "Write-behind flush failed",
+                    correlation_id="write-behind",
+                    extra_fields={"rows": size, "error": str(exc), "retry_in_seconds": backoff},
+                )
+                return 0
+
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.metrics.consecutive_failures = 0
+            self._record_flush(size, latency_ms)
+            return size
+
+    def backoff_seconds(self, failures: int) -> float:
+        """Delay before the worker retries after ``failures`` consecutive failed flushes."""
+
+        return min(self._max_backoff, self._flush_interval * 2 ** max(0, failures - 1))
+
+    def close(self) -> None:
+        """Stop the background flusher and persist any buffered rows."""
+
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+            atexit.unregister(self.close)
+        self.flush()
+
+    def _put(self, target: Dict[Tuple[str, str], Row], key: Tuple[str, str], row: Row) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("WriteBehindBuffer is closed")
+            if key in target:
+                self.metrics.rows_coalesced += 1
+            elif not self._has_room():
+                self._condition.wait_for(
+                    lambda: self._closed or self._has_room(), timeout=self._overflow_timeout
+                )
+                if self._closed:
+                    raise RuntimeError("WriteBehindBuffer is closed")
+                if not self._has_room():
+                    self._drop()
+                    return
+            target[key] = row
+            if self._buffered() >= self._max_batch:
+                self._condition.notify_all()
+
+    def _buffered(self) -> int:
+        return len(self._events) + len(self._summaries)
+
+    def _has_room(self) -> bool:
+        return self._buffered() + self._in_flight < self._max_pending
+
+    def _drop(self) -> None:
+        self.metrics.rows_dropped += 1
+        if self.metrics.rows_dropped == 1 or self.metrics.rows_dropped % self._max_batch == 0:
+            log_event(
+                self._logger,
+                logging.WARNING,
+                "Write-behind buffer full; dropping rows",
+                correlation_id="write-behind",
+                extra_fields={"dropped": self.metrics.rows_dropped, "max_pending": self._max_pending},
+            )
+
+    def _requeue(self, events: Dict[EventKey, Row], summaries: Dict[SummaryKey, Row]) -> None:
+        # Rows written while the flush was in flight are newer and win.
+        with self._condition:
+            self._events = {**events, **self._events}
+            self._summaries = {**summaries, **self._summaries}
+            self._in_flight = 0
+            self._condition.notify_all()
+
+    def _record_flush(self, size: int, latency_ms: float) -> None:
+        metrics = self.metrics
+        metrics.flushes += 1
+        metrics.rows_flushed += size
+        metrics.last_flush_size = size
+        metrics.last_flush_latency_ms = round(latency_ms, 3)
+        metrics.max_flush_latency_ms = max(metrics.max_flush_latency_ms, metrics.last_flush_latency_ms)
+        log_event(
+            self._logger,
+            logging.DEBUG,
+            "Write-behind flush completed",
+            correlation_id="write-behind",
+            extra_fields={"rows": size, "latency_ms": metrics.last_flush_latency_ms},
+        )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                # While backing off, a full batch must not trigger an early retry.
+                backing_off = self.metrics.consecutive_failures > 0
+                deadline = self._retry_at if backing_off else time.monotonic() + self._flush_interval
+                while not self._closed and (backing_off or self._buffered() < self._max_batch):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as exc:  # pragma: no cover - keep the worker alive
+                _LOGGER.exception("Write-behind worker failed: %s", exc)
+
+
+def _as_row(record: Union[ActivityEvent, TaskStatusSummary, Row]) -> Row:
+    if isinstance(record, dict):
+        return record
+    return record.model_dump(mode="json", by_alias=True)
+
+
+__all__ = ["BufferMetrics", "WriteBehindBuffer"]
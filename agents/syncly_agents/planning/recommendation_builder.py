@@ -31,7 +31,7 @@ def build_action_plan(
     if use_llm:
         from syncly_agents.shared.openrouter_client import AgentInvocationError, OpenRouterAgentClient
 
-        client_instance = client or OpenRouterAgentClient(model=model)
+        client_instance = client or OpenRouterAgentClient(model=model, shared_pool=True)
         try:
             schema = {
                 "type": "object",
@@ -0,0 +1,132 @@
+"""Process-wide registry of lazily constructed network clients.
+
+Classifiers, notifiers and planning agents all talk to a handful of remote
+services. Building an ``OpenAI`` or ``httpx`` client is comparatively expensive
+and every instance owns its own connection pool, so components ask this
+registry for clients on first real use instead of creating them eagerly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+
+import httpx
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from openai import OpenAI
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_HTTP_TIMEOUT_SECONDS = 20.0
+LLM_POOL = "llm"
+
+T = TypeVar("T")
+
+
+class ClientRegistry:
+    """Thread-safe cache of shared clients keyed by their configuration."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._clients: Dict[Hashable, Any] = {}
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the client stored under ``key``, building it on first access."""
+
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+                _LOGGER.debug("Created shared client %s", _label(key))
+        return client
+
+    def http_client(
+        self,
+        pool: str = "default",
+        *,
+        timeout: float = DEFAULT_HTTP_TIMEOUT_SECONDS,
+    ) -> httpx.Client:
+        """Return the shared ``httpx.Client`` backing the named connection pool.
+
+        Each distinct ``timeout`` gets its own client, so callers never inherit
+        the timeout of whoever asked for the pool first.
+        """
+
+        return self.get_or_create(
+            ("http", pool, float(timeout)),
+            lambda: httpx.Client(timeout=timeout),
+        )
+
+    def openai_client(
+        self,
+        *,
+        base_url: str,
+        api_key: str,
+        default_headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> "OpenAI":
+        """Return an ``OpenAI`` client that reuses the shared LLM connection pool."""
+
+        headers: Tuple[Tuple[str, str], ...] = tuple(sorted((default_headers or {}).items()))
+        key = ("openai", str(base_url), _fingerprint(api_key), headers, timeout)
+
+        def _factory() -> "OpenAI":
+            from openai import OpenAI  # deferred: importing the SDK dominates cold start
+
+            kwargs: Dict[str, Any] = {}
+            if timeout is not None:
+                kwargs["timeout"] = timeout
+            return OpenAI(
+                base_url=str(base_url),
+                api_key=api_key,
+                default_headers=dict(headers) or None,
+                http_client=self.http_client(LLM_POOL),
+                **kwargs,
+            )
+
+        return self.get_or_create(key, _factory)
+
+    def close(self) -> None:
+        """Close every registered client and forget it."""
+
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as exc:  # pragma: no cover - defensive cleanup
+                _LOGGER.warning("Failed to close shared client: %s", exc)
+
+
+def _fingerprint(secret: str) -> str:
+    # Keys are logged and kept for the life of the process; never hold the raw secret.
+    return hashlib.blake2b(secret.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _label(key: Hashable) -> str:
+    if isinstance(key, tuple) and key:
+        return str(key[0])
+    return type(key).__name__
+
+
+_REGISTRY = ClientRegistry()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Return the process-wide client registry."""
+
+    return _REGISTRY
+
+
+__all__ = ["ClientRegistry", "LLM_POOL", "get_client_registry"]
@@ -0,0 +1,43 @@
+"""Dependency-free metric primitives shared across Syncly agents."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Iterator, List, Sequence, Tuple
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class Histogram:
+    """Cumulative-bucket latency histogram (seconds)."""
+
+    buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        running = 0
+        for bound, count in zip([*map(format_number, self.buckets), "+Inf"], self.counts):
+            running += count
+            yield bound, running
+
+
+def format_number(value: float) -> str:
+    """Render a sample value the way OpenMetrics expects (always a float)."""
+
+    return repr(float(value))
+
+
+__all__ = ["DEFAULT_LATENCY_BUCKETS", "Histogram", "format_number"]
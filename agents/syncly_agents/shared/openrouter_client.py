@@ -9,6 +9,8 @@ from typing import Any, Dict, Optional, Sequence
 import httpx
 from openai import OpenAI
 
+from .client_registry import get_client_registry
+
 DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
 
 
@@ -25,6 +27,7 @@ class OpenRouterAgentClient:
 		model: str,
 		timeout_seconds: float = 4.0,
 		extra_headers: Optional[Dict[str, str]] = None,
+		shared_pool: bool = False,
 	) -> None:
 		api_key = os.getenv("OPENAI_API_KEY")
 		if not api_key:
@@ -32,8 +35,18 @@ class OpenRouterAgentClient:
 
 		base_url = os.getenv("OPENAI_BASE_URL", DEFAULT_BASE_URL)
 		self._model = model
-		self._http_client = httpx.Client(timeout=timeout_seconds, headers=extra_headers or {})
-		self._client = OpenAI(api_key=api_key, base_url=base_url, http_client=self._http_client)
+		self._http_client: Optional[httpx.Client] = None
+		if shared_pool:
+			# Reuse the process-wide connection pool; the registry owns its lifecycle.
+			self._client = get_client_registry().openai_client(
+				base_url=base_url,
+				api_key=api_key,
+				default_headers=extra_headers,
+				timeout=timeout_seconds,
+			)
+		else:
+			self._http_client = httpx.Client(timeout=timeout_seconds, headers=extra_headers or {})
+			self._client = OpenAI(api_key=api_key, base_url=base_url, http_client=self._http_client)
 
 	def __enter__(self) -> "OpenRouterAgentClient":
 		return self
@@ -46,9 +59,10 @@ class OpenRouterAgentClient:
 		return self._model
 
 	def close(self) -> None:
-		"""Close the underlying HTTP client."""
+		"""Close the underlying HTTP client unless it belongs to the shared pool."""
 
-		self._http_client.close()
+		if self._http_client is not None:
+			self._http_client.close()
 
 	def _build_messages(
 		self,
@@ -0,0 +1,39 @@
+"""Heuristic daily digest built from a workspace's classified activity events."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
+
+from syncly_agents.persistence.models import ActivityEvent, DigestReport
+
+from .incremental_digest import DigestAccumulator, digest_id
+
+
+def build_daily_digest(
+    workspace_id: str,
+    events: Iterable[ActivityEvent],
+    *,
+    report_date: datetime,
+    time_zone: str = "UTC",
+    generated_at: Optional[datetime] = None,
+    delivery_targets: Sequence[str] = (),
+) -> DigestReport:
+    """Summarize the latest status per task plus the overall team mood.
+
+    Events without a ``task_reference`` are treated as standalone tasks. This is
+    the one-shot form of ``DigestAccumulator``; long-running services should keep
+    an ``IncrementalDigestBuilder`` fed instead of re-reading the day.
+    """
+
+    accumulator = DigestAccumulator(workspace_id)
+    accumulator.apply_many(events)
+    return accumulator.build(
+        report_date=report_date,
+        time_zone=time_zone,
+        generated_at=generated_at,
+        delivery_targets=delivery_targets,
+    )
+
+
+__all__ = ["build_daily_digest", "digest_id"]
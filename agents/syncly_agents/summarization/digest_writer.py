@@ -36,7 +36,7 @@ def build_summary(
             OpenRouterAgentClient,
         )
 
-        client_instance = client or OpenRouterAgentClient(model=model)
+        client_instance = client or OpenRouterAgentClient(model=model, shared_pool=True)
         try:
             schema = {
                 "type": "object",
@@ -0,0 +1,258 @@
+"""Incremental daily digests maintained from a stream of activity events.
+
+A ``DigestAccumulator`` folds each ``ActivityEvent`` into per-task digest items
+and a ``MoodAggregator`` as it arrives, so producing a digest no longer re-reads or
+re-classifies the day's events. The window slides forward with ``evict_before``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import NAMESPACE_URL, uuid5
+
+from syncly_agents.persistence.models import (
+    ActivityEvent,
+    DigestBlockerItem,
+    DigestNextAction,
+    DigestProgressItem,
+    DigestReport,
+    SentimentLabel,
+    StatusLabel,
+)
+
+from .mood import MoodAggregator
+
+MAX_ITEM_CHARS = 280
+
+EventKey = Tuple[str, str]
+
+
+def digest_id(workspace_id: str, report_date: datetime) -> str:
+    """Deterministic report id so re-running a day overwrites the same digest."""
+
+    return str(uuid5(NAMESPACE_URL, f"syncly:digest:{workspace_id}:{report_date.date().isoformat()}"))
+
+
+@dataclass(frozen=True)
+class _EventState:
+    timestamp: datetime
+    author: str
+    sentiment: SentimentLabel
+    confidence: float
+    task: str
+
+
+@dataclass(frozen=True)
+class _TaskItem:
+    order: Tuple[datetime, str]
+    event_key: EventKey
+    progress: Optional[DigestProgressItem] = None
+    blocker: Optional[DigestBlockerItem] = None
+    next_action: Optional[DigestNextAction] = None
+
+
+class DigestAccumulator:
+    """Running digest state for one workspace.
+
+    Keeps every event of the window converted to digest items, grouped by task
+    (events without a ``task_reference`` are standalone tasks), and surfaces the
+    latest one per task, plus the decayed team mood of every event in the window.
+    ``apply`` is O(1) amortised unless it edits or moves a task's current event,
+    in which case that task's next-latest event is re-picked. ``build`` only
+    re-orders tasks when something changed since the previous call. Re-applying
+    an edited event replaces its earlier version.
+    """
+
+    def __init__(self, workspace_id: str, mood: Optional[MoodAggregator] = None) -> None:
+        self.workspace_id = workspace_id
+        self.mood = mood or MoodAggregator()
+        self._events: Dict[EventKey, _EventState] = {}
+        self._task_items: Dict[str, Dict[EventKey, _TaskItem]] = {}
+        self._tasks: Dict[str, _TaskItem] = {}
+        self._expiry: List[Tuple[datetime, EventKey]] = []
+        self._ordered: Optional[List[_TaskItem]] = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def apply(self, event: ActivityEvent) -> None:
+        key = (event.integration_connection_id, event.external_id)
+        task = event.task_reference or event.id
+        previous = self._events.get(key)
+        if previous is not None:
+            self._retract_mood(previous)
+            self._remove_item(previous.task, key)
+        self._events[key] = _EventState(
+            event.timestamp, event.author, event.sentiment, event.sentiment_confidence, task
+        )
+        self.mood.add(event.author, event.sentiment, event.sentiment_confidence, event.timestamp)
+        heapq.heappush(self._expiry, (event.timestamp, key))
+
+        item = _task_item(event, key, (event.timestamp, event.id))
+        self._task_items.setdefault(task, {})[key] = item
+        current = self._tasks.get(task)
+        if current is None or current.order <= item.order:
+            self._tasks[task] = item
+            self._ordered = None
+
+    def apply_many(self, events: Iterable[ActivityEvent]) -> None:
+        for event in events:
+            self.apply(event)
+
+    def evict_before(self, since: datetime) -> int:
+        """Drop events older than ``since``; returns how many were removed."""
+
+        evicted = 0
+        while self._expiry and self._expiry[0][0] < since:
+            timestamp, key = heapq.heappop(self._expiry)
+            state = self._events.get(key)
+            if state is None or state.timestamp != timestamp:
+                continue  # superseded by a later edit of the same event
+            del self._events[key]
+            self._retract_mood(state)
+            self._remove_item(state.task, key)
+            evicted += 1
+        return evicted
+
+    def build(
+        self,
+        *,
+        report_date: datetime,
+        time_zone: str = "UTC",
+        generated_at: Optional[datetime] = None,
+        delivery_targets: Sequence[str] = (),
+    ) -> DigestReport:
+        if self._ordered is None:
+            self._ordered = [
+                item
+                for _, item in sorted(
+                    ((item.order[0], task), item) for task, item in self._tasks.items()
+                )
+            ]
+        return DigestReport(
+            id=digest_id(self.workspace_id, report_date),
+            workspace_id=self.workspace_id,
+            report_date=report_date,
+            generated_at=generated_at or datetime.now(UTC),
+            time_zone=time_zone,
+            progress_items=[item.progress for item in self._ordered if item.progress is not None],
+            blockers=[item.blocker for item in self._ordered if item.blocker is not None],
+            next_actions=[item.next_action for item in self._ordered if item.next_action is not None],
+            team_mood=self.mood.team().label,
+            mood_rationale=self.mood.rationale(),
+            delivery_targets=list(delivery_targets),
+        )
+
+    def _retract_mood(self, state: _EventState) -> None:
+        self.mood.remove(state.author, state.sentiment, state.confidence, state.timestamp)
+
+    def _remove_item(self, task: str, key: EventKey) -> None:
+        items = self._task_items.get(task)
+        if items is None or items.pop(key, None) is None:
+            return
+        if self._tasks[task].event_key != key:
+            return
+        # The task's current item went away: fall back to its next-latest event.
+        if items:
+            self._tasks[task] = max(items.values(), key=lambda item: item.order)
+        else:
+            del self._tasks[task]
+            del self._task_items[task]
+        self._ordered = None
+
+
+class IncrementalDigestBuilder:
+    """Thread-safe registry of ``DigestAccumulator`` instances keyed by workspace."""
+
+    def __init__(self) -> None:
+        self._accumulators: Dict[str, DigestAccumulator] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, workspace_id: object) -> bool:
+        with self._lock:
+            return workspace_id in self._accumulators
+
+    def observe(self, events: Iterable[ActivityEvent]) -> int:
+        """Fold newly classified events into their workspaces; returns the count."""
+
+        count = 0
+        with self._lock:
+            for event in events:
+                accumulator = self._accumulators.get(event.workspace_id)
+                if accumulator is None:
+                    accumulator = self._accumulators[event.workspace_id] = DigestAccumulator(event.workspace_id)
+                accumulator.apply(event)
+                count += 1
+        return count
+
+    def seed(self, workspace_id: str, events: Iterable[ActivityEvent]) -> None:
+        """Replace a workspace's state, e.g. from a repository backfill."""
+
+        accumulator = DigestAccumulator(workspace_id)
+        accumulator.apply_many(events)
+        with self._lock:
+            self._accumulators[workspace_id] = accumulator
+
+    def digest(
+        self,
+        workspace_id: str,
+        *,
+        report_date: datetime,
+        since: Optional[datetime] = None,
+        time_zone: str = "UTC",
+        generated_at: Optional[datetime] = None,
+        delivery_targets: Sequence[str] = (),
+    ) -> DigestReport:
+        """Current digest for ``workspace_id`` over events at or after ``since``."""
+
+        with self._lock:
+            accumulator = self._accumulators.get(workspace_id)
+            if accumulator is None:
+                accumulator = self._accumulators[workspace_id] = DigestAccumulator(workspace_id)
+            if since is not None:
+                accumulator.evict_before(since)
+            return accumulator.build(
+                report_date=report_date,
+                time_zone=time_zone,
+                generated_at=generated_at,
+                delivery_targets=delivery_targets,
+            )
+
+    def discard(self, workspace_id: str) -> None:
+        with self._lock:
+            self._accumulators.pop(workspace_id, None)
+
+
+def _task_item(event: ActivityEvent, key: EventKey, order: Tuple[datetime, str]) -> _TaskItem:
+    summary = _truncate(event.content)
+    if event.status_label == StatusLabel.BLOCKED:
+        return _TaskItem(
+            order=order,
+            event_key=key,
+            blocker=DigestBlockerItem(owner=event.author, reason=summary),
+            next_action=DigestNextAction(
+                owner=event.author, description=f"Unblock {event.task_reference or 'update'}"
+            ),
+        )
+    return _TaskItem(
+        order=order,
+        event_key=key,
+        progress=DigestProgressItem(
+            owner=event.author,
+            status=event.status_label,
+            summary=summary,
+            source=event.source_url,
+        ),
+    )
+
+
+def _truncate(text: str) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= MAX_ITEM_CHARS else text[: MAX_ITEM_CHARS - 1] + "…"
+
+
+__all__ = ["DigestAccumulator", "IncrementalDigestBuilder", "digest_id"]
@@ -0,0 +1,210 @@
+"""Streaming team mood from per-event sentiment and classifier confidence.
+
+Each update contributes its sentiment score (+1 positive, 0 neutral, -1
+negative) weighted by ``sentiment_confidence`` and decayed exponentially with
+age. Only a running weighted sum, total weight and reference time are kept per
+author and per workspace, so memory is O(1) per author however many events
+arrive. Contributions are linear, so an edited or expired event can be
+retracted exactly.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+from syncly_agents.persistence.models import SentimentLabel
+
+DEFAULT_HALF_LIFE = timedelta(hours=3)
+DEFAULT_BASELINE_HALF_LIFE = timedelta(hours=24)
+DEFAULT_LABEL_THRESHOLD = 0.15
+DEFAULT_TREND_THRESHOLD = 0.1
+_MIN_WEIGHT = 1e-9
+
+SENTIMENT_SCORES: Dict[SentimentLabel, float] = {
+    SentimentLabel.POSITIVE: 1.0,
+    SentimentLabel.NEUTRAL: 0.0,
+    SentimentLabel.NEGATIVE: -1.0,
+}
+
+
+@dataclass
+class DecayedMean:
+    """Exponentially decayed weighted mean anchored at the newest update seen."""
+
+    half_life_seconds: float
+    total: float = 0.0
+    weight: float = 0.0
+    as_of: Optional[datetime] = None
+
+    def add(self, value: float, weight: float, at: datetime, sign: int = 1) -> None:
+        if self.as_of is None:
+            self.as_of = at
+        if at > self.as_of:
+            factor = self._decay(at - self.as_of)
+            self.total *= factor
+            self.weight *= factor
+            self.as_of = at
+            scale = 1.0
+        else:
+            scale = self._decay(self.as_of - at)
+        self.total += sign * value * weight * scale
+        self.weight += sign * weight * scale
+        if self.weight < _MIN_WEIGHT:
+            self.total = self.weight = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.weight if self.weight >= _MIN_WEIGHT else 0.0
+
+    def _decay(self, age: timedelta) -> float:
+        return math.pow(0.5, age.total_seconds() / self.half_life_seconds)
+
+
+@dataclass
+class _MoodState:
+    recent: DecayedMean
+    baseline: DecayedMean
+    updates: int = 0
+
+    def add(self, score: float, weight: float, at: datetime, sign: int) -> None:
+        self.recent.add(score, weight, at, sign)
+        self.baseline.add(score, weight, at, sign)
+        self.updates += sign
+
+
+@dataclass(frozen=True)
+class MoodSnapshot:
+    label: SentimentLabel
+    score: float
+    baseline: float
+    updates: int
+    weight: float
+
+    @property
+    def trend(self) -> float:
+        return self.score - self.baseline
+
+
+@dataclass
+class MoodAggregator:
+    """Confidence-weighted, exponentially decayed mood per workspace and author.
+
+    ``score`` uses a short half-life and ``baseline`` a long one; their
+    difference is the trend reported in ``rationale``. Not thread-safe; callers
+    such as ``DigestAccumulator`` serialise access.
+    """
+
+    half_life: timedelta = DEFAULT_HALF_LIFE
+    baseline_half_life: timedelta = DEFAULT_BASELINE_HALF_LIFE
+    label_threshold: float = DEFAULT_LABEL_THRESHOLD
+    trend_threshold: float = DEFAULT_TREND_THRESHOLD
+    _team: _MoodState = field(init=False, repr=False)
+    _authors: Dict[str, _MoodState] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._team = self._new_state()
+
+    def add(
+        self,
+        author: str,
+        sentiment: SentimentLabel,
+        confidence: float,
+        at: datetime,
+    ) -> None:
+        self._apply(author, sentiment, confidence, at, 1)
+
+    def remove(
+        self,
+        author: str,
+        sentiment: SentimentLabel,
+        confidence: float,
+        at: datetime,
+    ) -> None:
+        """Retract an update previously passed to ``add`` with the same arguments."""
+
+        self._apply(author, sentiment, confidence, at, -1)
+
+    def team(self) -> MoodSnapshot:
+        return self._snapshot(self._team)
+
+    def author(self, name: str) -> Optional[MoodSnapshot]:
+        state = self._authors.get(name)
+        return self._snapshot(state) if state is not None else None
+
+    def authors(self) -> Dict[str, MoodSnapshot]:
+        return {name: self._snapshot(state) for name, state in self._authors.items()}
+
+    def rationale(self) -> Optional[str]:
+        """One-line explanation of the team mood for ``DigestReport.mood_rationale``."""
+
+        team = self.team()
+        if not team.updates:
+            return None
+        if team.trend >= self.trend_threshold:
+            direction = "rising"
+        elif team.trend <= -self.trend_threshold:
+            direction = "falling"
+        else:
+            direction = "steady"
+        text = (
+            f"Mood {team.score:+.2f} ({direction}, {team.trend:+.2f} vs. baseline) "
+            f"across {team.updates} update{'' if team.updates == 1 else 's'}"
+        )
+        lowest = self._lowest_author()
+        if lowest is not None and lowest[1].label == SentimentLabel.NEGATIVE:
+            text += f"; lowest: {lowest[0]} ({lowest[1].score:+.2f})"
+        return text
+
+    def _apply(
+        self,
+        author: str,
+        sentiment: SentimentLabel,
+        confidence: float,
+        at: datetime,
+        sign: int,
+    ) -> None:
+        score = SENTIMENT_SCORES[sentiment]
+        weight = min(1.0, max(0.0, confidence))
+        self._team.add(score, weight, at, sign)
+        state = self._authors.get(author)
+        if state is None:
+            if sign < 0:
+                return
+            state = self._authors[author] = self._new_state()
+        state.add(score, weight, at, sign)
+        if state.updates <= 0:
+            del self._authors[author]
+
+    def _new_state(self) -> _MoodState:
+        return _MoodState(
+            recent=DecayedMean(self.half_life.total_seconds()),
+            baseline=DecayedMean(self.baseline_half_life.total_seconds()),
+        )
+
+    def _snapshot(self, state: _MoodState) -> MoodSnapshot:
+        score = state.recent.mean
+        if score >= self.label_threshold:
+            label = SentimentLabel.POSITIVE
+        elif score <= -self.label_threshold:
+            label = SentimentLabel.NEGATIVE
+        else:
+            label = SentimentLabel.NEUTRAL
+        return MoodSnapshot(
+            label=label,
+            score=score,
+            baseline=state.baseline.mean,
+            updates=state.updates,
+            weight=state.recent.weight,
+        )
+
+    def _lowest_author(self) -> Optional[Tuple[str, MoodSnapshot]]:
+        snapshots = self.authors()
+        if not snapshots:
+            return None
+        return min(snapshots.items(), key=lambda item: (item[1].score, item[0]))
+
+
+__all__ = ["DecayedMean", "MoodAggregator", "MoodSnapshot", "SENTIMENT_SCORES"]
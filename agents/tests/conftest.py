@@ -10,6 +10,8 @@ from typing import Any, Dict
 import pytest
 from dotenv import load_dotenv
 
+from syncly_agents.settings import Settings
+
 
 AGENT_ROOT = Path(__file__).resolve().parents[1]
 FIXTURES_DIR = AGENT_ROOT / "tests" / "fixtures"
@@ -42,3 +44,17 @@ def project_status_payload() -> Dict[str, Any]:
 	path = FIXTURES_DIR / "project_status.json"
 	with path.open("r", encoding="utf-8") as handle:
 		return json.load(handle)
+
+
+@pytest.fixture()
+def agent_settings() -> Settings:
+	"""Return settings that validate without touching any real service."""
+
+	return Settings(
+		OPENROUTER_API_KEY="test-openrouter-key",
+		OPENAI_BASE_URL="https://openrouter.ai/api/v1",
+		SUPABASE_URL="https://example.supabase.co",
+		SUPABASE_SERVICE_ROLE_KEY="service-role",
+		CONTEXT7_ENDPOINT="https://context7.example.com",
+		CONTEXT7_API_KEY="context7-key",
+	)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from syncly_agents.benchmarks.classification import percentile, run_benchmarks
+
+
+def test_run_benchmarks_reports_tiers_and_accuracy_offline() -> None:
+    reports = {report.name: report for report in run_benchmarks(messages=60, latency_ms=0, jitter_ms=0, error_rate=0)}
+
+    status = reports["status_classifier"]
+    assert status.messages == 60
+    assert status.accuracy == 1.0
+    assert set(status.tier_share) <= {"heuristic", "llm"}
+    assert abs(sum(status.tier_share.values()) - 1.0) < 1e-6
+    assert reports["heuristics"].accuracy == 1.0
+    assert status.messages_per_second > 0
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 95) == 0.0
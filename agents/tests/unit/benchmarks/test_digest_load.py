@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from syncly_agents.benchmarks.digest_load import generate_workspaces, run_load, smtp_stand_in
+
+
+def test_run_load_reports_every_stage_offline() -> None:
+    reports = {
+        report.name: report
+        for report in run_load(
+            workspaces=12,
+            events_per_workspace=15,
+            slack_latency_ms=0,
+            smtp_latency_ms=0,
+            max_workers=4,
+            smtp="memory",
+        )
+    }
+
+    assert list(reports) == ["generate", "render", "deliver", "pipeline"]
+    assert reports["generate"].items == reports["render"].items == 12
+    assert reports["deliver"].items == 12 * 3
+    assert reports["deliver"].errors == 0
+    assert reports["render"].peak_memory_kib > 0
+    assert reports["pipeline"].items_per_second > 0
+
+
+def test_run_load_delivers_through_the_aiosmtpd_sink() -> None:
+    pytest.importorskip("aiosmtpd")
+
+    reports = {
+        report.name: report
+        for report in run_load(
+            workspaces=3,
+            events_per_workspace=5,
+            slack_targets=1,
+            email_targets=2,
+            slack_latency_ms=0,
+            smtp_latency_ms=0,
+            max_workers=4,
+            smtp="aiosmtpd",
+            trace_memory=False,
+        )
+    }
+
+    assert reports["deliver"].items == 3 * 3
+    assert reports["deliver"].errors == 0
+
+
+def test_generated_fleet_is_deterministic_per_seed() -> None:
+    first = generate_workspaces(3, events_per_workspace=5, seed=11)
+    again = generate_workspaces(3, events_per_workspace=5, seed=11)
+
+    assert [ws.events for ws in first] == [ws.events for ws in again]
+    assert [pref.target for pref in first[0].preferences] == ["#team-0-0", "#team-0-1", "lead0@ws0.example.com"]
+    with pytest.raises(ValueError):
+        with smtp_stand_in("carrier-pigeon"):
+            pass
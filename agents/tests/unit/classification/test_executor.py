@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime, UTC
+from typing import Iterator
+
+from syncly_agents.classification.executor import ClassificationExecutor
+from syncly_agents.classification.status_classifier import ClassificationResult
+from syncly_agents.persistence.models import ActivityEvent, SentimentLabel, StatusLabel
+
+
+class _SlowClassifier:
+    def classify(self, update: str) -> ClassificationResult:
+        time.sleep(random.uniform(0, 0.01))
+        status = StatusLabel.DONE if update.endswith("done") else StatusLabel.BLOCKED
+        return ClassificationResult(status=status, confidence=0.9)
+
+
+def _draft(index: int) -> ActivityEvent:
+    now = datetime.now(UTC)
+    return ActivityEvent(
+        id=f"evt-{index}",
+        workspace_id="ws-1",
+        integration_connection_id="conn-1",
+        external_id=str(index),
+        author="Ada",
+        content=f"update {index} {'done' if index % 2 else 'stuck'}",
+        timestamp=now,
+        status_label=StatusLabel.DOING,
+        classification_confidence=0.0,
+        sentiment=SentimentLabel.NEUTRAL,
+        sentiment_confidence=0.0,
+        ingested_at=now,
+    )
+
+
+def test_classify_stream_preserves_order_and_applies_backpressure() -> None:
+    pulled: list[int] = []
+
+    def upstream() -> Iterator[ActivityEvent]:
+        for index in range(40):
+            pulled.append(index)
+            yield _draft(index)
+
+    with ClassificationExecutor(_SlowClassifier(), max_in_flight=4) as executor:
+        results = []
+        for event in executor.classify_stream(upstream()):
+            assert len(pulled) - len(results) <= 4
+            results.append(event)
+
+    assert [event.external_id for event in results] == [str(i) for i in range(40)]
+    assert results[1].status_label == StatusLabel.DONE
+    assert results[0].status_label == StatusLabel.BLOCKED
+    assert all(event.classification_confidence == 0.9 for event in results)
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from syncly_agents.classification.status_classifier import LLM_MAX_OUTPUT_TOKENS, LLMClassifier
+from syncly_agents.persistence.models import StatusLabel
+
+
+class _FakeResponses:
+    def __init__(self, output_text: str) -> None:
+        self.output_text = output_text
+        self.calls: list[dict[str, Any]] = []
+
+    def create(self, **kwargs: Any) -> SimpleNamespace:
+        self.calls.append(kwargs)
+        return SimpleNamespace(output_text=self.output_text)
+
+
+def _classifier(output_text: str) -> tuple[LLMClassifier, _FakeResponses]:
+    responses = _FakeResponses(output_text)
+    settings = SimpleNamespace(openai_model="test-model")
+    return LLMClassifier(settings, client=SimpleNamespace(responses=responses)), responses  # type: ignore[arg-type]
+
+
+def test_llm_classifier_uses_structured_output_and_model_confidence() -> None:
+    classifier, responses = _classifier('{"status": "blocked", "confidence": 0.83}')
+
+    result = classifier.classify("Waiting on legal sign-off")
+
+    assert result is not None
+    assert result.status == StatusLabel.BLOCKED
+    assert result.confidence == 0.83
+    request = responses.calls[0]
+    assert request["max_output_tokens"] == LLM_MAX_OUTPUT_TOKENS
+    assert request["text"]["format"]["type"] == "json_schema"
+
+
+def test_llm_classifier_rejects_labels_outside_schema() -> None:
+    classifier, _ = _classifier('{"status": "maybe", "confidence": 0.9}')
+
+    assert classifier.classify("hmm") is None
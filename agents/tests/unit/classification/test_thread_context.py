@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+from typing import Optional
+
+from syncly_agents.classification.status_classifier import (
+    ClassificationResult,
+    ClassificationTier,
+    StatusClassifier,
+)
+from syncly_agents.classification.thread_context import ThreadContextClassifier
+from syncly_agents.persistence.models import ActivityEvent, SentimentLabel, StatusLabel
+
+
+class _CountingLLM:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def classify(self, message: str) -> Optional[ClassificationResult]:
+        self.prompts.append(message)
+        return ClassificationResult(status=StatusLabel.DONE, confidence=0.8, tier=ClassificationTier.LLM)
+
+
+_START = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+def _event(index: int, content: str, task: str, minutes: int) -> ActivityEvent:
+    return ActivityEvent(
+        id=f"evt-{index}",
+        workspace_id="ws-1",
+        integration_connection_id="conn-1",
+        external_id=str(index),
+        author="Ada",
+        content=content,
+        task_reference=task,
+        timestamp=_START + timedelta(minutes=minutes),
+        status_label=StatusLabel.DOING,
+        classification_confidence=0.0,
+        sentiment=SentimentLabel.NEUTRAL,
+        sentiment_confidence=0.0,
+        ingested_at=_START,
+    )
+
+
+def _classifier() -> tuple[ThreadContextClassifier, _CountingLLM]:
+    llm = _CountingLLM()
+    return ThreadContextClassifier(StatusClassifier(settings=object(), llm=llm)), llm  # type: ignore[arg-type]
+
+
+def test_replies_inherit_label_from_blocked_thread_without_llm_calls() -> None:
+    classifier, llm = _classifier()
+    events = [
+        _event(0, "Blocked on the vendor API key", "ENG-1", 0),
+        _event(1, "yes, same", "ENG-1", 5),
+        _event(2, "+1", "ENG-1", 30),
+    ]
+
+    labelled = classifier.classify_events(events)
+
+    assert [event.status_label for event in labelled] == [StatusLabel.BLOCKED] * 3
+    assert labelled[1].classification_confidence < labelled[0].classification_confidence
+    assert llm.prompts == []
+
+
+def test_ambiguous_thread_costs_one_llm_call_and_keeps_input_order() -> None:
+    classifier, llm = _classifier()
+    events = [
+        _event(0, "went out last night", "OPS-7", 10),
+        _event(1, "nice", "OPS-7", 0),
+        _event(2, "confirmed on my side", "OPS-7", 20),
+    ]
+
+    labelled = classifier.classify_events(events)
+
+    assert [event.external_id for event in labelled] == ["0", "1", "2"]
+    assert {event.status_label for event in labelled} == {StatusLabel.DONE}
+    assert len(llm.prompts) == 1
+    assert llm.prompts[0].splitlines()[0] == "Ada: nice"
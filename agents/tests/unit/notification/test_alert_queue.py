@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+
+from syncly_agents.notification.alert_queue import BlockerAlertQueue
+from syncly_agents.persistence.models import (
+    ActivityEvent,
+    NotificationChannel,
+    NotificationPreference,
+    SentimentLabel,
+    StatusLabel,
+)
+from syncly_agents.persistence.sqlite_repository import SQLiteRepository
+
+_START = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = _START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class _Slack:
+    def __init__(self) -> None:
+        self.posts: list[tuple[str | None, str]] = []
+
+    def send_blocker_alert(self, text, channel=None):
+        self.posts.append((channel, text))
+        return True, "sent"
+
+
+def _event(index: int, task: str, status: StatusLabel = StatusLabel.BLOCKED) -> ActivityEvent:
+    return ActivityEvent(
+        id=f"evt-{index}",
+        workspace_id="ws-1",
+        integration_connection_id="conn-1",
+        external_id=str(index),
+        author="Ada",
+        content=f"waiting on {task} ({index})",
+        task_reference=task,
+        timestamp=_START,
+        status_label=status,
+        classification_confidence=0.9,
+        sentiment=SentimentLabel.NEGATIVE,
+        sentiment_confidence=0.8,
+        ingested_at=_START,
+    )
+
+
+def _repository() -> SQLiteRepository:
+    repository = SQLiteRepository()
+    for target, threshold in (("#eng", 30), ("#leads", 120)):
+        repository.upsert_notification_preference(
+            NotificationPreference(
+                id=target,
+                workspace_id="ws-1",
+                channel=NotificationChannel.SLACK,
+                target=target,
+                schedule_time="09:00",
+                timezone="UTC",
+                escalation_threshold=threshold,
+                created_at=_START,
+                updated_at=_START,
+            ).model_dump(mode="json")
+        )
+    return repository
+
+
+def test_storm_of_blockers_is_deduplicated_and_coalesced() -> None:
+    clock, slack = _Clock(), _Slack()
+    queue = BlockerAlertQueue(slack, _repository(), coalesce_window=timedelta(minutes=5), clock=clock, start=False)
+
+    queue.observe([_event(i, f"ENG-{i % 3}") for i in range(30)])
+    assert queue.tick() == 0
+
+    clock.now += timedelta(minutes=5)
+    assert queue.tick() == 2
+    assert queue.tick() == 0
+
+    channels = [channel for channel, _ in slack.posts]
+    assert channels == ["#eng", "#leads"]
+    text = slack.posts[0][1]
+    assert text.startswith(":rotating_light: *3 new blockers*")
+    assert "(×10)" in text
+    assert queue.metrics.duplicates_suppressed == 27
+    histogram = queue.metrics.detection_to_alert_seconds
+    assert histogram.count == 3 and histogram.total == 3 * 300
+
+
+def test_escalation_waits_for_each_preference_threshold_and_skips_resolved() -> None:
+    clock, slack = _Clock(), _Slack()
+    queue = BlockerAlertQueue(slack, _repository(), coalesce_window=timedelta(minutes=1), clock=clock, start=False)
+    queue.observe([_event(1, "ENG-1"), _event(2, "ENG-2")])
+    clock.now += timedelta(minutes=1)
+    queue.tick()
+    slack.posts.clear()
+
+    queue.observe([_event(3, "ENG-2", StatusLabel.DONE)])
+    clock.now = _START + timedelta(minutes=30)
+    queue.tick()
+    clock.now = _START + timedelta(minutes=90)
+    queue.tick()
+    clock.now = _START + timedelta(minutes=120)
+    queue.tick()
+
+    assert [channel for channel, _ in slack.posts] == ["#eng", "#leads"]
+    assert all("ENG-2" not in text for _, text in slack.posts)
+    assert slack.posts[0][1].startswith(":warning: *Escalation: 1 blocker open for 30+ min*")
+    assert queue.metrics.escalations_sent == 2
+    assert len(queue) == 1
+
+
+def test_settled_blockers_are_parked_and_preferences_are_cached() -> None:
+    clock, slack = _Clock(), _Slack()
+    repository = _repository()
+    reads: list[str] = []
+    original = repository.list_notification_preferences
+
+    def counting(workspace_id):
+        reads.append(workspace_id)
+        return original(workspace_id)
+
+    repository.list_notification_preferences = counting
+    queue = BlockerAlertQueue(
+        slack,
+        repository,
+        coalesce_window=timedelta(minutes=1),
+        blocker_ttl=timedelta(hours=6),
+        clock=clock,
+        start=False,
+    )
+    queue.observe([_event(1, "ENG-1")])
+    for minutes in range(1, 180):
+        clock.now = _START + timedelta(minutes=minutes)
+        queue.tick()
+
+    assert [channel for channel, _ in slack.posts] == ["#eng", "#leads", "#eng", "#leads"]
+    assert reads == ["ws-1"]
+    assert (len(queue), queue._blockers) == (1, {})
+
+    queue.observe([_event(2, "ENG-1")])
+    assert queue.metrics.duplicates_suppressed == 1 and queue._blockers == {}
+
+    clock.now = _START + timedelta(hours=6)
+    queue.tick()
+    assert len(queue) == 0
+
+
+def test_blockers_without_task_reference_are_tracked_per_author_and_escaped() -> None:
+    clock, slack = _Clock(), _Slack()
+    queue = BlockerAlertQueue(slack, coalesce_window=timedelta(minutes=1), clock=clock, start=False)
+    untracked = _event(1, "ENG-1").model_copy(update={"task_reference": None, "content": "blocked on <@U1> & infra"})
+
+    queue.observe([untracked, untracked.model_copy(update={"id": "evt-2"})])
+    clock.now += timedelta(minutes=1)
+    assert queue.tick() == 1
+
+    assert slack.posts == [(None, ":rotating_light: *1 new blocker*\n• Ada: blocked on &lt;@U1&gt; &amp; infra (×2)")]
+    queue.observe([untracked.model_copy(update={"status_label": StatusLabel.DONE})])
+    assert len(queue) == 0
+
+
+def test_failed_alert_targets_are_retried_without_resending_to_the_others() -> None:
+    class _FlakySlack(_Slack):
+        down = {"#leads"}
+
+        def send_blocker_alert(self, text, channel=None):
+            if channel in self.down:
+                return False, "channel_not_found"
+            return super().send_blocker_alert(text, channel)
+
+    clock, slack = _Clock(), _FlakySlack()
+    queue = BlockerAlertQueue(slack, _repository(), coalesce_window=timedelta(minutes=1), clock=clock, start=False)
+    queue.observe([_event(1, "ENG-1")])
+    clock.now += timedelta(minutes=1)
+
+    assert queue.tick() == 1
+    assert queue.tick() == 0
+    slack.down = set()
+    clock.now += timedelta(minutes=1)
+    assert queue.tick() == 1
+    assert queue.tick() == 0
+
+    assert [channel for channel, _ in slack.posts] == ["#eng", "#leads"]
+    assert queue.metrics.failed_sends == 2
+    assert queue.metrics.detection_to_alert_seconds.count == 1
+    assert queue._blockers[("ws-1", "ENG-1")].alerted_targets == {"#eng", "#leads"}
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import gc
+import sqlite3
+import weakref
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from syncly_agents.notification.delivery import delivery_targets
+from syncly_agents.notification.outbox import NotificationOutbox
+from syncly_agents.persistence.models import DeliveryStatus, DigestReport, SentimentLabel
+from syncly_agents.persistence.sqlite_repository import SQLiteRepository
+
+_NOW = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = _NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class _Slack:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.channels: list[str] = []
+
+    def send_digest(self, report, channel=None):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("slack unavailable")
+        self.channels.append(channel)
+        return True, "sent"
+
+
+def _report() -> DigestReport:
+    return DigestReport(
+        id="digest-1",
+        workspace_id="ws-1",
+        report_date=_NOW,
+        generated_at=_NOW,
+        time_zone="UTC",
+        progress_items=[],
+        blockers=[],
+        next_actions=[],
+        team_mood=SentimentLabel.NEUTRAL,
+        delivery_targets=["slack:#eng", "slack:#ops", "email:lead@example.com"],
+    )
+
+
+def test_outbox_retries_with_backoff_dead_letters_and_settles_report() -> None:
+    clock, slack = _Clock(), _Slack(failures=2)
+    repository = SQLiteRepository()
+    outbox = NotificationOutbox(
+        slack=slack,
+        repository=repository,
+        max_attempts=3,
+        base_backoff_seconds=10,
+        jitter=0,
+        clock=clock,
+        start=False,
+    )
+
+    pending = outbox.deliver(_report())
+    assert pending.delivery_status == DeliveryStatus.PENDING
+    assert outbox.deliver(_report()).delivery_targets == pending.delivery_targets
+    assert (outbox.metrics.enqueued, outbox.metrics.duplicates) == (3, 3)
+    assert repository.list_digest_reports("ws-1")[0]["delivery_status"] == "pending"
+
+    assert outbox.drain() == 3
+    assert slack.channels == []
+    assert outbox.drain() == 0
+    assert outbox.backoff_seconds(2) == 20
+
+    clock.now += timedelta(seconds=10)
+    outbox.drain()
+    clock.now += timedelta(seconds=20)
+    outbox.drain()
+
+    assert sorted(slack.channels) == ["#eng", "#ops"]
+    assert outbox.stats() == {"pending": 0, "sending": 0, "sent": 2, "dead": 1}
+    assert (outbox.metrics.sent, outbox.metrics.retried, outbox.metrics.dead) == (2, 4, 1)
+
+    stored = repository.list_digest_reports("ws-1")[0]
+    assert stored["delivery_status"] == "partially_sent"
+    failed = [log for log in stored["delivery_logs"] if log["status"] == "failed"]
+    assert failed == [
+        {
+            "target": "lead@example.com",
+            "channel": "email",
+            "status": "failed",
+            "detail": "No email notifier configured",
+            "sent_at": None,
+        }
+    ]
+
+
+def test_rows_claimed_by_a_crashed_worker_are_redelivered_after_the_lease(tmp_path) -> None:
+    path = tmp_path / "outbox.db"
+    clock = _Clock()
+
+    class _Crash:
+        def send_digest(self, report, channel=None):
+            raise SystemExit("worker killed")
+
+    crashed = NotificationOutbox(path, slack=_Crash(), lease_seconds=60, clock=clock, start=False)
+    crashed.deliver(_report().model_copy(update={"delivery_targets": ["slack:#eng"]}))
+    with pytest.raises(SystemExit):
+        crashed.process_due()
+
+    slack = _Slack()
+    recovered = NotificationOutbox(path, slack=slack, lease_seconds=60, clock=clock, start=False)
+    assert recovered.drain() == 0
+    clock.now += timedelta(seconds=60)
+    assert recovered.drain() == 1
+    assert slack.channels == ["#eng"]
+    assert recovered.stats()["sent"] == 1
+
+
+def test_background_workers_drain_without_blocking_the_caller() -> None:
+    slack = _Slack()
+    with NotificationOutbox(slack=slack, poll_seconds=0.01, workers=2) as outbox:
+        outbox.deliver(_report().model_copy(update={"delivery_targets": ["slack:#eng", "slack:#ops"]}))
+        for _ in range(200):
+            if outbox.stats()["sent"] == 2:
+                break
+            outbox._stop.wait(0.01)
+    assert sorted(slack.channels) == ["#eng", "#ops"]
+
+
+def test_close_releases_the_connection_and_the_atexit_hook() -> None:
+    outbox = NotificationOutbox(slack=_Slack(), poll_seconds=0.01, workers=1)
+    connection = outbox._conn
+    outbox.close()
+    outbox.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("SELECT 1")
+    ref = weakref.ref(outbox)
+    del outbox
+    gc.collect()
+    assert ref() is None
+
+
+def test_settled_reports_are_purged_after_the_retention_period() -> None:
+    clock, slack = _Clock(), _Slack()
+    outbox = NotificationOutbox(slack=slack, max_attempts=1, retention_seconds=3600, clock=clock, start=False)
+    outbox.deliver(_report())
+    outbox.enqueue(_report().model_copy(update={"id": "digest-2"}), [])
+
+    outbox.drain()
+    assert outbox.purge_settled() == 0
+    assert outbox.stats() == {"pending": 0, "sending": 0, "sent": 2, "dead": 1}
+
+    clock.now += timedelta(hours=1)
+    outbox.enqueue(_report().model_copy(update={"id": "digest-3"}), delivery_targets(_report()))
+    assert outbox.purge_settled() == 3
+    assert outbox.stats() == {"pending": 3, "sending": 0, "sent": 0, "dead": 0}
+    with outbox._lock:
+        payloads = outbox._conn.execute("SELECT report_id FROM notification_outbox_reports").fetchall()
+    assert [row["report_id"] for row in payloads] == ["digest-3"]
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, UTC
+
+import httpx
+
+from syncly_agents.notification.rendering import (
+    SLACK_MAX_BLOCKS,
+    SLACK_SECTION_LIMIT,
+    DigestRenderer,
+    RenderFormat,
+    render_slack_blocks,
+)
+from syncly_agents.notification.slack_notifier import SlackNotifier
+from syncly_agents.persistence.models import (
+    DeliveryStatus,
+    DigestBlockerItem,
+    DigestProgressItem,
+    DigestReport,
+    SentimentLabel,
+    StatusLabel,
+)
+from syncly_agents.settings import Settings
+
+_NOW = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+def _report(progress: int = 2, summary: str = "shipped <api>") -> DigestReport:
+    return DigestReport(
+        id="digest-1",
+        workspace_id="ws-1",
+        report_date=_NOW,
+        generated_at=_NOW,
+        time_zone="UTC",
+        progress_items=[
+            DigestProgressItem(owner="Ada", status=StatusLabel.DONE, summary=summary) for _ in range(progress)
+        ],
+        blockers=[DigestBlockerItem(owner="Lin", reason="waiting on keys")],
+        next_actions=[],
+        team_mood=SentimentLabel.POSITIVE,
+        mood_rationale="Updates: 3 positive",
+    )
+
+
+def test_renderer_caches_per_format_and_ignores_delivery_bookkeeping() -> None:
+    renderer = DigestRenderer()
+    report = _report()
+
+    first = renderer.render(report, RenderFormat.HTML)
+    delivered = report.model_copy(update={"delivery_status": DeliveryStatus.SENT})
+    assert renderer.render(delivered, RenderFormat.HTML) is first
+    renderer.render(report, RenderFormat.TEXT)
+    edited = renderer.render(_report(summary="rolled back"), RenderFormat.HTML)
+
+    assert (renderer.hits, renderer.misses) == (1, 3)
+    assert edited.version != first.version
+    assert "shipped &lt;api&gt;" in first.text
+    text = renderer.render(report, RenderFormat.TEXT).text
+    assert text.startswith("Syncly Daily Digest (2025-10-20)\n\nCompleted:\n- Ada: shipped <api>")
+    assert "\nBlockers:\n- Lin: waiting on keys" in text
+
+
+def test_slack_blocks_respect_block_kit_limits() -> None:
+    payload = render_slack_blocks(_report(progress=400, summary="x" * 500))
+
+    blocks = payload["blocks"]
+    assert blocks[0]["type"] == "header"
+    assert len(blocks) <= SLACK_MAX_BLOCKS
+    assert all(len(block["text"]["text"]) <= SLACK_SECTION_LIMIT for block in blocks if block["type"] == "section")
+    assert payload["text"].startswith("*Syncly Daily Digest – 2025-10-20*")
+
+
+def test_slack_mrkdwn_escapes_control_characters() -> None:
+    report = _report(progress=1, summary="shipped <api> & docs").model_copy(update={"mood_rationale": "a > b"})
+
+    payload = render_slack_blocks(report)
+
+    assert "• Ada: shipped &lt;api&gt; &amp; docs" in payload["text"]
+    assert "shipped &lt;api&gt; &amp; docs" in payload["blocks"][1]["text"]["text"]
+    assert payload["blocks"][-1]["elements"][0]["text"].endswith("a &gt; b")
+
+
+def test_renderer_hashes_each_report_once_and_renders_each_key_once(monkeypatch) -> None:
+    from syncly_agents.notification import rendering
+
+    hashed: list[str] = []
+    original = rendering.report_version
+    monkeypatch.setattr(rendering, "report_version", lambda report: hashed.append(report.id) or original(report))
+    started, release = threading.Event(), threading.Event()
+    calls: list[DigestReport] = []
+
+    def slow_render(report: DigestReport) -> bytes:
+        calls.append(report)
+        started.set()
+        release.wait(5)
+        return b"body"
+
+    monkeypatch.setitem(rendering._RENDERERS, RenderFormat.TEXT, slow_render)
+    renderer = DigestRenderer()
+    report = _report()
+    results: list[bytes] = []
+    workers = [
+        threading.Thread(target=lambda: results.append(renderer.render(report, RenderFormat.TEXT).body))
+        for _ in range(4)
+    ]
+    workers[0].start()
+    assert started.wait(5)
+    for worker in workers[1:]:
+        worker.start()
+    assert renderer.render(report, RenderFormat.HTML).format is RenderFormat.HTML  # not blocked by TEXT
+    release.set()
+    for worker in workers:
+        worker.join(5)
+
+    assert results == [b"body"] * 4 and len(calls) == 1
+    assert hashed == ["digest-1"]
+
+
+def test_slack_notifier_reuses_rendered_payload_across_channels(agent_settings: Settings) -> None:
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    renderer = DigestRenderer()
+    cfg = agent_settings.model_copy(update={"slack_bot_token": "xoxb"})
+    notifier = SlackNotifier(cfg, client=httpx.Client(transport=httpx.MockTransport(handler)), renderer=renderer)
+    report = _report()
+
+    for channel in ("#eng", "#ops", '#"quoted"'):
+        assert notifier.send_digest(report, channel=channel) == (True, "sent")
+
+    assert [body["channel"] for body in bodies] == ["#eng", "#ops", '#"quoted"']
+    assert bodies[0]["blocks"] == bodies[2]["blocks"]
+    assert renderer.misses == 1
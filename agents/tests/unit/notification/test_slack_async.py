@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, UTC
+
+import httpx
+
+from syncly_agents.notification.rendering import SLACK_MAX_BLOCKS, SLACK_MESSAGE_LIMIT, DigestRenderer
+from syncly_agents.notification.slack_async import AsyncSlackClient, SlackRateLimiter
+from syncly_agents.persistence.models import (
+    DigestBlockerItem,
+    DigestProgressItem,
+    DigestReport,
+    SentimentLabel,
+    StatusLabel,
+)
+
+_NOW = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+def _report(progress: int) -> DigestReport:
+    return DigestReport(
+        id="digest-1",
+        workspace_id="ws-1",
+        report_date=_NOW,
+        generated_at=_NOW,
+        time_zone="UTC",
+        progress_items=[
+            DigestProgressItem(owner="Ada", status=StatusLabel.DONE, summary=f"{i} " + "x" * 400)
+            for i in range(progress)
+        ],
+        blockers=[DigestBlockerItem(owner="Lin", reason="waiting on keys")],
+        next_actions=[],
+        team_mood=SentimentLabel.POSITIVE,
+    )
+
+
+def _client(handler, renderer=None, limiter=None) -> AsyncSlackClient:
+    return AsyncSlackClient(
+        "xoxb-test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        renderer=renderer or DigestRenderer(),
+        limiter=limiter or SlackRateLimiter(messages_per_second=1000, burst=1000),
+    )
+
+
+def test_large_digest_posts_compact_message_and_threaded_sections() -> None:
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        ts = f"{body['channel']}-{body.get('thread_ts', 'top')}"
+        return httpx.Response(200, json={"ok": True, "ts": ts})
+
+    renderer = DigestRenderer()
+
+    async def scenario() -> dict:
+        async with _client(handler, renderer) as client:
+            return await client.send_digest_many(_report(progress=1200), ["#eng", "#ops", "#eng"])
+
+    results = asyncio.run(scenario())
+
+    assert results == {"#eng": (True, "sent"), "#ops": (True, "sent")}
+    assert renderer.misses == 1
+    eng = [body for body in bodies if body["channel"] == "#eng"]
+    top, replies = eng[0], eng[1:]
+    assert "thread_ts" not in top
+    assert top["text"] == "Syncly Daily Digest – 2025-10-20: Completed: 1200 · Blockers: 1"
+    assert len(replies) > 2
+    assert {reply["thread_ts"] for reply in replies} == {"#eng-top"}
+    first_items = [
+        int(reply["blocks"][0]["text"]["text"].split("• Ada: ")[1].split()[0])
+        for reply in replies
+        if reply["text"].startswith("Completed")
+    ]
+    assert first_items == sorted(first_items) and replies[-1]["text"] == "Blockers (1)"
+    for reply in replies:
+        assert len(reply["blocks"]) <= SLACK_MAX_BLOCKS
+        assert sum(len(block["text"]["text"]) for block in reply["blocks"]) <= SLACK_MESSAGE_LIMIT
+    sent_items = sum(block["text"]["text"].count("• Ada") for reply in replies for block in reply["blocks"])
+    assert sent_items == 1200
+
+
+def test_retry_after_pauses_the_token_and_retries() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content).get("thread_ts", "top"))
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"}, json={"ok": False, "error": "ratelimited"})
+        return httpx.Response(200, json={"ok": True, "ts": "1.0"})
+
+    assert asyncio.run(_client(handler).send_digest(_report(progress=1), "#eng")) == (True, "sent")
+    assert calls == ["top", "top", "1.0", "1.0"]
+
+
+def test_thread_stops_at_a_failed_reply_and_needs_a_head_ts() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(json.loads(request.content).get("thread_ts", "top"))
+        if len(calls) == 3:
+            return httpx.Response(200, json={"ok": False, "error": "msg_too_long"})
+        return httpx.Response(200, json={"ok": True, "ts": "1.0"})
+
+    ok, detail = asyncio.run(_client(handler).send_digest(_report(progress=1200), "#eng"))
+    assert not ok and detail.startswith("thread reply 2 of ") and detail.endswith("msg_too_long")
+    assert len(calls) == 3
+
+    calls.clear()
+    missing_ts = _client(lambda request: calls.append("top") or httpx.Response(200, json={"ok": True}))
+    assert asyncio.run(missing_ts.send_digest(_report(progress=1), "#eng"))[0] is False
+    assert calls == ["top"]
+
+
+def test_rate_limiter_allows_a_burst_then_paces_per_channel_and_honours_pauses() -> None:
+    now = [0.0]
+    limiter = SlackRateLimiter(messages_per_second=1, burst=2, clock=lambda: now[0])
+
+    assert [limiter.reserve("t1", "#eng") for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+    assert limiter.reserve("t1", "#ops") == 0.0
+    assert limiter.reserve("t2", "#eng") == 0.0
+
+    limiter.pause("t1", 30)
+    assert limiter.reserve("t1", "#new") == 30.0
+    assert limiter.reserve("t2", "#new") == 0.0
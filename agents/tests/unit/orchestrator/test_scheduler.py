@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta, UTC
+
+from syncly_agents.notification.delivery import DigestDeliveryEngine
+from syncly_agents.orchestrator.pipeline import DigestPipeline, PipelineOptions, run_pipeline
+from syncly_agents.orchestrator.scheduler import DigestScheduler, ScheduleEntry, next_fire_time
+from syncly_agents.persistence.models import (
+    ActivityEvent,
+    DeliveryStatus,
+    NotificationChannel,
+    NotificationPreference,
+    SentimentLabel,
+    StatusLabel,
+)
+from syncly_agents.persistence.repository import create_repository
+from syncly_agents.persistence.sqlite_repository import SQLiteRepository
+from syncly_agents.settings import Settings
+
+
+def test_next_fire_time_tracks_dst_transitions() -> None:
+    # New York springs forward on 2025-03-09 and falls back on 2025-11-02.
+    before_spring = datetime(2025, 3, 8, 10, 0, tzinfo=UTC)
+    first = next_fire_time("09:00", "America/New_York", before_spring)
+    second = next_fire_time("09:00", "America/New_York", first)
+    assert (first.hour, second.hour) == (14, 13)
+
+    gap = next_fire_time("02:30", "America/New_York", datetime(2025, 3, 9, 0, 0, tzinfo=UTC))
+    assert gap == datetime(2025, 3, 9, 7, 30, tzinfo=UTC)
+
+    ambiguous = next_fire_time("01:30", "America/New_York", datetime(2025, 11, 2, 0, 0, tzinfo=UTC))
+    following = next_fire_time("01:30", "America/New_York", ambiguous)
+    assert ambiguous == datetime(2025, 11, 2, 5, 30, tzinfo=UTC)
+    assert following.date().day == 3
+
+
+def test_scheduler_buckets_by_utc_instant_and_runs_bucket_in_parallel() -> None:
+    now = datetime(2025, 6, 2, 6, 0, tzinfo=UTC)
+    barrier = threading.Barrier(3, timeout=2)
+    fired: list[tuple[str, datetime]] = []
+
+    def job(entry: ScheduleEntry, fire_at: datetime) -> None:
+        if fire_at.hour == 7:
+            barrier.wait()
+        if entry.workspace_id == "ws-bad":
+            raise RuntimeError("boom")
+        fired.append((entry.workspace_id, fire_at))
+
+    scheduler = DigestScheduler(job, clock=lambda: now)
+    scheduler.add(ScheduleEntry("ws-london", "08:00", "Europe/London"))
+    scheduler.add(ScheduleEntry("ws-berlin", "09:00", "Europe/Berlin"))
+    scheduler.add(ScheduleEntry("ws-bad", "07:00", "UTC"))
+    scheduler.add(ScheduleEntry("ws-tokyo", "18:00", "Asia/Tokyo"))
+    scheduler.add(ScheduleEntry("ws-tokyo", "18:00", "Asia/Tokyo"))
+
+    assert len(scheduler) == 4
+    assert scheduler.next_fire_at() == datetime(2025, 6, 2, 7, 0, tzinfo=UTC)
+
+    (bucket,) = scheduler.run_due(datetime(2025, 6, 2, 7, 0, 5, tzinfo=UTC))
+
+    assert sorted(bucket.succeeded) == ["ws-berlin", "ws-london"]
+    assert list(bucket.failed) == ["ws-bad"]
+    assert scheduler.next_fire_at() == datetime(2025, 6, 2, 9, 0, tzinfo=UTC)
+    assert len(scheduler) == 4
+
+
+def test_pipeline_runs_scheduled_slot_for_matching_preferences() -> None:
+    now = datetime(2025, 6, 2, 7, 0, tzinfo=UTC)
+    repository = SQLiteRepository()
+    repository.upsert_activity_events(
+        [
+            ActivityEvent(
+                id=f"evt-{i}",
+                workspace_id="ws-1",
+                integration_connection_id="conn-1",
+                external_id=str(i),
+                author="Ada",
+                content=content,
+                task_reference=task,
+                timestamp=now - timedelta(hours=3 - i),
+                status_label=status,
+                classification_confidence=0.9,
+                sentiment=SentimentLabel.POSITIVE,
+                sentiment_confidence=0.8,
+                ingested_at=now,
+            ).model_dump(mode="json")
+            for i, (task, status, content) in enumerate(
+                [
+                    ("ENG-1", StatusLabel.DOING, "started api"),
+                    ("ENG-1", StatusLabel.DONE, "shipped api"),
+                    ("ENG-2", StatusLabel.BLOCKED, "waiting on keys"),
+                ]
+            )
+        ]
+    )
+    for channel, target, slot in (
+        (NotificationChannel.SLACK, "#eng", "09:00"),
+        (NotificationChannel.SLACK, "#late", "17:00"),
+    ):
+        repository.upsert_notification_preference(
+            NotificationPreference(
+                id=target,
+                workspace_id="ws-1",
+                channel=channel,
+                target=target,
+                schedule_time=slot,
+                timezone="Europe/Berlin",
+                created_at=now,
+                updated_at=now,
+            ).model_dump(mode="json")
+        )
+
+    class _Slack:
+        channels: list[str] = []
+
+        def send_digest(self, report, channel=None):
+            self.channels.append(channel)
+            return True, "sent"
+
+    slack = _Slack()
+    delivery = DigestDeliveryEngine(slack=slack)
+    pipeline = DigestPipeline(repository, delivery, clock=lambda: now)
+
+    report = pipeline.run_scheduled(ScheduleEntry("ws-1", "09:00", "Europe/Berlin"), now)
+    delivery.close()
+
+    assert slack.channels == ["#eng"]
+    assert report.delivery_status == DeliveryStatus.SENT
+    assert [item.summary for item in report.progress_items] == ["shipped api"]
+    assert report.blockers[0].reason == "waiting on keys"
+    assert repository.list_digest_reports("ws-1")[0]["delivery_status"] == "sent"
+
+    started: list[int] = []
+
+    class _Scheduler(DigestScheduler):
+        def run_forever(self) -> None:
+            started.append(len(self))
+
+    run_pipeline(
+        PipelineOptions(workspace_id="ws-1", schedule=True),
+        repository=repository,
+        delivery=DigestDeliveryEngine(slack=slack),
+        scheduler_factory=_Scheduler,
+    )
+    assert started == [2]
+
+
+def test_scheduled_runs_reuse_cached_preferences(agent_settings: Settings, tmp_path) -> None:
+    now = datetime(2025, 6, 2, 7, 0, tzinfo=UTC)
+    cfg = agent_settings.model_copy(
+        update={"persistence_backend": "sqlite", "local_database_path": str(tmp_path / "syncly.db")}
+    )
+    repository = create_repository(cfg, cached=True)
+    backend = repository._repository
+    reads: list[str] = []
+    original = backend.list_notification_preferences
+    backend.list_notification_preferences = lambda workspace_id: reads.append(workspace_id) or original(workspace_id)
+
+    def add_preference(target: str) -> None:
+        repository.upsert_notification_preference(
+            NotificationPreference(
+                id=target,
+                workspace_id="ws-1",
+                channel=NotificationChannel.SLACK,
+                target=target,
+                schedule_time="09:00",
+                timezone="Europe/Berlin",
+                created_at=now,
+                updated_at=now,
+            ).model_dump(mode="json")
+        )
+
+    class _Slack:
+        def __init__(self) -> None:
+            self.channels: list[str] = []
+
+        def send_digest(self, report, channel=None):
+            self.channels.append(channel)
+            return True, "sent"
+
+    slack = _Slack()
+    add_preference("#eng")
+    entry = ScheduleEntry("ws-1", "09:00", "Europe/Berlin")
+    with DigestDeliveryEngine(slack=slack, repository=repository) as delivery:
+        pipeline = DigestPipeline(repository, delivery, clock=lambda: now)
+        for day in range(3):
+            pipeline.run_scheduled(entry, now + timedelta(days=day))
+        add_preference("#ops")
+        pipeline.run_scheduled(entry, now + timedelta(days=3))
+
+    assert reads == ["ws-1", "ws-1"]
+    assert slack.channels == ["#eng", "#eng", "#eng", "#eng", "#ops"]
+
+
+def test_build_digest_is_bounded_by_fire_at() -> None:
+    fire_at = datetime(2025, 6, 2, 7, 0, tzinfo=UTC)
+    repository = SQLiteRepository()
+    repository.upsert_activity_events(
+        [
+            ActivityEvent(
+                id=f"evt-{hours}",
+                workspace_id="ws-1",
+                integration_connection_id="conn-1",
+                external_id=str(hours),
+                author="Ada",
+                content=f"update at {hours:+d}h",
+                task_reference=f"ENG-{hours}",
+                timestamp=fire_at + timedelta(hours=hours),
+                status_label=StatusLabel.DOING,
+                classification_confidence=0.9,
+                sentiment=SentimentLabel.POSITIVE,
+                sentiment_confidence=0.8,
+                ingested_at=fire_at,
+            ).model_dump(mode="json")
+            for hours in (-30, -2, 1)
+        ]
+    )
+    pipeline = DigestPipeline(repository, DigestDeliveryEngine(), clock=lambda: fire_at + timedelta(hours=2))
+
+    report = pipeline.build_digest("ws-1", fire_at=fire_at)
+
+    assert [item.summary for item in report.progress_items] == ["update at -2h"]
+
+
+def test_workflow_import_does_not_load_the_digest_pipeline_modules() -> None:
+    probe = (
+        "import sys, syncly_agents.orchestrator.pipeline; "
+        "print(sorted(m for m in sys.modules if m.startswith(('syncly_agents.notification', "
+        "'syncly_agents.orchestrator.scheduler', 'syncly_agents.summarization.incremental_digest'))))"
+    )
+    loaded = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+
+    assert loaded.stdout.strip() == "[]"
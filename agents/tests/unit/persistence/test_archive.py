@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from syncly_agents.persistence.archive import ActivityArchive, ActivityArchiver
+from syncly_agents.persistence.models import ActivityEvent, SentimentLabel, StatusLabel
+from syncly_agents.persistence.sqlite_repository import SQLiteRepository
+
+_START = datetime(2025, 1, 1, 9, 0, tzinfo=UTC)
+
+
+def _event(index: int, workspace_id: str = "ws-1") -> dict:
+    return ActivityEvent(
+        id=f"{workspace_id}-evt-{index:04d}",
+        workspace_id=workspace_id,
+        integration_connection_id=f"conn-{workspace_id}",
+        external_id=str(index),
+        author="Ada",
+        author_id="U123",
+        content=f"update {index} <@U999>",
+        task_reference=f"ENG-{index % 5}",
+        timestamp=_START + timedelta(days=index),
+        status_label=StatusLabel.BLOCKED if index % 4 == 0 else StatusLabel.DOING,
+        classification_confidence=0.8,
+        sentiment=SentimentLabel.NEGATIVE if index % 2 else SentimentLabel.POSITIVE,
+        sentiment_confidence=0.7,
+        keywords=["api", f"k{index}"],
+        source_url=f"https://example.com/{index}",
+        ingested_at=_START + timedelta(seconds=index),
+    ).model_dump(mode="json")
+
+
+def _repository() -> SQLiteRepository:
+    repository = SQLiteRepository()
+    repository.upsert_activity_events([_event(i) for i in range(120)])
+    repository.upsert_activity_events([_event(i, "ws-2") for i in range(30)])
+    return repository
+
+
+def test_archiver_writes_month_partitions_and_prunes_the_source(tmp_path: Path) -> None:
+    repository = _repository()
+    archiver = ActivityArchiver(repository, tmp_path, batch_rows=20)
+    cutoff = datetime(2025, 4, 1, tzinfo=UTC)
+
+    report = archiver.archive("ws-1", before=cutoff)
+    rerun = archiver.archive("ws-1", before=cutoff)
+
+    assert report.rows == report.pruned == 90
+    months = sorted(path.name for path in (tmp_path / "workspace_id=ws-1").iterdir())
+    assert months == ["month=2025-01", "month=2025-02", "month=2025-03"]
+    assert sorted(path.name for path in (tmp_path / "workspace_id=ws-1" / "month=2025-01").iterdir()) == [
+        "part-0000.parquet",
+        "part-0001.parquet",
+    ]
+    assert rerun.rows == 0 and rerun.files == []
+    assert len(repository.fetch_activity_events("ws-1")) == 30
+    assert len(list(tmp_path.rglob("*.parquet"))) == len(report.files)
+
+
+def test_pruned_rows_read_back_from_the_archive_unchanged(tmp_path: Path) -> None:
+    import pyarrow.dataset
+
+    repository = _repository()
+    ActivityArchiver(repository, tmp_path).archive("ws-1", before=datetime(2025, 2, 1, tzinfo=UTC))
+
+    dataset = pyarrow.dataset.dataset(tmp_path / "workspace_id=ws-1", format="parquet")
+    rows = {row["id"]: row for row in dataset.to_table().to_pylist()}
+    original = _event(7)
+    restored = ActivityEvent.model_validate({**rows[original["id"]], "workspace_id": "ws-1"})
+
+    assert len(rows) == 31
+    assert original["id"] not in {row["id"] for row in repository.fetch_activity_events("ws-1")}
+    assert restored.model_dump(mode="json") == original
+
+
+def test_overlapping_runs_merge_partitions_without_double_counting(tmp_path: Path) -> None:
+    repository = _repository()
+    copier = ActivityArchiver(repository, tmp_path, batch_rows=20, prune=False)
+    copier.archive("ws-1", before=datetime(2025, 2, 15, tzinfo=UTC))
+    copier.archive("ws-1", before=datetime(2025, 4, 1, tzinfo=UTC), since=datetime(2025, 1, 20, tzinfo=UTC))
+    repository.upsert_activity_events([_event(40)])  # re-ingested, already archived February event
+    ActivityArchiver(repository, tmp_path).archive("ws-1", before=datetime(2025, 3, 1, tzinfo=UTC))
+
+    archive = ActivityArchive(tmp_path)
+    counts = {row["month"]: row["count"] for row in archive.aggregate("ws-1", group_by=["month"])}
+    assert counts == {"2025-01": 31, "2025-02": 28, "2025-03": 31}
+    assert not list(tmp_path.rglob(".staging-*"))
+
+
+def test_archive_answers_aggregates_per_workspace(tmp_path: Path) -> None:
+    repository = _repository()
+    cutoff = datetime(2025, 6, 1, tzinfo=UTC)
+    ActivityArchiver(repository, tmp_path).archive("ws-1", before=cutoff)
+    ActivityArchiver(repository, tmp_path).archive("ws-2", before=cutoff)
+    archive = ActivityArchive(tmp_path)
+
+    blockers = archive.blocker_frequency_by_month("ws-1", start_month="2025-02")
+    mood = archive.mood_by_quarter("ws-1")
+
+    events = [_event(i) for i in range(120)]
+    expected_feb = sum(
+        1 for e in events if e["status_label"] == "blocked" and e["timestamp"].startswith("2025-02")
+    )
+    assert "2025-01" not in blockers
+    assert blockers["2025-02"] == expected_feb
+    assert set(mood) == {"2025-Q1", "2025-Q2"}
+    assert mood["2025-Q1"]["positive"] + mood["2025-Q1"]["negative"] == 90
+    assert -1.0 <= mood["2025-Q1"]["mean_score"] <= 1.0
+    assert sum(archive.blocker_frequency_by_month("ws-2").values()) == 8
+    assert ActivityArchive(tmp_path / "missing").blocker_frequency_by_month("ws-1") == {}
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from syncly_agents.persistence.async_repository import AsyncSupabaseRepository
+from syncly_agents.persistence.errors import PersistenceError
+
+
+def _repository(handler) -> AsyncSupabaseRepository:
+    client = httpx.AsyncClient(base_url="https://db.example/rest/v1", transport=httpx.MockTransport(handler))
+    return AsyncSupabaseRepository(client)
+
+
+def test_upsert_sends_merge_duplicates_request() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(201, json=json.loads(request.content))
+
+    async def scenario() -> list[dict]:
+        async with _repository(handler) as repository:
+            return await repository.upsert_activity_events([{"external_id": "1"}])
+
+    rows = asyncio.run(scenario())
+
+    assert rows == [{"external_id": "1"}]
+    request = seen[0]
+    assert request.url.path == "/rest/v1/activity_events"
+    assert request.url.params["on_conflict"] == "integration_connection_id,external_id"
+    assert request.headers["Prefer"].startswith("resolution=merge-duplicates")
+
+
+def test_iter_activity_events_follows_keyset_cursor() -> None:
+    rows = [{"id": f"e{i}", "timestamp": f"2025-10-20T09:0{i}:00Z"} for i in range(5)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        cursor = request.url.params.get("or")
+        start = 0 if cursor is None else next(i for i, row in enumerate(rows) if row["id"] in cursor) + 1
+        return httpx.Response(200, json=rows[start : start + 2])
+
+    async def scenario() -> list[str]:
+        repository = _repository(handler)
+        return [row["id"] async for row in repository.iter_activity_events("ws-1", page_size=2)]
+
+    assert asyncio.run(scenario()) == ["e0", "e1", "e2", "e3", "e4"]
+
+
+def test_http_errors_surface_as_persistence_errors() -> None:
+    repository = _repository(lambda request: httpx.Response(500, json={"message": "boom"}))
+
+    with pytest.raises(PersistenceError):
+        asyncio.run(repository.list_notification_preferences("ws-1"))
+
+
+def test_bulk_upsert_cancels_in_flight_chunks_when_one_fails() -> None:
+    cancelled: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        rows = json.loads(request.content)
+        if rows[0]["external_id"] == "0":
+            return httpx.Response(500)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(len(rows))
+            raise
+        return httpx.Response(201)
+
+    events = [{"external_id": str(i)} for i in range(6)]
+
+    async def scenario() -> None:
+        async with _repository(handler) as repository:
+            await repository.upsert_activity_events_bulk(events, max_rows=2, max_concurrency=3)
+
+    with pytest.raises(PersistenceError):
+        asyncio.run(scenario())
+    assert cancelled == [2, 2]
+
+
+def test_invalid_json_responses_surface_as_persistence_errors() -> None:
+    repository = _repository(lambda request: httpx.Response(200, content=b"<html>"))
+
+    with pytest.raises(PersistenceError, match="invalid JSON"):
+        asyncio.run(repository.list_notification_preferences("ws-1"))
+
+
+def test_create_async_repository_follows_the_persistence_backend() -> None:
+    from syncly_agents.persistence.repository import create_async_repository
+    from syncly_agents.settings import Settings
+
+    def config(backend: str) -> Settings:
+        return Settings(
+            OPENROUTER_API_KEY="k",
+            OPENAI_BASE_URL="https://openrouter.ai/api/v1",
+            SUPABASE_URL="https://db.example",
+            SUPABASE_SERVICE_ROLE_KEY="service-role",
+            CONTEXT7_ENDPOINT="https://context7.example.com",
+            CONTEXT7_API_KEY="c7",
+            PERSISTENCE_BACKEND=backend,
+        )
+
+    repository = create_async_repository(config("supabase"))
+    assert isinstance(repository, AsyncSupabaseRepository)
+    assert str(repository.client.base_url) == "https://db.example/rest/v1/"
+    asyncio.run(repository.aclose())
+    with pytest.raises(ValueError):
+        create_async_repository(config("sqlite"))
+
+
+def test_delete_activity_events_chunks_keys_per_connection() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[{"id": "deleted"}] * 2)
+
+    keys = [("conn-1", str(i)) for i in range(250)] + [("conn-2", "a,b")]
+
+    async def scenario() -> int:
+        async with _repository(handler) as repository:
+            return await repository.delete_activity_events(keys)
+
+    assert asyncio.run(scenario()) == 6
+    assert [request.method for request in seen] == ["DELETE"] * 3
+    assert [request.url.params["integration_connection_id"] for request in seen] == ["eq.conn-1"] * 2 + ["eq.conn-2"]
+    assert seen[1].url.params["external_id"] == "in.(" + ",".join(f'"{i}"' for i in range(200, 250)) + ")"
+    assert seen[2].url.params["external_id"] == 'in.("a,b")'
+    assert seen[0].headers["Prefer"] == "return=representation"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Sequence
+
+from syncly_agents.persistence.bulk_writer import BulkActivityWriter, chunk_rows
+from syncly_agents.persistence.errors import PersistenceError
+
+
+class _FlakyRepository:
+    def __init__(self, bad_ids: set[str]) -> None:
+        self.bad_ids = bad_ids
+        self.stored: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def upsert_activity_events(self, events: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        if any(event["external_id"] in self.bad_ids for event in events):
+            raise PersistenceError("statement timeout")
+        with self._lock:
+            for event in events:
+                self.stored[event["external_id"]] = event
+        return list(events)
+
+
+def _rows(count: int) -> list[dict[str, Any]]:
+    return [{"external_id": str(i), "content": "x" * 40} for i in range(count)]
+
+
+def test_chunk_rows_respects_row_and_byte_limits() -> None:
+    chunks = list(chunk_rows(_rows(25), max_rows=10, max_bytes=200))
+
+    assert sum(len(chunk) for chunk in chunks) == 25
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert len(chunks) > 3
+
+
+def test_write_bisects_failing_chunks_to_isolate_bad_rows() -> None:
+    repository = _FlakyRepository(bad_ids={"7", "130"})
+    sleeps: list[float] = []
+    writer = BulkActivityWriter(repository, max_rows=64, max_workers=3, sleep=sleeps.append)
+
+    report = writer.write(_rows(300))
+
+    assert report.rows_written == 298
+    assert sorted(row["external_id"] for row in report.failed_rows) == ["130", "7"]
+    assert len(repository.stored) == 298
+    assert report.retries == 4
+    assert sorted(sleeps) == [0.5, 0.5, 1.0, 1.0]
+    assert report.rows_per_second > 0
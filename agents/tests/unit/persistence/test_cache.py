@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from syncly_agents.persistence.cache import CachedRepository
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Repository:
+    def __init__(self) -> None:
+        self.connection_reads = 0
+        self.preference_reads = 0
+        self.refreshed = threading.Event()
+
+    def list_integration_connections(self, workspace_id: str) -> list[dict[str, Any]]:
+        self.connection_reads += 1
+        return [{"workspace_id": workspace_id, "version": self.connection_reads}]
+
+    def upsert_integration_connection(self, record: dict[str, Any]) -> dict[str, Any]:
+        return record
+
+    def list_notification_preferences(self, workspace_id: str) -> list[dict[str, Any]]:
+        self.preference_reads += 1
+        if self.preference_reads > 1:
+            self.refreshed.set()
+        return [{"workspace_id": workspace_id, "version": self.preference_reads}]
+
+    def list_all_notification_preferences(self) -> list[dict[str, Any]]:
+        self.preference_reads += 1
+        return [{"workspace_id": "ws-1", "version": self.preference_reads}]
+
+    def upsert_notification_preference(self, record: dict[str, Any]) -> dict[str, Any]:
+        return record
+
+    def list_digest_reports(self, workspace_id: str) -> list[dict[str, Any]]:
+        return []
+
+
+def test_reads_are_cached_until_ttl_and_invalidated_on_upsert() -> None:
+    clock = _Clock()
+    repository = _Repository()
+    cached = CachedRepository(repository, ttl_seconds=60, clock=clock)
+
+    cached.list_integration_connections("ws-1")
+    cached.list_integration_connections("ws-1")
+    assert repository.connection_reads == 1
+
+    cached.upsert_integration_connection({"workspace_id": "ws-1"})
+    assert cached.list_integration_connections("ws-1")[0]["version"] == 2
+
+    clock.now = 61
+    assert cached.list_integration_connections("ws-1")[0]["version"] == 3
+    assert cached.list_digest_reports("ws-1") == []
+
+
+def test_preference_upserts_invalidate_workspace_and_all_workspace_reads() -> None:
+    repository = _Repository()
+    cached = CachedRepository(repository, ttl_seconds=60, clock=_Clock())
+
+    cached.list_all_notification_preferences()
+    cached.list_notification_preferences("ws-1")
+    cached.list_all_notification_preferences()
+    assert repository.preference_reads == 2
+
+    cached.upsert_notification_preference({"workspace_id": "ws-1"})
+    cached.list_all_notification_preferences()
+    cached.list_notification_preferences("ws-1")
+    assert repository.preference_reads == 4
+
+
+def test_stale_while_revalidate_serves_stale_value_and_refreshes_in_background() -> None:
+    clock = _Clock()
+    repository = _Repository()
+    cached = CachedRepository(repository, ttl_seconds=60, stale_while_revalidate_seconds=30, clock=clock)
+
+    assert cached.list_notification_preferences("ws-1")[0]["version"] == 1
+    clock.now = 70
+
+    assert cached.list_notification_preferences("ws-1")[0]["version"] == 1
+    assert repository.refreshed.wait(timeout=2)
+    cached.close()
+    assert cached.list_notification_preferences("ws-1")[0]["version"] == 2
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, UTC
+
+import httpx
+
+from syncly_agents.persistence.async_repository import AsyncSupabaseRepository
+from syncly_agents.persistence.digest_history import (
+    DIGEST_HEADLINE_COLUMNS,
+    DIGEST_TREND_COLUMNS,
+    digest_trends_sql,
+)
+from syncly_agents.persistence.models import (
+    DigestBlockerItem,
+    DigestProgressItem,
+    DigestReport,
+    SentimentLabel,
+    StatusLabel,
+)
+from syncly_agents.persistence.sqlite_repository import SQLiteRepository
+
+_DAY = datetime(2025, 10, 1, tzinfo=UTC)
+
+
+def _report(offset: int) -> dict:
+    return DigestReport(
+        id=f"digest-{offset}",
+        workspace_id="ws-1",
+        report_date=_DAY + timedelta(days=offset),
+        generated_at=_DAY + timedelta(days=offset, hours=9),
+        time_zone="UTC",
+        progress_items=[
+            DigestProgressItem(owner="Ada", status=StatusLabel.DONE, summary="x" * 500)
+            for _ in range(offset + 1)
+        ],
+        blockers=[DigestBlockerItem(owner="Lin", reason="waiting") for _ in range(offset)],
+        next_actions=[],
+        team_mood=SentimentLabel.NEGATIVE if offset % 2 else SentimentLabel.POSITIVE,
+    ).model_dump(mode="json")
+
+
+def test_sqlite_history_returns_headlines_and_trend_counts() -> None:
+    repository = SQLiteRepository()
+    for offset in range(5):
+        repository.store_digest_report(_report(offset))
+
+    history = repository.list_digest_history("ws-1", since_iso=(_DAY + timedelta(days=2)).isoformat())
+    trends = repository.digest_trends("ws-1", limit=2)
+
+    assert [row["id"] for row in history] == ["digest-4", "digest-3", "digest-2"]
+    assert set(history[0]) == set(DIGEST_HEADLINE_COLUMNS)
+    assert set(trends[0]) == set(DIGEST_TREND_COLUMNS)
+    assert [(row["blocker_count"], row["progress_count"]) for row in trends] == [(4, 5), (3, 4)]
+    assert trends[1]["team_mood"] == "negative"
+
+
+def test_async_history_projects_columns_and_calls_trends_function() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=[])
+
+    async def scenario() -> None:
+        client = httpx.AsyncClient(base_url="https://db.example/rest/v1", transport=httpx.MockTransport(handler))
+        async with AsyncSupabaseRepository(client) as repository:
+            await repository.list_digest_history("ws-1", since_iso="2025-10-01")
+            await repository.digest_trends("ws-1", limit=30)
+
+    asyncio.run(scenario())
+
+    history, trends = seen
+    assert history.url.params["select"] == ",".join(DIGEST_HEADLINE_COLUMNS)
+    assert history.url.params["report_date"] == "gte.2025-10-01"
+    assert trends.method == "POST"
+    assert trends.url.path == "/rest/v1/rpc/digest_trends"
+    assert json.loads(trends.content) == {"p_workspace_id": "ws-1", "p_since": None, "p_limit": 30}
+    assert "function public.digest_trends" in digest_trends_sql()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from itertools import count
+
+import pytest
+
+from syncly_agents.persistence.bulk_writer import BulkActivityWriter
+from syncly_agents.persistence.errors import PersistenceError
+from syncly_agents.persistence.instrumentation import InstrumentedRepository, PersistenceMetrics
+from syncly_agents.persistence.repository import create_repository
+from syncly_agents.settings import Settings
+
+
+class _Backend:
+    def __init__(self) -> None:
+        self.failures = 0
+
+    def upsert_activity_events(self, events):
+        if self.failures:
+            self.failures -= 1
+            raise PersistenceError("boom")
+        return list(events)
+
+    def iter_activity_events(self, workspace_id, **kwargs):
+        yield from ({"id": f"e{i}", "timestamp": "2025-10-20T09:00:00Z"} for i in range(3))
+
+    def list_notification_preferences(self, workspace_id):
+        raise PersistenceError("unavailable")
+
+
+def _instrumented(metrics: PersistenceMetrics, logger: logging.Logger, **kwargs) -> InstrumentedRepository:
+    ticks = count()
+    return InstrumentedRepository(
+        _Backend(),
+        metrics=metrics,
+        backend="fake",
+        logger=logger,
+        slow_call_ms=1500,
+        clock=lambda: next(ticks),
+        **kwargs,
+    )
+
+
+def test_records_latency_rows_bytes_and_errors(caplog: pytest.LogCaptureFixture) -> None:
+    metrics = PersistenceMetrics()
+    logger = logging.getLogger("test.instrumentation")
+    repository = _instrumented(metrics, logger, measure_bytes=True)
+
+    with caplog.at_level(logging.DEBUG, logger="test.instrumentation"):
+        repository.upsert_activity_events([{"id": "a"}, {"id": "b"}])
+        assert [row["id"] for row in repository.iter_activity_events("ws-1")] == ["e0", "e1", "e2"]
+        with pytest.raises(PersistenceError):
+            repository.list_notification_preferences("ws-1")
+
+    snapshot = metrics.snapshot()
+    upsert = snapshot["fake.upsert_activity_events"]
+    assert (upsert["rows_in"], upsert["rows_out"]) == (2, 2)
+    assert upsert["bytes_in"] == len(b'[{"id":"a"},{"id":"b"}]')
+    assert snapshot["fake.iter_activity_events"]["rows_out"] == 3
+    assert snapshot["fake.list_notification_preferences"]["errors"] == 1
+
+    events = [json.loads(record.message) for record in caplog.records]
+    assert {event["method"] for event in events} == {
+        "upsert_activity_events",
+        "iter_activity_events",
+        "list_notification_preferences",
+    }
+    failed = next(r for r in caplog.records if "failed" in r.message)
+    assert failed.levelno == logging.WARNING
+
+
+def test_retries_flow_into_openmetrics_output() -> None:
+    metrics = PersistenceMetrics()
+    repository = _instrumented(metrics, logging.getLogger("test.instrumentation"))
+    repository._repository.failures = 1
+
+    report = BulkActivityWriter(repository, max_rows=10, sleep=lambda _: None).write([{"id": "a"}])
+
+    assert report.retries == 1
+    text = metrics.render_openmetrics()
+    assert 'syncly_persistence_retries_total{backend="fake",method="upsert_activity_events"} 1' in text
+    assert 'syncly_persistence_call_duration_seconds_bucket{backend="fake",method="upsert_activity_events",le="+Inf"} 2' in text
+    assert 'syncly_persistence_errors_total{backend="fake",method="upsert_activity_events"} 1' in text
+    assert text.endswith("# EOF\n")
+
+
+def test_bytes_are_opt_in_and_abandoned_iterators_are_still_recorded() -> None:
+    metrics = PersistenceMetrics()
+    repository = _instrumented(metrics, logging.getLogger("test.instrumentation"))
+
+    repository.upsert_activity_events([{"id": "a"}])
+    rows = repository.iter_activity_events("ws-1")
+    next(rows)
+    rows.close()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["fake.upsert_activity_events"]["bytes_in"] == 0
+    streamed = snapshot["fake.iter_activity_events"]
+    assert (streamed["calls"], streamed["rows_out"]) == (1, 1)
+
+
+def test_async_calls_are_timed_through_the_await() -> None:
+    class _AsyncBackend:
+        async def upsert_activity_events(self, events):
+            await asyncio.sleep(0)
+            return list(events)
+
+        async def list_notification_preferences(self, workspace_id):
+            raise PersistenceError("unavailable")
+
+        async def iter_activity_events(self, workspace_id, **kwargs):
+            for index in range(3):
+                yield {"id": f"e{index}"}
+
+    metrics = PersistenceMetrics()
+    now = [0.0]
+    repository = InstrumentedRepository(_AsyncBackend(), metrics=metrics, backend="fake", clock=lambda: now[0])
+
+    async def scenario() -> list[str]:
+        pending = repository.upsert_activity_events([{"id": "a"}, {"id": "b"}])
+        now[0] = 2.0
+        await pending
+        with pytest.raises(PersistenceError):
+            await repository.list_notification_preferences("ws-1")
+        return [row["id"] async for row in repository.iter_activity_events("ws-1")]
+
+    assert asyncio.run(scenario()) == ["e0", "e1", "e2"]
+    snapshot = metrics.snapshot()
+    assert snapshot["fake.upsert_activity_events"]["seconds"] == 2.0
+    assert snapshot["fake.upsert_activity_events"]["rows_out"] == 2
+    assert snapshot["fake.list_notification_preferences"]["errors"] == 1
+    assert snapshot["fake.iter_activity_events"]["rows_out"] == 3
+
+
+def test_persistence_metrics_setting_instruments_created_repositories(agent_settings: Settings, tmp_path) -> None:
+    cfg = agent_settings.model_copy(
+        update={"persistence_backend": "sqlite", "local_database_path": str(tmp_path / "syncly.db")}
+    )
+    assert not isinstance(create_repository(cfg), InstrumentedRepository)
+
+    enabled = cfg.model_copy(update={"persistence_metrics": True})
+    assert isinstance(create_repository(enabled), InstrumentedRepository)
+    assert not isinstance(create_repository(enabled, instrumented=False), InstrumentedRepository)
+    assert Settings.model_validate({**agent_settings.model_dump(by_alias=True), "PERSISTENCE_METRICS": "true"}).persistence_metrics
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+from typing import Any
+
+from syncly_agents.persistence.pagination import KeysetCursor, select_columns
+from syncly_agents.persistence.supabase_repository import SupabaseRepository
+
+_CURSOR = re.compile(r'timestamp\.gt\."([^"]+)",and\(timestamp\.eq\."[^"]+",id\.gt\."([^"]+)"\)')
+
+
+class _FakeQuery:
+    def __init__(self, rows: list[dict[str, Any]], log: list[dict[str, Any]]) -> None:
+        self._rows = rows
+        self._log = log
+        self._call: dict[str, Any] = {}
+
+    def select(self, projection: str) -> "_FakeQuery":
+        self._call["select"] = projection
+        return self
+
+    def eq(self, column: str, value: Any) -> "_FakeQuery":
+        self._rows = [row for row in self._rows if row[column] == value]
+        return self
+
+    def or_(self, expression: str) -> "_FakeQuery":
+        timestamp, row_id = _CURSOR.fullmatch(expression).groups()  # type: ignore[union-attr]
+        self._call["cursor"] = (timestamp, row_id)
+        self._rows = [row for row in self._rows if (row["timestamp"], row["id"]) > (timestamp, row_id)]
+        return self
+
+    def order(self, column: str, desc: bool = False) -> "_FakeQuery":
+        self._call.setdefault("order", []).append(column)
+        return self
+
+    def limit(self, size: int) -> "_FakeQuery":
+        self._rows = sorted(self._rows, key=lambda row: (row["timestamp"], row["id"]))[:size]
+        return self
+
+    def execute(self) -> SimpleNamespace:
+        self._log.append(self._call)
+        return SimpleNamespace(data=self._rows)
+
+
+class _FakeClient:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.calls: list[dict[str, Any]] = []
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(list(self.rows), self.calls)
+
+
+def test_iter_activity_events_pages_by_timestamp_and_id() -> None:
+    rows = [
+        {"id": f"evt-{i:03d}", "workspace_id": "ws-1", "timestamp": f"2025-10-{1 + i // 4:02d}T09:00:00+00:00"}
+        for i in range(23)
+    ]
+    rows.append({"id": "evt-x", "workspace_id": "ws-2", "timestamp": "2025-10-01T09:00:00+00:00"})
+    client = _FakeClient(rows)
+    repository = SupabaseRepository(client)  # type: ignore[arg-type]
+
+    streamed = list(repository.iter_activity_events("ws-1", columns=["content"], page_size=5))
+
+    assert [row["id"] for row in streamed] == [f"evt-{i:03d}" for i in range(23)]
+    assert len(client.calls) == 5
+    assert client.calls[0]["select"] == "content,timestamp,id"
+    assert client.calls[0]["order"] == ["timestamp", "id"]
+    assert client.calls[1]["cursor"] == ("2025-10-02T09:00:00+00:00", "evt-004")
+
+
+def test_select_columns_defaults_to_star_and_deduplicates() -> None:
+    assert select_columns(None) == "*"
+    assert select_columns(["id", "content", "id"]) == "id,content,timestamp"
+    assert KeysetCursor("t", 'a"b').postgrest_filter().endswith('id.gt."a\\"b")')
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+
+from syncly_agents.persistence.models import ActivityEvent, SentimentLabel, StatusLabel
+from syncly_agents.persistence.repository import Repository
+from syncly_agents.persistence.sqlite_repository import SQLiteRepository
+
+_START = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+def _event(index: int, external_id: str | None = None, content: str = "update") -> dict:
+    return ActivityEvent(
+        id=f"evt-{index:04d}",
+        workspace_id="ws-1",
+        integration_connection_id="conn-1",
+        external_id=external_id or str(index),
+        author="Ada",
+        content=content,
+        task_reference="ENG-1",
+        timestamp=_START + timedelta(minutes=index // 3),
+        status_label=StatusLabel.DOING,
+        classification_confidence=0.6,
+        sentiment=SentimentLabel.NEUTRAL,
+        sentiment_confidence=0.5,
+        ingested_at=_START,
+    ).model_dump(mode="json")
+
+
+def test_sqlite_repository_upserts_and_streams_events_in_keyset_order(tmp_path: Path) -> None:
+    repository: Repository = SQLiteRepository(tmp_path / "syncly.db")
+    repository.upsert_activity_events([_event(i) for i in range(250)])
+    repository.upsert_activity_events([_event(7, content="edited")])
+
+    streamed = list(repository.iter_activity_events("ws-1", columns=["content"], page_size=40))
+
+    assert len(streamed) == 250
+    assert [row["id"] for row in streamed] == sorted(row["id"] for row in streamed)
+    assert set(streamed[0]) == {"content", "timestamp", "id"}
+    assert streamed[7]["content"] == "edited"
+    since = (_START + timedelta(minutes=80)).isoformat()
+    assert len(repository.fetch_activity_events("ws-1", since_iso=since)) == 10
+
+
+def test_sqlite_repository_round_trips_reports_and_preferences() -> None:
+    repository = SQLiteRepository()
+    repository.upsert_notification_preference(
+        {"id": "pref-1", "workspace_id": "ws-1", "channel": "slack", "target": "#eng"}
+    )
+    for day in range(3):
+        repository.store_digest_report(
+            {"workspace_id": "ws-1", "report_date": (_START + timedelta(days=day)).isoformat(), "n": day}
+        )
+
+    assert [report["n"] for report in repository.list_digest_reports("ws-1", limit=2)] == [2, 1]
+    assert repository.list_notification_preferences("ws-1")[0]["target"] == "#eng"
+    plan = repository.query(
+        "EXPLAIN QUERY PLAN SELECT id FROM activity_events WHERE workspace_id = ? ORDER BY timestamp",
+        ("ws-1",),
+    )
+    assert any("activity_events_workspace_timestamp" in row["detail"] for row in plan)
+
+
+def test_digest_reports_are_keyed_by_calendar_day() -> None:
+    repository = SQLiteRepository()
+    morning = {"workspace_id": "ws-1", "report_date": "2025-10-20T09:00:00+02:00", "n": 1}
+    rerun = {"workspace_id": "ws-1", "report_date": "2025-10-20T17:30:00+02:00", "n": 2}
+    repository.store_digest_report(morning)
+    repository.store_digest_report(rerun)
+
+    assert [report["n"] for report in repository.list_digest_reports("ws-1")] == [2]
+    assert repository.list_digest_history("ws-1", since_iso="2025-10-20")[0]["report_date"] == "2025-10-20"
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+from typing import Any, Sequence
+
+from syncly_agents.persistence.models import ActivityEvent, SentimentLabel, StatusLabel
+from syncly_agents.persistence.task_status import TaskStatusAggregator
+
+_START = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+class _Store:
+    def __init__(self, rows: list[dict[str, Any]] | None = None) -> None:
+        self.rows = rows or []
+        self.upserts: list[list[dict[str, Any]]] = []
+
+    def list_task_status_summaries(self, workspace_id: str) -> list[dict[str, Any]]:
+        return [row for row in self.rows if row["workspace_id"] == workspace_id]
+
+    def upsert_task_status_summaries(self, summaries: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.upserts.append(list(summaries))
+        return list(summaries)
+
+
+def _event(event_id: str, task: str, status: StatusLabel, minutes: int, author: str = "Ada") -> ActivityEvent:
+    return ActivityEvent(
+        id=event_id,
+        workspace_id="ws-1",
+        integration_connection_id="conn-1",
+        external_id=event_id,
+        author=author,
+        content=f"{task} update {event_id}",
+        task_reference=task,
+        timestamp=_START + timedelta(minutes=minutes),
+        status_label=status,
+        classification_confidence=0.7,
+        sentiment=SentimentLabel.NEUTRAL,
+        sentiment_confidence=0.5,
+        ingested_at=_START,
+    )
+
+
+def test_apply_tracks_latest_status_and_flushes_only_changed_tasks() -> None:
+    store = _Store()
+    aggregator = TaskStatusAggregator(store)
+
+    aggregator.apply(
+        [
+            _event("e1", "ENG-1", StatusLabel.DOING, 0),
+            _event("e2", "ENG-1", StatusLabel.BLOCKED, 10, author="Grace"),
+            _event("e3", "ENG-2", StatusLabel.DONE, 5),
+        ]
+    )
+    assert aggregator.flush() == 2
+
+    changed = aggregator.apply([_event("e0", "ENG-1", StatusLabel.DONE, -5), _event("e4", "ENG-2", StatusLabel.DOING, 20)])
+    assert [summary.task_reference for summary in changed] == ["ENG-2"]
+    assert aggregator.flush() == 1
+
+    by_task = {summary.task_reference: summary for summary in aggregator.summaries("ws-1")}
+    assert by_task["ENG-1"].latest_status == StatusLabel.BLOCKED
+    assert by_task["ENG-1"].owner == "Grace"
+    assert by_task["ENG-1"].blocker_reason == "ENG-1 update e2"
+    assert by_task["ENG-2"].latest_event_id == "e4"
+    assert [len(batch) for batch in store.upserts] == [2, 1]
+
+
+def test_apply_ignores_events_older_than_stored_summary() -> None:
+    stored = {
+        "id": "s1",
+        "workspace_id": "ws-1",
+        "task_reference": "ENG-1",
+        "latest_status": "done",
+        "owner": "Ada",
+        "latest_event_id": "e9",
+        "updated_at": (_START + timedelta(hours=1)).isoformat(),
+    }
+    aggregator = TaskStatusAggregator(_Store([stored]))
+
+    assert aggregator.apply([_event("e1", "ENG-1", StatusLabel.BLOCKED, 0)]) == []
+    assert aggregator.flush() == 0
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Sequence
+
+from syncly_agents.persistence.errors import PersistenceError
+from syncly_agents.persistence.write_buffer import WriteBehindBuffer
+
+
+class _RecordingRepository:
+    def __init__(self) -> None:
+        self.event_batches: list[list[dict[str, Any]]] = []
+        self.summary_batches: list[list[dict[str, Any]]] = []
+        self.fail_next = False
+        self.flushed = threading.Event()
+
+    def upsert_activity_events(self, events: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        if self.fail_next:
+            self.fail_next = False
+            raise PersistenceError("timeout")
+        self.event_batches.append(list(events))
+        self.flushed.set()
+        return list(events)
+
+    def upsert_task_status_summaries(self, summaries: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.summary_batches.append(list(summaries))
+        return list(summaries)
+
+
+def _event(external_id: str, content: str) -> dict[str, Any]:
+    return {"integration_connection_id": "conn-1", "external_id": external_id, "content": content}
+
+
+def test_buffer_coalesces_duplicate_keys_and_flushes_on_close() -> None:
+    repository = _RecordingRepository()
+    buffer = WriteBehindBuffer(repository, flush_interval_seconds=60)
+
+    buffer.add_activity_event(_event("1", "draft"))
+    buffer.add_activity_event(_event("1", "final"))
+    buffer.add_activity_event(_event("2", "other"))
+    buffer.add_task_summary({"workspace_id": "ws-1", "task_reference": "ENG-1", "latest_status": "done"})
+    buffer.close()
+
+    assert repository.event_batches == [[_event("1", "final"), _event("2", "other")]]
+    assert len(repository.summary_batches) == 1
+    assert buffer.metrics.rows_coalesced == 1
+    assert buffer.metrics.last_flush_size == 3
+
+
+def test_buffer_flushes_in_background_when_batch_size_reached() -> None:
+    repository = _RecordingRepository()
+    with WriteBehindBuffer(repository, max_batch=3, flush_interval_seconds=60) as buffer:
+        for index in range(3):
+            buffer.add_activity_event(_event(str(index), "x"))
+        assert repository.flushed.wait(timeout=2)
+
+    assert len(repository.event_batches[0]) == 3
+    assert buffer.metrics.flushes == 1
+
+
+def test_failed_flush_keeps_rows_without_overwriting_newer_writes() -> None:
+    repository = _RecordingRepository()
+    buffer = WriteBehindBuffer(repository, start=False)
+    buffer.add_activity_event(_event("1", "old"))
+    repository.fail_next = True
+
+    assert buffer.flush() == 0
+    buffer.add_activity_event(_event("1", "new"))
+    assert buffer.flush() == 1
+
+    assert repository.event_batches == [[_event("1", "new")]]
+    assert buffer.metrics.failed_flushes == 1
+
+
+def test_unexpected_flush_errors_requeue_rows_and_release_capacity() -> None:
+    class _Broken(_RecordingRepository):
+        broken = True
+
+        def upsert_activity_events(self, events):
+            if self.broken:
+                self.broken = False
+                raise TypeError("bad row")
+            return super().upsert_activity_events(events)
+
+    repository = _Broken()
+    buffer = WriteBehindBuffer(repository, max_batch=2, max_pending=2, start=False)
+    buffer.add_activity_event(_event("1", "x"))
+    buffer.add_activity_event(_event("2", "y"))
+
+    assert buffer.flush() == 0
+    assert buffer.pending == 2 and buffer._in_flight == 0
+    assert buffer.flush() == 2
+    assert repository.event_batches == [[_event("1", "x"), _event("2", "y")]]
+
+
+def test_failed_flushes_back_off_exponentially_instead_of_retrying_at_once() -> None:
+    class _Down(_RecordingRepository):
+        def __init__(self) -> None:
+            super().__init__()
+            self.attempts = 0
+
+        def upsert_activity_events(self, events):
+            self.attempts += 1
+            raise PersistenceError("database unavailable")
+
+    repository = _Down()
+    buffer = WriteBehindBuffer(repository, max_batch=2, flush_interval_seconds=0.05)
+    for index in range(4):
+        buffer.add_activity_event(_event(str(index), "x"))
+    threading.Event().wait(0.3)
+    attempts = repository.attempts
+    buffer.close()
+
+    # 0.05s, then 0.1s, then 0.2s: only a handful of attempts despite a full batch.
+    assert 1 <= attempts <= 4
+    assert buffer.backoff_seconds(1) == 0.05
+    assert buffer.backoff_seconds(3) == 0.2
+    assert buffer.metrics.consecutive_failures >= attempts
+
+
+def test_full_buffer_drops_new_rows_but_still_coalesces_existing_ones() -> None:
+    repository = _RecordingRepository()
+    buffer = WriteBehindBuffer(
+        repository, max_batch=2, max_pending=2, overflow_timeout_seconds=0.01, start=False
+    )
+    buffer.add_activity_event(_event("1", "a"))
+    buffer.add_activity_event(_event("2", "b"))
+    buffer.add_activity_event(_event("3", "dropped"))
+    buffer.add_activity_event(_event("1", "a2"))
+
+    assert buffer.pending == 2
+    assert buffer.metrics.rows_dropped == 1
+    assert buffer.flush() == 2
+    buffer.add_activity_event(_event("3", "fits"))
+    assert buffer.pending == 1
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from syncly_agents.classification.status_classifier import LLMClassifier
+from syncly_agents.settings import Settings
+from syncly_agents.shared.client_registry import ClientRegistry, get_client_registry
+
+
+def _settings() -> Settings:
+    return Settings(
+        OPENROUTER_API_KEY="test-key",
+        OPENAI_BASE_URL="https://openrouter.ai/api/v1",
+        SUPABASE_URL="https://example.supabase.co",
+        SUPABASE_SERVICE_ROLE_KEY="service-role",
+        CONTEXT7_ENDPOINT="https://context7.example.com",
+        CONTEXT7_API_KEY="context7-key",
+    )
+
+
+def test_get_or_create_builds_once_and_reuses_instance() -> None:
+    registry = ClientRegistry()
+    calls: list[int] = []
+
+    def factory() -> object:
+        calls.append(1)
+        return object()
+
+    first = registry.get_or_create("key", factory)
+    second = registry.get_or_create("key", factory)
+
+    assert first is second
+    assert len(calls) == 1
+
+
+def test_http_clients_are_keyed_by_pool_and_timeout() -> None:
+    registry = ClientRegistry()
+
+    slack = registry.http_client("slack", timeout=15)
+    assert registry.http_client("slack", timeout=15.0) is slack
+    other = registry.http_client("slack", timeout=5)
+
+    assert other is not slack
+    assert (slack.timeout.read, other.timeout.read) == (15, 5)
+    registry.close()
+
+
+def test_openai_clients_share_llm_connection_pool() -> None:
+    registry = ClientRegistry()
+
+    plain = registry.openai_client(base_url="https://openrouter.ai/api/v1", api_key="a")
+    titled = registry.openai_client(
+        base_url="https://openrouter.ai/api/v1", api_key="a", default_headers={"X-Title": "Syncly"}
+    )
+
+    assert plain is not titled
+    assert plain._client is titled._client
+    registry.close()
+
+
+def test_llm_classifier_defers_client_construction() -> None:
+    registry = get_client_registry()
+    registry.close()
+
+    classifier = LLMClassifier(_settings())
+
+    assert classifier._client is None
+    assert classifier.client is classifier.client
+    registry.close()
+
+
+def test_registry_keys_and_debug_logs_never_carry_the_api_key(caplog) -> None:
+    registry = ClientRegistry()
+
+    with caplog.at_level("DEBUG", logger="syncly_agents.shared.client_registry"):
+        registry.openai_client(base_url="https://openrouter.ai/api/v1", api_key="sk-secret")
+
+    assert "sk-secret" not in repr(list(registry._clients))
+    assert "sk-secret" not in caplog.text
+    assert "Created shared client openai" in caplog.text
+    registry.close()
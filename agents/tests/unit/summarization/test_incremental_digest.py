@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+
+from syncly_agents.persistence.models import ActivityEvent, SentimentLabel, StatusLabel
+from syncly_agents.summarization.daily_digest import build_daily_digest
+from syncly_agents.summarization.incremental_digest import DigestAccumulator, IncrementalDigestBuilder
+
+_START = datetime(2025, 10, 20, 0, 0, tzinfo=UTC)
+
+
+def _event(
+    index: int,
+    task: str | None,
+    status: StatusLabel,
+    sentiment: SentimentLabel = SentimentLabel.POSITIVE,
+    *,
+    content: str | None = None,
+    timestamp: datetime | None = None,
+) -> ActivityEvent:
+    return ActivityEvent(
+        id=f"evt-{index}",
+        workspace_id="ws-1",
+        integration_connection_id="conn-1",
+        external_id=str(index),
+        author="Ada" if index % 2 else "Lin",
+        content=content or f"update {index} on {task}",
+        task_reference=task,
+        timestamp=timestamp or _START + timedelta(hours=index),
+        status_label=status,
+        classification_confidence=0.9,
+        sentiment=sentiment,
+        sentiment_confidence=0.8,
+        ingested_at=_START,
+    )
+
+
+_EVENTS = [
+    _event(1, "ENG-1", StatusLabel.DOING),
+    _event(2, "ENG-2", StatusLabel.BLOCKED, SentimentLabel.NEGATIVE),
+    _event(3, "ENG-1", StatusLabel.DONE),
+    _event(4, None, StatusLabel.DOING, SentimentLabel.NEUTRAL),
+    _event(5, "ENG-3", StatusLabel.DOING, SentimentLabel.NEGATIVE),
+]
+
+
+def test_accumulator_matches_one_shot_build_regardless_of_arrival_order() -> None:
+    kwargs = {"report_date": _START, "generated_at": _START}
+    expected = build_daily_digest("ws-1", _EVENTS, **kwargs)
+
+    accumulator = DigestAccumulator("ws-1")
+    accumulator.apply_many(reversed(_EVENTS))
+    accumulator.apply(_EVENTS[0])
+
+    assert accumulator.build(**kwargs) == expected
+    assert [item.summary for item in expected.progress_items] == [
+        "update 3 on ENG-1",
+        "update 4 on None",
+        "update 5 on ENG-3",
+    ]
+    assert expected.blockers[0].reason == "update 2 on ENG-2"
+    assert expected.team_mood == SentimentLabel.NEUTRAL
+    assert expected.mood_rationale == (
+        "Mood -0.14 (falling, -0.13 vs. baseline) across 5 updates; lowest: Lin (-0.39)"
+    )
+
+
+def test_edits_replace_earlier_versions_and_window_slides() -> None:
+    accumulator = DigestAccumulator("ws-1")
+    accumulator.apply_many(_EVENTS)
+    accumulator.apply(_event(2, "ENG-2", StatusLabel.DONE, SentimentLabel.POSITIVE, content="keys arrived"))
+
+    report = accumulator.build(report_date=_START)
+    assert report.blockers == [] and report.next_actions == []
+    assert "keys arrived" in [item.summary for item in report.progress_items]
+    assert report.team_mood == SentimentLabel.POSITIVE
+    assert accumulator.mood.author("Lin").label == SentimentLabel.POSITIVE
+
+    assert accumulator.evict_before(_START + timedelta(hours=3)) == 2
+    report = accumulator.build(report_date=_START)
+    assert [item.summary for item in report.progress_items] == [
+        "update 3 on ENG-1",
+        "update 4 on None",
+        "update 5 on ENG-3",
+    ]
+    assert len(accumulator) == 3
+
+
+def test_moving_a_tasks_latest_event_falls_back_to_its_previous_one() -> None:
+    moved = _event(3, "ENG-9", StatusLabel.DONE)
+    accumulator = DigestAccumulator("ws-1")
+    accumulator.apply_many(_EVENTS)
+    accumulator.apply(moved)
+
+    report = accumulator.build(report_date=_START, generated_at=_START)
+    events = [moved if event.id == moved.id else event for event in _EVENTS]
+    assert report == build_daily_digest("ws-1", events, report_date=_START, generated_at=_START)
+    assert "update 1 on ENG-1" in [item.summary for item in report.progress_items]
+
+    accumulator.apply(_event(3, "ENG-1", StatusLabel.DONE, timestamp=_START))
+    assert "update 1 on ENG-1" in [item.summary for item in accumulator.build(report_date=_START).progress_items]
+
+
+def test_builder_refreshes_from_observed_deltas() -> None:
+    builder = IncrementalDigestBuilder()
+    builder.seed("ws-1", _EVENTS[:2])
+    assert "ws-1" in builder and "ws-2" not in builder
+
+    builder.observe(_EVENTS[2:])
+    report = builder.digest("ws-1", report_date=_START, since=_START + timedelta(hours=2))
+
+    assert report == build_daily_digest("ws-1", _EVENTS[1:], report_date=_START, generated_at=report.generated_at)
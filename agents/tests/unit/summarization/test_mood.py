@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+
+import pytest
+
+from syncly_agents.persistence.models import SentimentLabel
+from syncly_agents.summarization.mood import MoodAggregator
+
+_START = datetime(2025, 10, 20, 9, 0, tzinfo=UTC)
+
+
+def test_recent_confident_updates_outweigh_old_or_unsure_ones() -> None:
+    mood = MoodAggregator(half_life=timedelta(hours=1), baseline_half_life=timedelta(hours=24))
+    mood.add("Ada", SentimentLabel.POSITIVE, 0.9, _START)
+    mood.add("Ada", SentimentLabel.POSITIVE, 0.9, _START + timedelta(minutes=10))
+    mood.add("Lin", SentimentLabel.NEGATIVE, 0.9, _START + timedelta(hours=3))
+    mood.add("Lin", SentimentLabel.POSITIVE, 0.1, _START + timedelta(hours=3))
+
+    team = mood.team()
+    assert team.label == SentimentLabel.NEGATIVE
+    assert team.trend < 0
+    assert mood.author("Ada").label == SentimentLabel.POSITIVE
+    assert mood.rationale().startswith("Mood -0.")
+    assert "falling" in mood.rationale() and mood.rationale().endswith("lowest: Lin (-0.80)")
+
+    # Arrival order does not matter: late events are decayed relative to the newest.
+    reordered = MoodAggregator(half_life=timedelta(hours=1), baseline_half_life=timedelta(hours=24))
+    reordered.add("Lin", SentimentLabel.POSITIVE, 0.1, _START + timedelta(hours=3))
+    reordered.add("Ada", SentimentLabel.POSITIVE, 0.9, _START + timedelta(minutes=10))
+    reordered.add("Lin", SentimentLabel.NEGATIVE, 0.9, _START + timedelta(hours=3))
+    reordered.add("Ada", SentimentLabel.POSITIVE, 0.9, _START)
+    assert reordered.team().score == pytest.approx(team.score)
+
+
+def test_remove_retracts_an_update_exactly() -> None:
+    mood = MoodAggregator()
+    mood.add("Ada", SentimentLabel.POSITIVE, 0.8, _START)
+    before = mood.team()
+    mood.add("Lin", SentimentLabel.NEGATIVE, 0.7, _START + timedelta(hours=2))
+    mood.remove("Lin", SentimentLabel.NEGATIVE, 0.7, _START + timedelta(hours=2))
+
+    assert mood.team().score == pytest.approx(before.score)
+    assert mood.team().updates == 1
+    assert mood.author("Lin") is None
+
+    mood.remove("Ada", SentimentLabel.POSITIVE, 0.8, _START)
+    assert mood.team().label == SentimentLabel.NEUTRAL
+    assert mood.rationale() is None